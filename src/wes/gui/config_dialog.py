@@ -23,6 +23,7 @@ from ..core.config_manager import ConfigManager
 from ..integrations.redhat_jira_client import is_redhat_jira
 from ..utils.exceptions import ConfigurationError
 from ..utils.logging_config import get_logger
+from ..utils.validators import is_valid_email
 
 
 class ConfigDialog(QDialog):
@@ -515,10 +516,7 @@ class ConfigDialog(QDialog):
 
                     parsed = urlparse(jira_url.lower())
                     if "atlassian.net" in parsed.netloc:
-                        email_pattern = (
-                            r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-                        )
-                        if not re.match(email_pattern, jira_username):
+                        if not is_valid_email(jira_username):
                             QMessageBox.warning(
                                 self,
                                 "Validation Error",
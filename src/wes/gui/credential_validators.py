@@ -15,7 +15,7 @@ from ..utils.exceptions import (
     AuthenticationError,
 )
 from ..utils.logging_config import get_logger, get_security_logger
-from ..utils.validators import ValidationResult
+from ..utils.validators import ValidationResult, is_valid_api_token, is_valid_email
 
 
 class CredentialValidator:
@@ -207,8 +207,7 @@ class CredentialValidator:
 
     def _validate_email(self, email: str) -> bool:
         """Validate email format."""
-        pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        return re.match(pattern, email) is not None
+        return is_valid_email(email)
 
     def _validate_username(self, url: str, username: str) -> bool:
         """Validate username based on Jira instance type."""
@@ -242,13 +241,9 @@ class CredentialValidator:
 
     def _validate_jira_token(self, token: str) -> bool:
         """Validate Jira API token format."""
-        # Jira API tokens are typically 24 characters long and alphanumeric
-        if len(token) < 10:
-            return False
-
-        # Should not contain spaces or special characters except possibly hyphens
-        pattern = r"^[A-Za-z0-9\-_]+$"
-        return re.match(pattern, token) is not None
+        # Jira API tokens are typically 24 characters long and alphanumeric.
+        # Should not contain spaces or special characters except - and _
+        return is_valid_api_token(token, min_length=10)
 
     def validate_jira_token(self, token: str) -> ValidationResult:
         """Validate JIRA API token format."""
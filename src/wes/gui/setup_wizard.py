@@ -26,6 +26,7 @@ from PySide6.QtWidgets import (
 from ..core.config_manager import ConfigManager
 from ..integrations.redhat_jira_client import is_redhat_jira
 from ..utils.logging_config import get_logger
+from ..utils.validators import is_valid_email
 from .credential_validators import CredentialValidator
 
 
@@ -431,10 +432,7 @@ class JiraSetupPage(WizardPage):
 
             if "atlassian.net" in parsed.netloc:
                 # Jira Cloud requires email format
-                import re
-
-                email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-                if not re.match(email_pattern, username):
+                if not is_valid_email(username):
                     return (
                         False,
                         "Jira Cloud requires a valid email address as username",
@@ -50,7 +50,7 @@ class ValidationIndicator(QWidget):
 
     def _setup_animations(self):
         """Setup fade animations for smooth transitions."""
-        self.fade_animation = QPropertyAnimation(self, b"windowOpacity")
+        self.fade_animation = QPropertyAnimation(self, b"windowOpacity", self)
         self.fade_animation.setDuration(200)
         self.fade_animation.setEasingCurve(QEasingCurve.InOutQuad)
 
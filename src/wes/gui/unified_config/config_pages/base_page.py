@@ -19,9 +19,12 @@ from PySide6.QtWidgets import (
 
 from wes.core.config_manager import ConfigManager
 from wes.gui.unified_config.types import ServiceType, ValidationResult
-from wes.gui.unified_config.utils.constants import ConfigConstants
+from wes.gui.unified_config.utils.constants import VALIDATION_DELAY_MS
 from wes.gui.unified_config.utils.dialogs import DialogManager
-from wes.gui.unified_config.utils.responsive_layout import ResponsiveConfigLayout
+from wes.gui.unified_config.utils.responsive_layout import (
+    ResponsiveConfigLayout,
+    mark_description,
+)
 from wes.gui.unified_config.utils.styles import StyleManager
 
 
@@ -86,8 +89,8 @@ class ConfigPageBase(QWidget):
         text_layout.addWidget(title_label)
 
         if self.page_description:
-            desc_label = QLabel(self.page_description)
-            desc_label.setObjectName("description_label")  # Mark for responsive hiding
+            desc_label = mark_description(QLabel(self.page_description))
+            desc_label.setObjectName("description_label")
             desc_label.setWordWrap(True)
             desc_label.setStyleSheet(StyleManager.get_label_style("secondary"))
             text_layout.addWidget(desc_label)
@@ -204,9 +207,7 @@ class ConfigPageBase(QWidget):
 
             # Schedule validation
             self._validation_timer.stop()
-            self._validation_timer.start(
-                ConfigConstants.VALIDATION_DELAY_MS
-            )  # Validate after delay
+            self._validation_timer.start(VALIDATION_DELAY_MS)  # Validate after delay
 
     def mark_clean(self):
         """Mark configuration as saved."""
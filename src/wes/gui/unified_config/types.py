@@ -1,7 +1,8 @@
 """Type definitions for unified configuration system."""
 
+from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any, Dict, Optional, TypedDict
+from typing import Any, Dict, List, Optional, TypedDict
 
 
 class UIMode(Enum):
@@ -62,3 +63,39 @@ class ConfigPageInfo(TypedDict):
     description: str
     service_type: ServiceType
     required: bool
+
+
+@dataclass(slots=True)
+class AnalysisResult:
+    """Combined configuration analysis produced in a single pass."""
+
+    state: ConfigState
+    missing: List[ServiceType]
+    missing_fields: Dict[ServiceType, List[str]]
+    configured: Dict[ServiceType, bool]
+    _results: Optional[Dict[ServiceType, ValidationResult]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def results(self) -> Dict[ServiceType, ValidationResult]:
+        """Per-service validation results, built on first access."""
+        if self._results is None:
+            results = {}
+            for service_type, fields in self.missing_fields.items():
+                is_valid = service_type not in self.missing
+                if not self.configured[service_type]:
+                    message = "Not configured"
+                elif is_valid:
+                    message = "Configuration complete"
+                else:
+                    message = f"Missing: {', '.join(fields)}"
+
+                results[service_type] = ValidationResult(
+                    is_valid=is_valid,
+                    message=message,
+                    service=service_type,
+                    details={"configured": self.configured[service_type]},
+                )
+            self._results = results
+        return self._results
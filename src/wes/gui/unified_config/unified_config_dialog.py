@@ -19,6 +19,7 @@ from PySide6.QtWidgets import (
 from wes.core.config_manager import ConfigManager
 from wes.gui.unified_config.types import ConfigState, UIMode
 from wes.gui.unified_config.utils.config_detector import ConfigDetector
+from wes.gui.unified_config.utils.styles import StyleManager
 
 
 class UnifiedConfigDialog(QDialog):
@@ -81,6 +82,10 @@ class UnifiedConfigDialog(QDialog):
             | Qt.WindowMinimizeButtonHint
         )
 
+        # Header, mode label and button area are styled by object name from
+        # one stylesheet, parsed once for the whole dialog
+        self.setStyleSheet(StyleManager.get_combined_style("header"))
+
         # Main layout
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -88,14 +93,6 @@ class UnifiedConfigDialog(QDialog):
         # Header area with mode indicator
         header_widget = QWidget()
         header_widget.setObjectName("configHeader")
-        header_widget.setStyleSheet(
-            """
-            #configHeader {
-                background-color: #f0f0f0;
-                border-bottom: 1px solid #d0d0d0;
-            }
-        """
-        )
 
         header_layout = QHBoxLayout(header_widget)
         header_layout.setContentsMargins(20, 10, 20, 10)
@@ -105,14 +102,6 @@ class UnifiedConfigDialog(QDialog):
 
         self.mode_label = QLabel()
         self.mode_label.setObjectName("modeLabel")
-        self.mode_label.setStyleSheet(
-            """
-            #modeLabel {
-                font-size: 16px;
-                font-weight: bold;
-            }
-        """
-        )
         header_layout.addWidget(self.mode_label)
         header_layout.addStretch()
 
@@ -142,14 +131,6 @@ class UnifiedConfigDialog(QDialog):
         # Button area
         button_widget = QWidget()
         button_widget.setObjectName("buttonArea")
-        button_widget.setStyleSheet(
-            """
-            #buttonArea {
-                background-color: #f0f0f0;
-                border-top: 1px solid #d0d0d0;
-            }
-        """
-        )
 
         button_layout = QHBoxLayout(button_widget)
         button_layout.setContentsMargins(20, 10, 20, 10)
@@ -21,7 +21,7 @@ from .factory import (
     get_config_page_factory,
     set_config_page_factory,
 )
-from .responsive_layout import ResponsiveConfigLayout
+from .responsive_layout import ResponsiveConfigLayout, mark_description
 from .service_locator import (
     ServiceLocator,
     ServiceNotFoundError,
@@ -39,6 +39,7 @@ __all__ = [
     # Existing
     "ConfigDetector",
     "ResponsiveConfigLayout",
+    "mark_description",
     # Dialogs
     "DialogManager",
     "ValidationDialog",
@@ -1,59 +1,94 @@
 """Configuration state detection utilities."""
 
-from typing import Any, Dict, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, Final, Iterator, Mapping, Optional, Tuple
 
-from wes.gui.unified_config.types import ConfigState, ServiceType, ValidationResult
+from wes.gui.unified_config.types import (
+    AnalysisResult,
+    ConfigState,
+    ServiceType,
+    ValidationResult,
+)
+
+# Service iteration order and count, frozen once instead of walking the enum
+_SERVICES: Final[Tuple[ServiceType, ...]] = tuple(ServiceType)
+_N_SERVICES: Final[int] = len(_SERVICES)
+
+# Shared read-only stand-in for a missing service section
+_EMPTY_DICT: Final[Mapping[str, Any]] = MappingProxyType({})
 
 
 class ConfigDetector:
     """Analyzes configuration state and completeness."""
 
+    __slots__ = ("required_fields",)
+
+    # Config section key for each service, resolved once
+    _SERVICE_KEYS: Final[Dict[ServiceType, str]] = {st: st.value for st in _SERVICES}
+
     def __init__(self):
         self.required_fields = {
-            ServiceType.JIRA: ["url", "username", "api_token"],
-            ServiceType.GEMINI: ["api_key"],
+            ServiceType.JIRA: ("url", "username", "api_token"),
+            ServiceType.GEMINI: ("api_key",),
         }
 
-    def detect_state(self, config: Dict[str, Any]) -> ConfigState:
+    def analyze(self, config: Dict[str, Any]) -> AnalysisResult:
         """
-        Detect overall configuration state.
+        Analyze state, missing services and per-service status in one pass.
 
         Args:
             config: Configuration dictionary
 
         Returns:
-            Current configuration state
+            Combined analysis result
         """
-        if not config or all(not v for v in config.values()):
-            return ConfigState.EMPTY
-
-        # Check each service
-        service_states = {
-            ServiceType.JIRA: self._check_service_config(
-                config.get("jira", {}), ServiceType.JIRA
-            ),
-            ServiceType.GEMINI: self._check_service_config(
-                config.get("gemini", {}), ServiceType.GEMINI
-            ),
-        }
+        missing = []
+        missing_fields = {}
+        configured = {}
+        has_partial_config = False
 
-        # Determine overall state
-        complete_count = sum(1 for state in service_states.values() if state)
+        for service_type in _SERVICES:
+            service_config = (
+                config.get(self._SERVICE_KEYS[service_type], _EMPTY_DICT)
+                if config
+                else _EMPTY_DICT
+            )
+            is_complete, fields = self._validate_service(service_config, service_type)
 
-        # Check if any service has partial configuration
-        has_partial_config = False
-        for service_type in service_states:
-            service_config = config.get(service_type.value, {})
-            if service_config and not service_states[service_type]:
-                has_partial_config = True
-                break
-
-        if complete_count == len(service_states):
-            return ConfigState.COMPLETE
-        elif complete_count > 0 or has_partial_config:
-            return ConfigState.INCOMPLETE
+            missing_fields[service_type] = fields
+            configured[service_type] = bool(service_config)
+            if not is_complete:
+                missing.append(service_type)
+                if service_config:
+                    has_partial_config = True
+
+        if not config or all(not v for v in config.values()):
+            state = ConfigState.EMPTY
+        elif not missing:
+            state = ConfigState.COMPLETE
+        elif len(missing) < _N_SERVICES or has_partial_config:
+            state = ConfigState.INCOMPLETE
         else:
-            return ConfigState.INVALID
+            state = ConfigState.INVALID
+
+        return AnalysisResult(
+            state=state,
+            missing=missing,
+            missing_fields=missing_fields,
+            configured=configured,
+        )
+
+    def detect_state(self, config: Dict[str, Any]) -> ConfigState:
+        """
+        Detect overall configuration state.
+
+        Args:
+            config: Configuration dictionary
+
+        Returns:
+            Current configuration state
+        """
+        return self.analyze(config).state
 
     def _check_service_config(
         self, service_config: Dict[str, Any], service_type: ServiceType
@@ -68,21 +103,49 @@ class ConfigDetector:
         Returns:
             True if configuration is complete
         """
-        if not service_config:
-            return False
+        return self._validate_service(service_config, service_type)[0]
+
+    def _validate_service(
+        self, service_config: Dict[str, Any], service_type: ServiceType
+    ) -> Tuple[bool, list[str]]:
+        """
+        Check a service configuration and collect its missing fields in one pass.
+
+        Args:
+            service_config: Service-specific configuration
+            service_type: Type of service to check
 
+        Returns:
+            Tuple of (is_complete, missing_fields)
+        """
+        missing = list(self._iter_missing_fields(service_config, service_type))
+        return bool(service_config) and not missing, missing
+
+    def _iter_missing_fields(
+        self, service_config: Dict[str, Any], service_type: ServiceType
+    ) -> Iterator[str]:
+        """Yield the missing required fields for a service."""
         # Special handling for Gemini service
         if service_type == ServiceType.GEMINI:
             # Check for either api_key or gemini_api_key (handles both field names)
-            has_api_key = bool(service_config.get("api_key")) or bool(
-                service_config.get("gemini_api_key")
-            )
-            return has_api_key
+            if not (
+                service_config
+                and (
+                    service_config.get("api_key")
+                    or service_config.get("gemini_api_key")
+                )
+            ):
+                yield "API key"
+            return
+
+        required = self.required_fields.get(service_type, ())
+        if not service_config:
+            yield from required
+            return
 
-        required = self.required_fields.get(service_type, [])
-        return all(
-            field in service_config and service_config[field] for field in required
-        )
+        for field in required:
+            if not service_config.get(field):
+                yield field
 
     def get_missing_services(self, config: Dict[str, Any]) -> list[ServiceType]:
         """
@@ -94,14 +157,7 @@ class ConfigDetector:
         Returns:
             List of service types that need configuration
         """
-        missing = []
-
-        for service_type in ServiceType:
-            service_config = config.get(service_type.value, {})
-            if not self._check_service_config(service_config, service_type):
-                missing.append(service_type)
-
-        return missing
+        return self.analyze(config).missing
 
     def get_service_status(
         self, config: Dict[str, Any]
@@ -115,52 +171,13 @@ class ConfigDetector:
         Returns:
             Dictionary mapping service types to their validation results
         """
-        results = {}
-
-        for service_type in ServiceType:
-            service_config = config.get(service_type.value, {})
-            is_complete = self._check_service_config(service_config, service_type)
-
-            if not service_config:
-                message = "Not configured"
-            elif is_complete:
-                message = "Configuration complete"
-            else:
-                missing = self._get_missing_fields(service_config, service_type)
-                message = f"Missing: {', '.join(missing)}"
-
-            results[service_type] = ValidationResult(
-                is_valid=is_complete,
-                message=message,
-                service=service_type,
-                details={"configured": bool(service_config)},
-            )
-
-        return results
+        return self.analyze(config).results
 
     def _get_missing_fields(
         self, service_config: Dict[str, Any], service_type: ServiceType
     ) -> list[str]:
         """Get list of missing required fields for a service."""
-        # Google service removed
-
-        # Special handling for Gemini service
-        if service_type == ServiceType.GEMINI:
-            # Check for either api_key or gemini_api_key
-            has_api_key = bool(service_config.get("api_key")) or bool(
-                service_config.get("gemini_api_key")
-            )
-
-            if not has_api_key:
-                return ["API key"]
-            return []
-
-        required = self.required_fields.get(service_type, [])
-        return [
-            field
-            for field in required
-            if field not in service_config or not service_config[field]
-        ]
+        return list(self._iter_missing_fields(service_config, service_type))
 
     def suggest_next_action(
         self, config: Dict[str, Any]
@@ -174,12 +191,12 @@ class ConfigDetector:
         Returns:
             Tuple of (action_message, service_to_configure)
         """
-        state = self.detect_state(config)
+        analysis = self.analyze(config)
 
-        if state == ConfigState.EMPTY:
+        if analysis.state == ConfigState.EMPTY:
             return "Let's start by configuring Jira", ServiceType.JIRA
 
-        missing = self.get_missing_services(config)
+        missing = analysis.missing
         if missing:
             service = missing[0]  # Configure in order
             return f"Configure {service.value.title()} to continue", service
@@ -2,84 +2,177 @@
 
 This module provides centralized constants to reduce magic values throughout
 the codebase and improve maintainability.
+
+Constants are defined as module-level names, which are the cheapest to look up
+(``from .constants import VALIDATION_DELAY_MS``). The ``ConfigConstants``,
+``URLConstants`` and ``ValidationPatterns`` classes expose the same values as
+namespaces for existing callers.
 """
 
 from typing import Final
 
+__all__ = [
+    "ConfigConstants",
+    "URLConstants",
+    "ValidationPatterns",
+    "REQUEST_TIMEOUT_DEFAULT",
+    "REQUEST_TIMEOUT_MIN",
+    "REQUEST_TIMEOUT_MAX",
+    "CONNECTION_TEST_TIMEOUT",
+    "RETRY_ATTEMPTS_DEFAULT",
+    "RETRY_ATTEMPTS_MIN",
+    "RETRY_ATTEMPTS_MAX",
+    "RETRY_DELAY_SECONDS",
+    "VALIDATION_DELAY_MS",
+    "MESSAGE_DEDUP_COOLDOWN_MS",
+    "CONFIG_CHANGE_DEBOUNCE_MS",
+    "PENDING_MESSAGES_MAX",
+    "WES_CONFIG_DIR",
+    "JIRA_URL_MIN_LENGTH",
+    "JIRA_DEFAULT_JQL",
+    "JIRA_MAX_RESULTS_DEFAULT",
+    "JIRA_MAX_RESULTS_MIN",
+    "JIRA_MAX_RESULTS_MAX",
+    "DIALOG_MIN_WIDTH",
+    "DIALOG_MIN_HEIGHT",
+    "INSTRUCTIONS_MAX_HEIGHT",
+    "CREDENTIALS_FILE_PERMISSIONS",
+    "SUMMARY_LENGTH_DEFAULT",
+    "SUMMARY_LENGTH_MIN",
+    "SUMMARY_LENGTH_MAX",
+    "FADE_ANIMATION_DURATION",
+    "MIN_PASSWORD_LENGTH",
+    "ENCRYPTION_KEY_ITERATIONS",
+    "CACHE_EXPIRY_SECONDS",
+    "GOOGLE_CLOUD_CONSOLE_CREDENTIALS",
+    "EMAIL_PATTERN",
+    "URL_PATTERN",
+    "JIRA_URL_PATTERN",
+    "API_TOKEN_PATTERN",
+    "JSON_FILE_PATTERN",
+]
+
+# Configuration constants for the application
+
+# Timeouts (in seconds)
+REQUEST_TIMEOUT_DEFAULT: Final[int] = 30
+REQUEST_TIMEOUT_MIN: Final[int] = 10
+REQUEST_TIMEOUT_MAX: Final[int] = 300
+CONNECTION_TEST_TIMEOUT: Final[int] = 60
+
+# Retry settings
+RETRY_ATTEMPTS_DEFAULT: Final[int] = 3
+RETRY_ATTEMPTS_MIN: Final[int] = 0
+RETRY_ATTEMPTS_MAX: Final[int] = 10
+RETRY_DELAY_SECONDS: Final[float] = 1.0
+
+# Validation settings
+VALIDATION_DELAY_MS: Final[int] = 500  # Delay before validation after changes
+MESSAGE_DEDUP_COOLDOWN_MS: Final[int] = 250  # Suppress repeated identical dialogs
+CONFIG_CHANGE_DEBOUNCE_MS: Final[int] = 100  # Coalesce bursts of change signals
+PENDING_MESSAGES_MAX: Final[int] = 10  # Messages held per hidden parent
+
+# Path constants
+WES_CONFIG_DIR: Final[str] = ".wes"
+
+# Jira constants
+JIRA_URL_MIN_LENGTH: Final[int] = 8
+JIRA_DEFAULT_JQL: Final[str] = "assignee = currentUser() AND resolved >= -7d"
+JIRA_MAX_RESULTS_DEFAULT: Final[int] = 50
+JIRA_MAX_RESULTS_MIN: Final[int] = 10
+JIRA_MAX_RESULTS_MAX: Final[int] = 200
+
+# UI Constants
+DIALOG_MIN_WIDTH: Final[int] = 600
+DIALOG_MIN_HEIGHT: Final[int] = 400
+INSTRUCTIONS_MAX_HEIGHT: Final[int] = 150
+
+# File permissions
+CREDENTIALS_FILE_PERMISSIONS: Final[int] = 0o600
+
+# Summary settings
+SUMMARY_LENGTH_DEFAULT: Final[int] = 500
+SUMMARY_LENGTH_MIN: Final[int] = 100
+SUMMARY_LENGTH_MAX: Final[int] = 2000
+
+# Animation durations (ms)
+FADE_ANIMATION_DURATION: Final[int] = 300
+
+# Security settings
+MIN_PASSWORD_LENGTH: Final[int] = 8
+ENCRYPTION_KEY_ITERATIONS: Final[int] = 100000
+
+# Cache settings
+CACHE_EXPIRY_SECONDS: Final[int] = 3600  # 1 hour
+
+# URL constants for external services
+
+# Google URLs
+GOOGLE_CLOUD_CONSOLE_CREDENTIALS: Final[str] = (
+    "https://console.cloud.google.com/apis/credentials"
+)
+
+# Regular expression patterns for validation
+
+# Email patterns
+EMAIL_PATTERN: Final[str] = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+
+# URL patterns
+URL_PATTERN: Final[str] = r"^https?://[a-zA-Z0-9.-]+(:[0-9]+)?(/.*)?$"
+JIRA_URL_PATTERN: Final[str] = r"^https?://[a-zA-Z0-9.-]+(:[0-9]+)?/?$"
+
+# Token patterns
+API_TOKEN_PATTERN: Final[str] = r"^[A-Za-z0-9_-]{20,}$"
+
+# File path patterns
+JSON_FILE_PATTERN: Final[str] = r".*\.json$"
+
 
 class ConfigConstants:
     """Configuration constants for the application."""
 
-    # Timeouts (in seconds)
-    REQUEST_TIMEOUT_DEFAULT: Final[int] = 30
-    REQUEST_TIMEOUT_MIN: Final[int] = 10
-    REQUEST_TIMEOUT_MAX: Final[int] = 300
-    CONNECTION_TEST_TIMEOUT: Final[int] = 60
-
-    # Retry settings
-    RETRY_ATTEMPTS_DEFAULT: Final[int] = 3
-    RETRY_ATTEMPTS_MIN: Final[int] = 0
-    RETRY_ATTEMPTS_MAX: Final[int] = 10
-    RETRY_DELAY_SECONDS: Final[float] = 1.0
-
-    # Validation settings
-    VALIDATION_DELAY_MS: Final[int] = 500  # Delay before validation after changes
-
-    # Path constants
-    WES_CONFIG_DIR: Final[str] = ".wes"
-
-    # Jira constants
-    JIRA_URL_MIN_LENGTH: Final[int] = 8
-    JIRA_DEFAULT_JQL: Final[str] = "assignee = currentUser() AND resolved >= -7d"
-    JIRA_MAX_RESULTS_DEFAULT: Final[int] = 50
-    JIRA_MAX_RESULTS_MIN: Final[int] = 10
-    JIRA_MAX_RESULTS_MAX: Final[int] = 200
-
-    # UI Constants
-    DIALOG_MIN_WIDTH: Final[int] = 600
-    DIALOG_MIN_HEIGHT: Final[int] = 400
-    INSTRUCTIONS_MAX_HEIGHT: Final[int] = 150
-
-    # File permissions
-    CREDENTIALS_FILE_PERMISSIONS: Final[int] = 0o600
-
-    # Summary settings
-    SUMMARY_LENGTH_DEFAULT: Final[int] = 500
-    SUMMARY_LENGTH_MIN: Final[int] = 100
-    SUMMARY_LENGTH_MAX: Final[int] = 2000
-
-    # Animation durations (ms)
-    FADE_ANIMATION_DURATION: Final[int] = 300
-
-    # Security settings
-    MIN_PASSWORD_LENGTH: Final[int] = 8
-    ENCRYPTION_KEY_ITERATIONS: Final[int] = 100000
-
-    # Cache settings
-    CACHE_EXPIRY_SECONDS: Final[int] = 3600  # 1 hour
+    REQUEST_TIMEOUT_DEFAULT: Final = REQUEST_TIMEOUT_DEFAULT
+    REQUEST_TIMEOUT_MIN: Final = REQUEST_TIMEOUT_MIN
+    REQUEST_TIMEOUT_MAX: Final = REQUEST_TIMEOUT_MAX
+    CONNECTION_TEST_TIMEOUT: Final = CONNECTION_TEST_TIMEOUT
+    RETRY_ATTEMPTS_DEFAULT: Final = RETRY_ATTEMPTS_DEFAULT
+    RETRY_ATTEMPTS_MIN: Final = RETRY_ATTEMPTS_MIN
+    RETRY_ATTEMPTS_MAX: Final = RETRY_ATTEMPTS_MAX
+    RETRY_DELAY_SECONDS: Final = RETRY_DELAY_SECONDS
+    VALIDATION_DELAY_MS: Final = VALIDATION_DELAY_MS
+    MESSAGE_DEDUP_COOLDOWN_MS: Final = MESSAGE_DEDUP_COOLDOWN_MS
+    CONFIG_CHANGE_DEBOUNCE_MS: Final = CONFIG_CHANGE_DEBOUNCE_MS
+    PENDING_MESSAGES_MAX: Final = PENDING_MESSAGES_MAX
+    WES_CONFIG_DIR: Final = WES_CONFIG_DIR
+    JIRA_URL_MIN_LENGTH: Final = JIRA_URL_MIN_LENGTH
+    JIRA_DEFAULT_JQL: Final = JIRA_DEFAULT_JQL
+    JIRA_MAX_RESULTS_DEFAULT: Final = JIRA_MAX_RESULTS_DEFAULT
+    JIRA_MAX_RESULTS_MIN: Final = JIRA_MAX_RESULTS_MIN
+    JIRA_MAX_RESULTS_MAX: Final = JIRA_MAX_RESULTS_MAX
+    DIALOG_MIN_WIDTH: Final = DIALOG_MIN_WIDTH
+    DIALOG_MIN_HEIGHT: Final = DIALOG_MIN_HEIGHT
+    INSTRUCTIONS_MAX_HEIGHT: Final = INSTRUCTIONS_MAX_HEIGHT
+    CREDENTIALS_FILE_PERMISSIONS: Final = CREDENTIALS_FILE_PERMISSIONS
+    SUMMARY_LENGTH_DEFAULT: Final = SUMMARY_LENGTH_DEFAULT
+    SUMMARY_LENGTH_MIN: Final = SUMMARY_LENGTH_MIN
+    SUMMARY_LENGTH_MAX: Final = SUMMARY_LENGTH_MAX
+    FADE_ANIMATION_DURATION: Final = FADE_ANIMATION_DURATION
+    MIN_PASSWORD_LENGTH: Final = MIN_PASSWORD_LENGTH
+    ENCRYPTION_KEY_ITERATIONS: Final = ENCRYPTION_KEY_ITERATIONS
+    CACHE_EXPIRY_SECONDS: Final = CACHE_EXPIRY_SECONDS
 
 
 class URLConstants:
     """URL constants for external services."""
 
-    # Google URLs
-    GOOGLE_CLOUD_CONSOLE_CREDENTIALS: Final[str] = (
-        "https://console.cloud.google.com/apis/credentials"
-    )
+    GOOGLE_CLOUD_CONSOLE_CREDENTIALS: Final = GOOGLE_CLOUD_CONSOLE_CREDENTIALS
 
 
 class ValidationPatterns:
     """Regular expression patterns for validation."""
 
-    # Email patterns
-    EMAIL_PATTERN: Final[str] = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-
-    # URL patterns
-    URL_PATTERN: Final[str] = r"^https?://[a-zA-Z0-9.-]+(:[0-9]+)?(/.*)?$"
-    JIRA_URL_PATTERN: Final[str] = r"^https?://[a-zA-Z0-9.-]+(:[0-9]+)?/?$"
-
-    # Token patterns
-    API_TOKEN_PATTERN: Final[str] = r"^[A-Za-z0-9_-]{20,}$"
-
-    # File path patterns
-    JSON_FILE_PATTERN: Final[str] = r".*\.json$"
+    EMAIL_PATTERN: Final = EMAIL_PATTERN
+    URL_PATTERN: Final = URL_PATTERN
+    JIRA_URL_PATTERN: Final = JIRA_URL_PATTERN
+    API_TOKEN_PATTERN: Final = API_TOKEN_PATTERN
+    JSON_FILE_PATTERN: Final = JSON_FILE_PATTERN
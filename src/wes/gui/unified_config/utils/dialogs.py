@@ -4,11 +4,20 @@ This module provides reusable dialog functions to improve maintainability
 and ensure consistent user experience across the application.
 """
 
+import time
+from collections import deque
 from enum import Enum
-from typing import Optional
+from typing import Deque, Optional, Tuple
 
+from PySide6.QtCore import QEvent, QObject, Qt, QTimer
 from PySide6.QtWidgets import QFileDialog, QMessageBox, QWidget
 
+from wes.utils.logging_config import get_logger
+
+from .constants import MESSAGE_DEDUP_COOLDOWN_MS, PENDING_MESSAGES_MAX
+
+logger = get_logger(__name__)
+
 
 class MessageType(Enum):
     """Enumeration of message types for dialogs."""
@@ -20,9 +29,203 @@ class MessageType(Enum):
     SUCCESS = "success"
 
 
-class DialogManager:
+# Icon shown for each message type; unlisted types fall back to Information
+_ICON_BY_TYPE = {
+    MessageType.INFO: QMessageBox.Information,
+    MessageType.WARNING: QMessageBox.Warning,
+    MessageType.ERROR: QMessageBox.Critical,
+}
+
+# Info titles normalized to "Success" for success styling
+_SUCCESS_TITLES = frozenset({"success"})
+
+# Object name used to find the reusable message box among a parent's children
+_MESSAGE_BOX_NAME = "wesMessageBox"
+
+# Reusable message box for dialogs shown without a parent widget
+_orphan_message_box: Optional[QMessageBox] = None
+
+# Object name used to find the reusable file dialog among a parent's children
+_FILE_DIALOG_NAME = "wesFileDialog"
+
+# Reusable file dialog for dialogs shown without a parent widget
+_orphan_file_dialog: Optional[QFileDialog] = None
+
+# Last message shown and when it was dismissed, used to drop duplicates
+_last_message: Optional[Tuple[str, str, MessageType]] = None
+_last_message_time = 0.0
+
+# Message types dropped instead of deferred when the parent is hidden
+_DROPPABLE_WHEN_HIDDEN = frozenset({MessageType.INFO, MessageType.SUCCESS})
+
+# Object name used to find a hidden parent's queue of deferred messages
+_PENDING_MESSAGES_NAME = "wesPendingMessages"
+
+# (title, message, message_type, details) held until the parent is shown
+_PendingMessage = Tuple[str, str, MessageType, Optional[str]]
+
+
+def _get_message_box(parent: Optional[QWidget]) -> QMessageBox:
+    """Return the reusable message box for a parent, creating it on first use.
+
+    The box is owned by the parent through Qt's object tree, so it is destroyed
+    together with the parent. A fresh box is returned if the cached one is
+    already on screen (e.g. a message raised while another is open).
+    """
+    global _orphan_message_box
+
+    if parent is None:
+        if _orphan_message_box is None:
+            _orphan_message_box = QMessageBox()
+        msg_box = _orphan_message_box
+    else:
+        msg_box = parent.findChild(
+            QMessageBox, _MESSAGE_BOX_NAME, Qt.FindDirectChildrenOnly
+        )
+        if msg_box is None:
+            msg_box = QMessageBox(parent)
+            msg_box.setObjectName(_MESSAGE_BOX_NAME)
+
+    if msg_box.isVisible():
+        return QMessageBox(parent)
+    return msg_box
+
+
+def _get_file_dialog(
+    parent: Optional[QWidget],
+    title: str,
+    directory: str,
+    file_mode: QFileDialog.FileMode,
+    accept_mode: QFileDialog.AcceptMode,
+) -> QFileDialog:
+    """Return the reusable file dialog for a parent, reset for a new request.
+
+    Reusing the dialog keeps its directory cache warm and remembers the last
+    visited directory when ``directory`` is empty.
+    """
+    global _orphan_file_dialog
+
+    if parent is None:
+        if _orphan_file_dialog is None:
+            _orphan_file_dialog = QFileDialog()
+        dialog = _orphan_file_dialog
+    else:
+        dialog = parent.findChild(
+            QFileDialog, _FILE_DIALOG_NAME, Qt.FindDirectChildrenOnly
+        )
+        if dialog is None:
+            dialog = QFileDialog(parent)
+            dialog.setObjectName(_FILE_DIALOG_NAME)
+
+    if dialog.isVisible():
+        dialog = QFileDialog(parent)
+
+    dialog.setWindowTitle(title)
+    dialog.setFileMode(file_mode)
+    dialog.setAcceptMode(accept_mode)
+    dialog.setOptions(QFileDialog.Options())
+    if directory:
+        dialog.setDirectory(directory)
+    return dialog
+
+
+def _exec_file_dialog(
+    dialog: QFileDialog, filter: str, selected_filter: Optional[str]
+) -> Optional[str]:
+    """Apply name filters, run the dialog and return the first selected path."""
+    dialog.setNameFilters(filter.split(";;"))
+    if selected_filter:
+        dialog.selectNameFilter(selected_filter)
+
+    if not dialog.exec():
+        return None
+    files = dialog.selectedFiles()
+    return files[0] if files else None
+
+
+def _display_message(
+    parent: Optional[QWidget],
+    title: str,
+    message: str,
+    message_type: MessageType,
+    details: Optional[str],
+) -> None:
+    """Show a message box now, unless it repeats the one just dismissed."""
+    global _last_message, _last_message_time
+
+    key = (title, message, message_type)
+    elapsed_ms = (time.monotonic() - _last_message_time) * 1000
+    if key == _last_message and elapsed_ms < MESSAGE_DEDUP_COOLDOWN_MS:
+        # Identical message was just dismissed; don't show it again
+        return
+
+    icon = _ICON_BY_TYPE.get(message_type, QMessageBox.Information)
+    if message_type is MessageType.INFO and title.casefold() in _SUCCESS_TITLES:
+        # Use success styling for info messages about success
+        title = "Success"
+
+    msg_box = _get_message_box(parent)
+    msg_box.setWindowTitle(title)
+    msg_box.setText(message)
+    msg_box.setIcon(icon)
+    # Always reset so details from a previous message don't linger
+    msg_box.setDetailedText(details or "")
+
+    msg_box.exec()
+
+    _last_message = key
+    _last_message_time = time.monotonic()
+
+
+class _PendingMessages(QObject):
+    """Messages held for a hidden parent until its next Show event.
+
+    The queue is a child of the parent through Qt's object tree, so messages
+    for a parent destroyed before it is shown are discarded with it.
+    """
+
+    def __init__(self, parent: QWidget):
+        super().__init__(parent)
+        self.setObjectName(_PENDING_MESSAGES_NAME)
+        self.messages: Deque[_PendingMessage] = deque(maxlen=PENDING_MESSAGES_MAX)
+        parent.installEventFilter(self)
+
+    @classmethod
+    def for_parent(cls, parent: QWidget) -> "_PendingMessages":
+        """Return the parent's queue, creating it on first use."""
+        pending = parent.findChild(
+            _PendingMessages, _PENDING_MESSAGES_NAME, Qt.FindDirectChildrenOnly
+        )
+        return pending if pending is not None else cls(parent)
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        """Schedule the queued messages once the parent is shown."""
+        if event.type() == QEvent.Show and self.messages:
+            # Let the parent finish showing before opening a modal box
+            QTimer.singleShot(0, self, self._show_messages)
+        return False
+
+    def _show_messages(self) -> None:
+        """Show the queued messages while the parent is still visible."""
+        parent = self.parent()
+        while self.messages and parent.isVisible():
+            _display_message(parent, *self.messages.popleft())
+
+
+class _StaticNamespace:
+    """Base for helper classes that only expose static methods."""
+
+    __slots__ = ()
+
+    def __new__(cls, *args, **kwargs):
+        raise TypeError(f"{cls.__name__} provides static methods only")
+
+
+class DialogManager(_StaticNamespace):
     """Manages common dialog patterns for better maintainability."""
 
+    __slots__ = ()
+
     @staticmethod
     def show_message(
         parent: Optional[QWidget],
@@ -33,6 +236,10 @@ class DialogManager:
     ) -> None:
         """Show a message dialog with consistent styling.
 
+        If the parent is hidden, info and success messages are dropped, while
+        warnings and errors are deferred until the parent is shown, with
+        duplicates coalesced.
+
         Args:
             parent: Parent widget for the dialog.
             title: Dialog title.
@@ -40,27 +247,19 @@ class DialogManager:
             message_type: Type of message (info, warning, error, etc.).
             details: Optional detailed message text.
         """
-        if message_type == MessageType.INFO:
-            icon = QMessageBox.Information
-            if title.lower() == "success" or message_type == MessageType.SUCCESS:
-                # Use success styling for info messages about success
-                title = "Success" if title.lower() == "success" else title
-        elif message_type == MessageType.WARNING:
-            icon = QMessageBox.Warning
-        elif message_type == MessageType.ERROR:
-            icon = QMessageBox.Critical
-        else:
-            icon = QMessageBox.Information
+        if parent is not None and not parent.isVisible():
+            if message_type in _DROPPABLE_WHEN_HIDDEN:
+                logger.debug(f"Dropping message for hidden parent: {title}")
+                return
 
-        msg_box = QMessageBox(parent)
-        msg_box.setWindowTitle(title)
-        msg_box.setText(message)
-        msg_box.setIcon(icon)
+            # Bursts of the same message collapse into one queued entry
+            pending = _PendingMessages.for_parent(parent)
+            entry = (title, message, message_type, details)
+            if entry not in pending.messages:
+                pending.messages.append(entry)
+            return
 
-        if details:
-            msg_box.setDetailedText(details)
-
-        msg_box.exec()
+        _display_message(parent, title, message, message_type, details)
 
     @staticmethod
     def show_error(
@@ -236,9 +435,11 @@ class DialogManager:
             return None
 
 
-class ValidationDialog:
+class ValidationDialog(_StaticNamespace):
     """Provides common validation feedback patterns."""
 
+    __slots__ = ()
+
     @staticmethod
     def show_validation_error(
         parent: Optional[QWidget],
@@ -280,9 +481,11 @@ class ValidationDialog:
         DialogManager.show_warning(parent, "Required Fields Missing", message)
 
 
-class FileDialogManager:
+class FileDialogManager(_StaticNamespace):
     """Manages file dialog operations with consistent behavior."""
 
+    __slots__ = ()
+
     @staticmethod
     def get_open_file_path(
         parent: Optional[QWidget],
@@ -303,10 +506,14 @@ class FileDialogManager:
         Returns:
             Optional[str]: Selected file path or None if cancelled.
         """
-        file_path, _ = QFileDialog.getOpenFileName(
-            parent, title, directory, filter, selected_filter
+        dialog = _get_file_dialog(
+            parent,
+            title,
+            directory,
+            QFileDialog.ExistingFile,
+            QFileDialog.AcceptOpen,
         )
-        return file_path if file_path else None
+        return _exec_file_dialog(dialog, filter, selected_filter)
 
     @staticmethod
     def get_save_file_path(
@@ -328,10 +535,14 @@ class FileDialogManager:
         Returns:
             Optional[str]: Selected file path or None if cancelled.
         """
-        file_path, _ = QFileDialog.getSaveFileName(
-            parent, title, directory, filter, selected_filter
+        dialog = _get_file_dialog(
+            parent,
+            title,
+            directory,
+            QFileDialog.AnyFile,
+            QFileDialog.AcceptSave,
         )
-        return file_path if file_path else None
+        return _exec_file_dialog(dialog, filter, selected_filter)
 
     @staticmethod
     def get_directory_path(
@@ -347,13 +558,19 @@ class FileDialogManager:
         Returns:
             Optional[str]: Selected directory path or None if cancelled.
         """
-        dir_path = QFileDialog.getExistingDirectory(
+        dialog = _get_file_dialog(
             parent,
             title,
             directory,
-            QFileDialog.ShowDirsOnly | QFileDialog.DontResolveSymlinks,
+            QFileDialog.Directory,
+            QFileDialog.AcceptOpen,
         )
-        return dir_path if dir_path else None
+        dialog.setOptions(QFileDialog.ShowDirsOnly | QFileDialog.DontResolveSymlinks)
+
+        if not dialog.exec():
+            return None
+        dirs = dialog.selectedFiles()
+        return dirs[0] if dirs else None
 
     @staticmethod
     def get_json_file_path(
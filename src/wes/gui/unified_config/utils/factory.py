@@ -4,7 +4,9 @@ This module provides factory patterns to create instances with dependencies
 injected, making the code more testable and maintainable.
 """
 
-from typing import Dict, Optional, Protocol, Type, runtime_checkable
+import importlib
+import threading
+from typing import Dict, Optional, Protocol, Tuple, Type, Union
 
 from PySide6.QtWidgets import QWidget
 
@@ -12,10 +14,16 @@ from wes.core.config_manager import ConfigManager
 from wes.gui.unified_config.config_pages.base_page import ConfigPageBase
 from wes.gui.unified_config.types import ServiceType
 
+# A page class, or the (module path, class name) it is imported from on first use
+PageEntry = Union[Type[ConfigPageBase], Tuple[str, str]]
+
 
-@runtime_checkable
 class ConfigPageFactory(Protocol):
-    """Protocol for config page factories."""
+    """Protocol for config page factories.
+
+    This is a structural contract for type checkers only and is not runtime
+    checkable. ``set_config_page_factory`` validates factories instead.
+    """
 
     def create_page(
         self,
@@ -32,20 +40,35 @@ class DefaultConfigPageFactory:
 
     def __init__(self):
         """Initialize the factory with page mappings."""
-        self._page_registry: Dict[ServiceType, Type[ConfigPageBase]] = {}
+        self._page_registry: Dict[ServiceType, PageEntry] = {}
         self._initialize_defaults()
 
     def _initialize_defaults(self) -> None:
-        """Initialize default page mappings."""
-        # Import here to avoid circular imports
-        from wes.gui.unified_config.config_pages.gemini_page import GeminiConfigPage
-        from wes.gui.unified_config.config_pages.jira_page import JiraConfigPage
+        """Initialize default page mappings.
 
+        Page modules are only imported when a page is first created, which
+        also avoids circular imports.
+        """
         self._page_registry = {
-            ServiceType.JIRA: JiraConfigPage,
-            ServiceType.GEMINI: GeminiConfigPage,
+            ServiceType.JIRA: (
+                "wes.gui.unified_config.config_pages.jira_page",
+                "JiraConfigPage",
+            ),
+            ServiceType.GEMINI: (
+                "wes.gui.unified_config.config_pages.gemini_page",
+                "GeminiConfigPage",
+            ),
         }
 
+    def _resolve_page_class(self, service_type: ServiceType) -> Type[ConfigPageBase]:
+        """Return the page class for a service, importing it on first use."""
+        entry = self._page_registry[service_type]
+        if isinstance(entry, tuple):
+            module_path, class_name = entry
+            entry = getattr(importlib.import_module(module_path), class_name)
+            self._page_registry[service_type] = entry
+        return entry
+
     def register_page(
         self, service_type: ServiceType, page_class: Type[ConfigPageBase]
     ) -> None:
@@ -79,7 +102,7 @@ class DefaultConfigPageFactory:
         if service_type not in self._page_registry:
             raise ValueError(f"No page registered for service type: {service_type}")
 
-        page_class = self._page_registry[service_type]
+        page_class = self._resolve_page_class(service_type)
         return page_class(config_manager, parent)
 
     def get_supported_services(self) -> list[ServiceType]:
@@ -102,6 +125,7 @@ class TestConfigPageFactory:
         """
         self.mock_pages = mock_pages or {}
         self.created_pages: list[tuple[ServiceType, ConfigManager]] = []
+        self._fallback: Optional[DefaultConfigPageFactory] = None
 
     def create_page(
         self,
@@ -123,16 +147,20 @@ class TestConfigPageFactory:
         self.created_pages.append((service_type, config_manager))
 
         # Return mock if available
-        if service_type in self.mock_pages:
-            return self.mock_pages[service_type]
+        mock_page = self.mock_pages.get(service_type)
+        if mock_page is not None:
+            return mock_page
 
-        # Otherwise create a real page (for integration tests)
-        factory = DefaultConfigPageFactory()
-        return factory.create_page(service_type, config_manager, parent)
+        # Otherwise create a real page (for integration tests). The fallback is
+        # private rather than the module singleton, which may be this factory.
+        if self._fallback is None:
+            self._fallback = DefaultConfigPageFactory()
+        return self._fallback.create_page(service_type, config_manager, parent)
 
 
-# Singleton instance
-_default_factory = DefaultConfigPageFactory()
+# Singleton instance, created on first use
+_default_factory: Optional[ConfigPageFactory] = None
+_factory_lock = threading.Lock()
 
 
 def get_config_page_factory() -> ConfigPageFactory:
@@ -141,6 +169,11 @@ def get_config_page_factory() -> ConfigPageFactory:
     Returns:
         ConfigPageFactory: The factory instance.
     """
+    global _default_factory
+    if _default_factory is None:
+        with _factory_lock:
+            if _default_factory is None:
+                _default_factory = DefaultConfigPageFactory()
     return _default_factory
 
 
@@ -149,6 +182,12 @@ def set_config_page_factory(factory: ConfigPageFactory) -> None:
 
     Args:
         factory: The factory to use.
+
+    Raises:
+        TypeError: If the factory has no callable ``create_page``.
     """
+    if not callable(getattr(factory, "create_page", None)):
+        raise TypeError("factory must implement create_page")
+
     global _default_factory
     _default_factory = factory
@@ -1,11 +1,33 @@
 """Responsive layout manager for configuration pages."""
 
-from typing import Dict, List, Optional
+from typing import Final, List, Optional, Tuple
 
-from PySide6.QtCore import QObject, Signal
-from PySide6.QtWidgets import QGroupBox, QHBoxLayout, QVBoxLayout, QWidget
+from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtWidgets import QGridLayout, QGroupBox, QLabel, QVBoxLayout, QWidget
 
-from wes.gui.unified_config.utils.styles import StyleManager
+from wes.gui.unified_config.utils.styles import (
+    COMPACT_MODE_STYLE,
+    GROUP_BOX_COLLAPSIBLE_STYLE,
+)
+
+__all__ = ["ResponsiveConfigLayout", "mark_description"]
+
+# Dynamic property used to tag widgets that compact mode may hide
+_ROLE_PROPERTY: Final[str] = "wes_role"
+_DESCRIPTION_ROLE: Final[str] = "description"
+
+
+def mark_description(widget: QWidget) -> QWidget:
+    """Tag a widget as a description that compact mode may hide.
+
+    Args:
+        widget: The widget to tag.
+
+    Returns:
+        QWidget: The same widget, for use inline when building layouts.
+    """
+    widget.setProperty(_ROLE_PROPERTY, _DESCRIPTION_ROLE)
+    return widget
 
 
 class ResponsiveConfigLayout(QObject):
@@ -31,28 +53,43 @@ class ResponsiveConfigLayout(QObject):
     # Layout thresholds
     COMPACT_HEIGHT_THRESHOLD = 600  # Height threshold for compact mode
     COMPACT_WIDTH_THRESHOLD = 800  # Width threshold for compact mode
+    RESIZE_DEBOUNCE_MS = 75  # Quiet period before re-evaluating the layout
 
     def __init__(self, config_page: QWidget, parent: Optional[QObject] = None) -> None:
         super().__init__(parent)
         self.config_page: QWidget = config_page
         self.is_compact: bool = False
-        self.original_spacing: Dict[QWidget, int] = {}
         self.hidden_widgets: List[QWidget] = []
+        self._resize_timer: Optional[QTimer] = None
+        self._description_cache: Optional[List[QWidget]] = None
+        self._last_size: Tuple[int, int] = (-1, -1)
 
     def adjust_for_size(self, width: int, height: int) -> None:
         """Adjust layout based on available size."""
+        if (width, height) == self._last_size:
+            return
+        self._last_size = (width, height)
+
         should_be_compact = (
             height < self.COMPACT_HEIGHT_THRESHOLD
             or width < self.COMPACT_WIDTH_THRESHOLD
         )
 
-        if should_be_compact != self.is_compact:
-            self.is_compact = should_be_compact
+        if should_be_compact == self.is_compact:
+            return
+
+        self.is_compact = should_be_compact
+
+        # Batch the spacing, visibility and style changes into one repaint
+        self.config_page.setUpdatesEnabled(False)
+        try:
             if should_be_compact:
                 self._apply_compact_mode()
             else:
                 self._apply_normal_mode()
-            self.layout_mode_changed.emit(should_be_compact)
+        finally:
+            self.config_page.setUpdatesEnabled(True)
+        self.layout_mode_changed.emit(should_be_compact)
 
     def _apply_compact_mode(self) -> None:
         """Apply compact layout for small screens."""
@@ -62,8 +99,8 @@ class ResponsiveConfigLayout(QObject):
         # Hide less important elements
         self._hide_descriptions()
 
-        # Apply compact stylesheet using StyleManager
-        self.config_page.setStyleSheet(StyleManager.get_compact_mode_style())
+        # Apply compact stylesheet
+        self.config_page.setStyleSheet(COMPACT_MODE_STYLE)
 
     def _apply_normal_mode(self) -> None:
         """Apply normal layout for larger screens."""
@@ -77,63 +114,67 @@ class ResponsiveConfigLayout(QObject):
         self.config_page.setStyleSheet("")
 
     def _adjust_spacing(self, spacing: int) -> None:
-        """Recursively adjust spacing in all layouts."""
-        self._adjust_widget_spacing(self.config_page, spacing)
+        """Adjust spacing in all layouts on the page.
 
-    def _adjust_widget_spacing(self, widget: QWidget, spacing: int) -> None:
-        """Adjust spacing for a widget and its children."""
-        try:
-            # Store original spacing if not already stored
-            if widget not in self.original_spacing and widget.layout():
-                self.original_spacing[widget] = widget.layout().spacing()
-
-            # Adjust layout spacing
-            if widget.layout():
-                widget.layout().setSpacing(spacing)
-
-                # Adjust margins for compact mode
-                if self.is_compact:
-                    margins = widget.layout().contentsMargins()
-                    widget.layout().setContentsMargins(
-                        max(5, margins.left() // 2),
-                        max(5, margins.top() // 2),
-                        max(5, margins.right() // 2),
-                        max(5, margins.bottom() // 2),
-                    )
-
-            # Recursively adjust children
-            for child in widget.findChildren(QWidget):
-                if child.layout() and child.parent() == widget:
-                    self._adjust_widget_spacing(child, spacing)
-        except AttributeError:
-            # Widget might not have a layout, skip it
-            pass
+        Qt collects every descendant in one C++ walk, so each widget is
+        visited exactly once here.
+        """
+        widgets = [self.config_page, *self.config_page.findChildren(QWidget)]
+        compact = self.is_compact
+        for widget in widgets:
+            layout = widget.layout()
+            if layout is None:
+                continue
+
+            layout.setSpacing(spacing)
+
+            # Adjust margins for compact mode
+            if compact:
+                margins = layout.contentsMargins()
+                layout.setContentsMargins(
+                    max(5, margins.left() // 2),
+                    max(5, margins.top() // 2),
+                    max(5, margins.right() // 2),
+                    max(5, margins.bottom() // 2),
+                )
 
     def _hide_descriptions(self) -> None:
         """Hide description labels and less important widgets."""
+        if self._description_cache is None:
+            self._description_cache = [
+                label
+                for label in self.config_page.findChildren(QLabel)
+                if self._is_description(label)
+            ]
+            for label in self._description_cache:
+                label.destroyed.connect(self.invalidate_description_cache)
+
         self.hidden_widgets = []
+        for label in self._description_cache:
+            label.hide()
+            self.hidden_widgets.append(label)
 
-        # Find and hide description labels
-        for label in self.config_page.findChildren(QWidget):
-            # Check various ways description widgets might be identified
-            is_description = (
-                (
-                    hasattr(label, "objectName")
-                    and "description" in label.objectName().lower()
-                )
-                or (hasattr(label, "property") and label.property("is_description"))
-                or (
-                    hasattr(label, "styleSheet") and "color: gray" in label.styleSheet()
-                )
-                or (
-                    isinstance(label.parent(), QWidget)
-                    and hasattr(label.parent(), "objectName")
-                    and "description" in label.parent().objectName().lower()
-                )
-            )
-            if is_description:
-                label.hide()
-                self.hidden_widgets.append(label)
+    @staticmethod
+    def _is_description(label: QWidget) -> bool:
+        """Check whether a widget was tagged as a description.
+
+        Widgets tagged with ``mark_description`` are matched on their dynamic
+        property; the older ``is_description`` property and ``description``
+        object names are still honoured.
+        """
+        return bool(
+            label.property(_ROLE_PROPERTY) == _DESCRIPTION_ROLE
+            or label.property("is_description")
+            or "description" in label.objectName().lower()
+        )
+
+    def invalidate_description_cache(self) -> None:
+        """Forget the cached description widgets.
+
+        Call this after adding or removing description labels on the page so
+        the next switch to compact mode scans the page again.
+        """
+        self._description_cache = None
 
     def _show_descriptions(self) -> None:
         """Show previously hidden widgets."""
@@ -163,20 +204,22 @@ class ResponsiveConfigLayout(QObject):
         layout.addWidget(content_widget)
         group.setLayout(layout)
 
-        # Style for collapsible indicator using StyleManager
-        group.setStyleSheet(StyleManager.get_group_box_style(collapsible=True))
+        # Style for collapsible indicator
+        group.setStyleSheet(GROUP_BOX_COLLAPSIBLE_STYLE)
 
-        # Update title with indicator
-        def update_title():
-            prefix = "▼" if group.isChecked() else "▶"
-            group.setTitle(f"{prefix} {title}")
+        # Update title with indicator, formatting both variants once
+        expanded_title = f"▼ {title}"
+        collapsed_title = f"▶ {title}"
+
+        def update_title(checked: bool) -> None:
+            group.setTitle(expanded_title if checked else collapsed_title)
 
         group.toggled.connect(update_title)
-        update_title()
+        update_title(group.isChecked())
 
         return group
 
-    def create_two_column_layout(self, items: List[QWidget]) -> QHBoxLayout:
+    def create_two_column_layout(self, items: List[QWidget]) -> QGridLayout:
         """Create a two-column layout for better space usage.
 
         Distributes widgets evenly between two columns, with the first half
@@ -186,38 +229,45 @@ class ResponsiveConfigLayout(QObject):
             items: List of widgets to arrange in two columns.
 
         Returns:
-            QHBoxLayout: A horizontal layout containing two columns of widgets.
+            QGridLayout: A single grid holding both columns of widgets.
         """
-        layout = QHBoxLayout()
-        layout.setSpacing(20)
-
-        # Create two columns
-        left_column = QVBoxLayout()
-        right_column = QVBoxLayout()
+        layout = QGridLayout()
+        layout.setHorizontalSpacing(20)
 
         # Distribute items between columns
-        for i, item in enumerate(items):
-            if i < len(items) // 2:
-                left_column.addWidget(item)
-            else:
-                right_column.addWidget(item)
-
-        # Add stretch to align items to top
-        left_column.addStretch()
-        right_column.addStretch()
+        mid = len(items) // 2
+        for row, item in enumerate(items[:mid]):
+            layout.addWidget(item, row, 0)
+        for row, item in enumerate(items[mid:]):
+            layout.addWidget(item, row, 1)
 
-        layout.addLayout(left_column)
-        layout.addLayout(right_column)
+        # Stretch the row below the items to align them to the top
+        layout.setRowStretch(len(items) - mid, 1)
+        layout.setColumnStretch(0, 1)
+        layout.setColumnStretch(1, 1)
 
         return layout
 
     def make_responsive(self) -> None:
-        """Make the config page responsive to size changes."""
+        """Make the config page responsive to size changes.
+
+        Resize events are coalesced: each one restarts a single-shot timer, so
+        a burst of events during a window drag results in one layout pass.
+        """
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(self.RESIZE_DEBOUNCE_MS)
+        self._resize_timer.timeout.connect(self._on_resize_settled)
+
         # Override the resizeEvent of the config page
         original_resize_event = self.config_page.resizeEvent
 
         def new_resize_event(event):
             original_resize_event(event)
-            self.adjust_for_size(event.size().width(), event.size().height())
+            self._resize_timer.start()
 
         self.config_page.resizeEvent = new_resize_event
+
+    def _on_resize_settled(self) -> None:
+        """Adjust the layout once resizing has gone quiet."""
+        self.adjust_for_size(self.config_page.width(), self.config_page.height())
@@ -4,14 +4,18 @@ This module provides a simple service locator pattern to manage dependencies
 across the application, making it easier to test and maintain.
 """
 
+import threading
 from functools import wraps
-from typing import Any, Callable, Dict, Optional, Type, TypeVar
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
 
 from wes.core.config_manager import ConfigManager
 from wes.utils.logging_config import get_logger
 
 T = TypeVar("T")
 
+# Sentinel for lookups where None is a valid registered service
+_MISSING = object()
+
 
 class ServiceNotFoundError(Exception):
     """Raised when a requested service is not found."""
@@ -20,10 +24,26 @@ class ServiceNotFoundError(Exception):
 class ServiceLocator:
     """Service locator for managing application dependencies."""
 
-    def __init__(self):
-        """Initialize the service locator."""
+    def __init__(
+        self, default_factories: Optional[Dict[Type, Callable[[], Any]]] = None
+    ):
+        """Initialize the service locator.
+
+        Args:
+            default_factories: Factories consulted only when a requested
+                service has no registered instance or factory.
+        """
         self._services: Dict[Type, Any] = {}
         self._factories: Dict[Type, Callable[[], Any]] = {}
+        self._default_factories: Dict[Type, Callable[[], Any]] = dict(
+            default_factories or {}
+        )
+        # Bumped whenever registrations change so callers can drop cached
+        # instances (see inject)
+        self.version = 0
+        # Open ServiceScopes, innermost last
+        self._scopes: List["ServiceScope"] = []
+        self._lock = threading.RLock()
         self.logger = get_logger(__name__)
 
     def register(self, service_type: Type[T], instance: T) -> None:
@@ -34,7 +54,8 @@ class ServiceLocator:
             instance: The service instance.
         """
         self._services[service_type] = instance
-        self.logger.debug(f"Registered service: {service_type.__name__}")
+        self.version += 1
+        self.logger.debug("Registered service: %s", service_type.__name__)
 
     def register_factory(self, service_type: Type[T], factory: Callable[[], T]) -> None:
         """Register a factory function for lazy service creation.
@@ -44,7 +65,8 @@ class ServiceLocator:
             factory: A callable that creates the service instance.
         """
         self._factories[service_type] = factory
-        self.logger.debug(f"Registered factory for: {service_type.__name__}")
+        self.version += 1
+        self.logger.debug("Registered factory for: %s", service_type.__name__)
 
     def get(self, service_type: Type[T]) -> T:
         """Get a service instance.
@@ -59,16 +81,31 @@ class ServiceLocator:
             ServiceNotFoundError: If the service is not registered.
         """
         # Check if we have an instance
-        if service_type in self._services:
-            return self._services[service_type]
-
-        # Check if we have a factory
-        if service_type in self._factories:
-            # Create and cache the instance
-            instance = self._factories[service_type]()
-            self._services[service_type] = instance
+        instance = self._services.get(service_type, _MISSING)
+        if instance is not _MISSING:
             return instance
 
+        # Resolve through a factory under the lock so concurrent callers
+        # build the instance only once. Re-entrant, since a factory may
+        # itself request other services.
+        with self._lock:
+            instance = self._services.get(service_type, _MISSING)
+            if instance is not _MISSING:
+                return instance
+
+            # Check if we have a factory, falling back to the defaults
+            factory = self._factories.get(service_type)
+            if factory is None:
+                factory = self._default_factories.get(service_type)
+            if factory is not None:
+                # Create and cache the instance; an open scope drops it again
+                # on exit
+                instance = factory()
+                if self._scopes:
+                    self._scopes[-1]._record(self._services, service_type)
+                self._services[service_type] = instance
+                return instance
+
         raise ServiceNotFoundError(
             f"Service not found: {service_type.__name__}. "
             f"Available services: {list(self._services.keys())}"
@@ -95,6 +132,8 @@ class ServiceLocator:
         """Clear all registered services (useful for testing)."""
         self._services.clear()
         self._factories.clear()
+        self._default_factories.clear()
+        self.version += 1
 
     def remove(self, service_type: Type) -> None:
         """Remove a specific service.
@@ -104,10 +143,13 @@ class ServiceLocator:
         """
         self._services.pop(service_type, None)
         self._factories.pop(service_type, None)
+        self._default_factories.pop(service_type, None)
+        self.version += 1
 
 
-# Global service locator instance
-_service_locator = ServiceLocator()
+# Global service locator instance. Default services are only created the
+# first time they are requested.
+_service_locator = ServiceLocator(default_factories={ConfigManager: ConfigManager})
 
 
 def get_service(service_type: Type[T]) -> T:
@@ -158,13 +200,20 @@ def inject(service_type: Type[T]) -> Callable:
         Decorator function.
     """
 
+    service_name = service_type.__name__.lower()
+
     def decorator(func: Callable) -> Callable:
+        # Resolved service and the locator version it was resolved at
+        cached: list = [_MISSING, -1]
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             # Inject the service as a keyword argument
-            service_name = service_type.__name__.lower()
             if service_name not in kwargs:
-                kwargs[service_name] = get_service(service_type)
+                if cached[1] != _service_locator.version:
+                    cached[0] = get_service(service_type)
+                    cached[1] = _service_locator.version
+                kwargs[service_name] = cached[0]
             return func(*args, **kwargs)
 
         return wrapper
@@ -173,40 +222,61 @@ def inject(service_type: Type[T]) -> Callable:
 
 
 class ServiceScope:
-    """Context manager for temporary service registration."""
+    """Context manager for temporary service registration.
+
+    Only the entries changed while the scope is open are recorded, including
+    instances created lazily by factories, and they are rolled back in reverse
+    order on exit.
+    """
 
     def __init__(self):
         """Initialize the service scope."""
-        self._original_services: Dict[Type, Any] = {}
-        self._original_factories: Dict[Type, Callable[[], Any]] = {}
+        self._journal: List[Tuple[Dict[Type, Any], Type, Any]] = []
 
     def __enter__(self):
-        """Enter the scope, saving current services."""
-        self._original_services = _service_locator._services.copy()
-        self._original_factories = _service_locator._factories.copy()
+        """Enter the scope with an empty journal."""
+        self._journal = []
+        _service_locator._scopes.append(self)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Exit the scope, restoring original services."""
         _ = exc_type, exc_val, exc_tb  # Unused but required by protocol
-        _service_locator._services = self._original_services
-        _service_locator._factories = self._original_factories
+        _service_locator._scopes.remove(self)
+        for registry, service_type, old in reversed(self._journal):
+            if old is _MISSING:
+                registry.pop(service_type, None)
+            else:
+                registry[service_type] = old
+        self._journal = []
+        _service_locator.version += 1
+
+    def _record(self, registry: Dict[Type, Any], service_type: Type) -> None:
+        """Remember the current entry for a service before it changes."""
+        self._journal.append(
+            (registry, service_type, registry.get(service_type, _MISSING))
+        )
 
     def register(self, service_type: Type[T], instance: T) -> None:
         """Register a service within this scope."""
+        self._record(_service_locator._services, service_type)
         _service_locator.register(service_type, instance)
 
     def register_factory(self, service_type: Type[T], factory: Callable[[], T]) -> None:
         """Register a factory within this scope."""
+        # The instance the factory creates is cached in _services, so both
+        # entries are rolled back
+        self._record(_service_locator._services, service_type)
+        self._record(_service_locator._factories, service_type)
         _service_locator.register_factory(service_type, factory)
 
 
 # Initialize default services
 def initialize_default_services():
-    """Initialize default services for the application."""
+    """Initialize default services for the application.
+
+    The global locator already falls back to these factories on first use, so
+    calling this is only needed after the locator has been cleared.
+    """
     # Register ConfigManager factory
     register_service_factory(ConfigManager, lambda: ConfigManager())
-
-
-# Call on module import
-initialize_default_services()
@@ -2,8 +2,14 @@
 
 This module provides consistent styling across all UI components to improve
 maintainability and ensure a cohesive visual design.
+
+Stylesheets only depend on the class-level palette, so each one is built once
+per variant and then reused.
 """
 
+from functools import lru_cache
+from typing import ClassVar, Dict, Final, NamedTuple, Tuple
+
 
 class StyleManager:
     """Manages application-wide styles and themes."""
@@ -57,60 +63,18 @@ class StyleManager:
         Returns:
             QString: CSS stylesheet for the button.
         """
-        if variant == "primary":
-            return f"""
-                QPushButton {{
-                    background-color: {cls.COLORS['primary']};
-                    color: white;
-                    font-weight: bold;
-                    padding: 5px 15px;
-                    border-radius: 3px;
-                    border: none;
-                }}
-                QPushButton:hover {{
-                    background-color: {cls.COLORS['primary_hover']};
-                }}
-                QPushButton:pressed {{
-                    background-color: {cls.COLORS['primary_pressed']};
-                }}
-                QPushButton:disabled {{
-                    background-color: {cls.COLORS['text_muted']};
-                    color: {cls.COLORS['background_secondary']};
-                }}
-            """
-        elif variant == "secondary":
-            return f"""
-                QPushButton {{
-                    background-color: {cls.COLORS['background']};
-                    color: {cls.COLORS['text_primary']};
-                    padding: 5px 15px;
-                    border-radius: 3px;
-                    border: 1px solid {cls.COLORS['border']};
-                }}
-                QPushButton:hover {{
-                    background-color: {cls.COLORS['background_secondary']};
-                }}
-                QPushButton:pressed {{
-                    background-color: {cls.COLORS['border_light']};
-                }}
-            """
-        elif variant == "danger":
-            return f"""
-                QPushButton {{
-                    background-color: {cls.COLORS['danger']};
-                    color: white;
-                    padding: 5px 15px;
-                    border-radius: 3px;
-                    border: none;
-                }}
-                QPushButton:hover {{
-                    background-color: #c82333;
-                }}
-                QPushButton:pressed {{
-                    background-color: #bd2130;
-                }}
-            """
-        return ""
+        return _BUTTON_STYLES.get(variant, "")
+
+    # Finished label stylesheets per variant; unknown variants use "default"
+    _LABEL_STYLES: ClassVar[Dict[str, str]] = {
+        "success": f"color: {COLORS['success']};",
+        "warning": f"color: {COLORS['warning']};",
+        "danger": f"color: {COLORS['danger']};",
+        "info": f"color: {COLORS['info']};",
+        "muted": f"color: {COLORS['text_muted']};",
+        "secondary": f"color: {COLORS['text_secondary']};",
+        "default": f"color: {COLORS['text_primary']};",
+    }
 
     @classmethod
     def get_label_style(cls, variant: str = "default") -> str:
@@ -122,17 +86,8 @@ class StyleManager:
         Returns:
             QString: CSS stylesheet for the label.
         """
-        color_map = {
-            "success": cls.COLORS["success"],
-            "warning": cls.COLORS["warning"],
-            "danger": cls.COLORS["danger"],
-            "info": cls.COLORS["info"],
-            "muted": cls.COLORS["text_muted"],
-            "secondary": cls.COLORS["text_secondary"],
-        }
-
-        color = color_map.get(variant, cls.COLORS["text_primary"])
-        return f"color: {color};"
+        styles = cls._LABEL_STYLES
+        return styles.get(variant) or styles["default"]
 
     @classmethod
     def get_group_box_style(cls, collapsible: bool = False) -> str:
@@ -144,30 +99,7 @@ class StyleManager:
         Returns:
             QString: CSS stylesheet for the group box.
         """
-        base_style = f"""
-            QGroupBox {{
-                font-weight: bold;
-                border: 1px solid {cls.COLORS['border']};
-                border-radius: 4px;
-                margin-top: 12px;
-                padding-top: 16px;
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }}
-        """
-
-        if collapsible:
-            base_style += """
-                QGroupBox::indicator {
-                    width: 13px;
-                    height: 13px;
-                }
-            """
-
-        return base_style
+        return GROUP_BOX_COLLAPSIBLE_STYLE if collapsible else GROUP_BOX_STYLE
 
     @classmethod
     def get_scroll_area_style(cls) -> str:
@@ -176,38 +108,7 @@ class StyleManager:
         Returns:
             QString: CSS stylesheet for scroll areas.
         """
-        return f"""
-            QScrollArea {{
-                border: none;
-                background-color: transparent;
-            }}
-            QScrollBar:vertical {{
-                width: 12px;
-                background: {cls.COLORS['background_secondary']};
-                border-radius: 6px;
-            }}
-            QScrollBar::handle:vertical {{
-                background: {cls.COLORS['border']};
-                border-radius: 6px;
-                min-height: 20px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background: {cls.COLORS['text_muted']};
-            }}
-            QScrollBar:horizontal {{
-                height: 12px;
-                background: {cls.COLORS['background_secondary']};
-                border-radius: 6px;
-            }}
-            QScrollBar::handle:horizontal {{
-                background: {cls.COLORS['border']};
-                border-radius: 6px;
-                min-width: 20px;
-            }}
-            QScrollBar::handle:horizontal:hover {{
-                background: {cls.COLORS['text_muted']};
-            }}
-        """
+        return SCROLL_AREA_STYLE
 
     @classmethod
     def get_compact_mode_style(cls) -> str:
@@ -216,35 +117,7 @@ class StyleManager:
         Returns:
             QString: CSS stylesheet for compact mode.
         """
-        return f"""
-            QLabel {{
-                font-size: {cls.FONT_SIZES['small']};
-                padding: 1px;
-            }}
-            QLineEdit {{
-                padding: 2px;
-                font-size: {cls.FONT_SIZES['small']};
-            }}
-            QPushButton {{
-                padding: 4px 8px;
-                font-size: {cls.FONT_SIZES['small']};
-            }}
-            QGroupBox {{
-                margin-top: 8px;
-                padding-top: 8px;
-            }}
-            QGroupBox::title {{
-                font-size: {cls.FONT_SIZES['normal']};
-            }}
-            QCheckBox, QRadioButton {{
-                font-size: {cls.FONT_SIZES['small']};
-                spacing: 3px;
-            }}
-            QSpinBox, QComboBox {{
-                padding: 2px;
-                font-size: {cls.FONT_SIZES['small']};
-            }}
-        """
+        return COMPACT_MODE_STYLE
 
     @classmethod
     def get_dialog_header_style(cls) -> str:
@@ -253,47 +126,245 @@ class StyleManager:
         Returns:
             QString: CSS stylesheet for dialog headers.
         """
-        return f"""
-            #configHeader {{
-                background-color: {cls.COLORS['background_secondary']};
-                border-bottom: 1px solid {cls.COLORS['border']};
-            }}
-            #modeLabel {{
-                font-size: {cls.FONT_SIZES['large']};
-                font-weight: bold;
-            }}
-            #buttonArea {{
-                background-color: {cls.COLORS['background_secondary']};
-                border-top: 1px solid {cls.COLORS['border']};
-            }}
+        return DIALOG_HEADER_STYLE
+
+    @classmethod
+    @lru_cache(maxsize=32)
+    def get_combined_style(cls, *fragments: str) -> str:
+        """Get one stylesheet made of several named fragments.
+
+        Lets a widget be styled with a single ``setStyleSheet`` call, so Qt
+        parses the sheet once.
+
+        Args:
+            *fragments: Fragment names, in order (e.g. 'header', 'scroll_area',
+                'compact', 'group_box', 'button_primary').
+
+        Returns:
+            QString: CSS stylesheet combining the fragments.
+
+        Raises:
+            ValueError: If a fragment name is unknown.
         """
+        try:
+            return "".join([STYLE_FRAGMENTS[fragment] for fragment in fragments])
+        except KeyError as e:
+            raise ValueError(f"Unknown style fragment: {e.args[0]}") from None
+
+
+# Precomputed stylesheets. These are built once at import; the StyleManager
+# getters above return them for existing callers.
+_C = StyleManager.COLORS
+_F = StyleManager.FONT_SIZES
+
+# Button stylesheets: one template, filled per variant
+_BUTTON_TEMPLATE = """
+    QPushButton {{
+        background-color: {bg};
+        color: {fg};
+        font-weight: {weight};
+        padding: 5px 15px;
+        border-radius: 3px;
+        border: {border};
+    }}
+    QPushButton:hover {{
+        background-color: {hover};
+    }}
+    QPushButton:pressed {{
+        background-color: {pressed};
+    }}
+"""
+
+# Primary buttons also restyle their disabled state
+_BUTTON_DISABLED_TEMPLATE = """
+    QPushButton:disabled {{
+        background-color: {bg};
+        color: {fg};
+    }}
+"""
+
+BUTTON_PRIMARY_STYLE: Final[str] = _BUTTON_TEMPLATE.format(
+    bg=_C["primary"],
+    fg="white",
+    weight="bold",
+    border="none",
+    hover=_C["primary_hover"],
+    pressed=_C["primary_pressed"],
+) + _BUTTON_DISABLED_TEMPLATE.format(
+    bg=_C["text_muted"],
+    fg=_C["background_secondary"],
+)
+
+BUTTON_SECONDARY_STYLE: Final[str] = _BUTTON_TEMPLATE.format(
+    bg=_C["background"],
+    fg=_C["text_primary"],
+    weight="normal",
+    border=f"1px solid {_C['border']}",
+    hover=_C["background_secondary"],
+    pressed=_C["border_light"],
+)
+
+BUTTON_DANGER_STYLE: Final[str] = _BUTTON_TEMPLATE.format(
+    bg=_C["danger"],
+    fg="white",
+    weight="normal",
+    border="none",
+    hover="#c82333",
+    pressed="#bd2130",
+)
+
+# Button stylesheets by variant, for StyleManager.get_button_style
+_BUTTON_STYLES: Final[Dict[str, str]] = {
+    "primary": BUTTON_PRIMARY_STYLE,
+    "secondary": BUTTON_SECONDARY_STYLE,
+    "danger": BUTTON_DANGER_STYLE,
+}
+
+GROUP_BOX_STYLE = f"""
+    QGroupBox {{
+        font-weight: bold;
+        border: 1px solid {_C['border']};
+        border-radius: 4px;
+        margin-top: 12px;
+        padding-top: 16px;
+    }}
+    QGroupBox::title {{
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+    }}
+"""
+
+GROUP_BOX_COLLAPSIBLE_STYLE: Final[str] = (
+    GROUP_BOX_STYLE
+    + """
+    QGroupBox::indicator {
+        width: 13px;
+        height: 13px;
+    }
+"""
+)
+
+SCROLL_AREA_STYLE = f"""
+    QScrollArea {{
+        border: none;
+        background-color: transparent;
+    }}
+    QScrollBar:vertical {{
+        width: 12px;
+        background: {_C['background_secondary']};
+        border-radius: 6px;
+    }}
+    QScrollBar::handle:vertical {{
+        background: {_C['border']};
+        border-radius: 6px;
+        min-height: 20px;
+    }}
+    QScrollBar::handle:vertical:hover {{
+        background: {_C['text_muted']};
+    }}
+    QScrollBar:horizontal {{
+        height: 12px;
+        background: {_C['background_secondary']};
+        border-radius: 6px;
+    }}
+    QScrollBar::handle:horizontal {{
+        background: {_C['border']};
+        border-radius: 6px;
+        min-width: 20px;
+    }}
+    QScrollBar::handle:horizontal:hover {{
+        background: {_C['text_muted']};
+    }}
+"""
+
+COMPACT_MODE_STYLE = f"""
+    QLabel {{
+        font-size: {_F['small']};
+        padding: 1px;
+    }}
+    QLineEdit {{
+        padding: 2px;
+        font-size: {_F['small']};
+    }}
+    QPushButton {{
+        padding: 4px 8px;
+        font-size: {_F['small']};
+    }}
+    QGroupBox {{
+        margin-top: 8px;
+        padding-top: 8px;
+    }}
+    QGroupBox::title {{
+        font-size: {_F['normal']};
+    }}
+    QCheckBox, QRadioButton {{
+        font-size: {_F['small']};
+        spacing: 3px;
+    }}
+    QSpinBox, QComboBox {{
+        padding: 2px;
+        font-size: {_F['small']};
+    }}
+"""
+
+DIALOG_HEADER_STYLE = f"""
+    #configHeader {{
+        background-color: {_C['background_secondary']};
+        border-bottom: 1px solid {_C['border']};
+    }}
+    #modeLabel {{
+        font-size: {_F['large']};
+        font-weight: bold;
+    }}
+    #buttonArea {{
+        background-color: {_C['background_secondary']};
+        border-top: 1px solid {_C['border']};
+    }}
+"""
+
+# Stylesheet fragments by name, for StyleManager.get_combined_style
+STYLE_FRAGMENTS: Final[Dict[str, str]] = {
+    "header": DIALOG_HEADER_STYLE,
+    "scroll_area": SCROLL_AREA_STYLE,
+    "compact": COMPACT_MODE_STYLE,
+    "group_box": GROUP_BOX_STYLE,
+    "group_box_collapsible": GROUP_BOX_COLLAPSIBLE_STYLE,
+    "button_primary": BUTTON_PRIMARY_STYLE,
+    "button_secondary": BUTTON_SECONDARY_STYLE,
+    "button_danger": BUTTON_DANGER_STYLE,
+}
+
+
+class DialogSizes(NamedTuple):
+    """Preset (width, height) dialog sizes."""
+
+    small: Tuple[int, int] = (400, 300)
+    medium: Tuple[int, int] = (600, 500)
+    large: Tuple[int, int] = (800, 600)
+    xlarge: Tuple[int, int] = (1000, 800)
 
 
 class StyleConstants:
     """Constants for consistent styling across the application."""
 
-    # Dialog Sizes
-    DIALOG_SIZES = {
-        "small": (400, 300),
-        "medium": (600, 500),
-        "large": (800, 600),
-        "xlarge": (1000, 800),
-    }
+    # Dialog Sizes, e.g. StyleConstants.DIALOG_SIZES.medium
+    DIALOG_SIZES: Final[DialogSizes] = DialogSizes()
 
     # Minimum Sizes
-    MIN_DIALOG_SIZE = (600, 400)
-    MIN_BUTTON_WIDTH = 80
+    MIN_DIALOG_SIZE: Final[Tuple[int, int]] = (600, 400)
+    MIN_BUTTON_WIDTH: Final[int] = 80
 
     # Maximum Sizes
-    MAX_INSTRUCTION_HEIGHT = 150
-    MAX_DESCRIPTION_WIDTH = 600
+    MAX_INSTRUCTION_HEIGHT: Final[int] = 150
+    MAX_DESCRIPTION_WIDTH: Final[int] = 600
 
     # Layout Constants
-    DEFAULT_SPACING = 10
-    COMPACT_SPACING = 5
-    FORM_SPACING = 15
+    DEFAULT_SPACING: Final[int] = 10
+    COMPACT_SPACING: Final[int] = 5
+    FORM_SPACING: Final[int] = 15
 
     # Animation Durations (ms)
-    ANIMATION_FAST = 150
-    ANIMATION_NORMAL = 300
-    ANIMATION_SLOW = 500
+    ANIMATION_FAST: Final[int] = 150
+    ANIMATION_NORMAL: Final[int] = 300
+    ANIMATION_SLOW: Final[int] = 500
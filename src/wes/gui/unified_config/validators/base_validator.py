@@ -1,17 +1,104 @@
 """Base validator class for configuration validation."""
 
-from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, Tuple
+from functools import wraps
+from typing import Any, Callable, Dict, Final, Optional, Sequence, Tuple
 
 from wes.gui.unified_config.types import ServiceType, ValidationResult
 
-
-class BaseValidator(ABC):
-    """Abstract base class for service validators."""
+# Maximum number of remembered results per validator before the cache resets
+VALIDATION_CACHE_SIZE = 128
+
+# "<field> is required" messages for the known config fields, built once
+_REQUIRED_MSGS: Dict[str, str] = {
+    field: f"{field} is required"
+    for field in ("url", "username", "api_token", "api_key", "model")
+}
+
+# Shared success result for fields without a more specific message
+_FIELD_VALID: Final[Tuple[bool, str]] = (True, "Valid")
+
+
+def required_message(field_name: str) -> str:
+    """Return the "is required" message for a field."""
+    message = _REQUIRED_MSGS.get(field_name)
+    if message is None:
+        message = f"{field_name} is required"
+    return message
+
+
+def memoize_config(
+    method: Callable[[Any, Dict[str, Any]], ValidationResult],
+) -> Callable[[Any, Dict[str, Any]], ValidationResult]:
+    """Remember ``validate_config`` results for identical configurations.
+
+    Configurations are keyed by their items, so only configs with hashable
+    values are cached; anything else is validated directly. Callers get a
+    copy of the cached result, details included, so they can modify it
+    freely.
+    """
+
+    @wraps(method)
+    def wrapper(self, config: Dict[str, Any]) -> ValidationResult:
+        try:
+            key = frozenset(config.items())
+        except (AttributeError, TypeError):
+            return method(self, config)
+
+        cache = self._config_cache
+        result = cache.get(key)
+        if result is None:
+            if len(cache) >= VALIDATION_CACHE_SIZE:
+                cache.clear()
+            result = cache[key] = method(self, config)
+        copied = result.copy()
+        if copied.get("details") is not None:
+            copied["details"] = dict(copied["details"])
+        return copied
+
+    return wrapper
+
+
+def memoize_field(
+    method: Callable[[Any, str, Any], Tuple[bool, str]],
+) -> Callable[[Any, str, Any], Tuple[bool, str]]:
+    """Remember ``validate_field`` results for identical field values."""
+
+    @wraps(method)
+    def wrapper(self, field_name: str, value: Any) -> Tuple[bool, str]:
+        key = (field_name, value)
+        cache = self._field_cache
+        try:
+            result = cache.get(key)
+        except TypeError:
+            # Unhashable values are validated directly
+            return method(self, field_name, value)
+
+        if result is None:
+            if len(cache) >= VALIDATION_CACHE_SIZE:
+                cache.clear()
+            result = cache[key] = method(self, field_name, value)
+        return result
+
+    return wrapper
+
+
+class BaseValidator:
+    """Base class for service validators."""
+
+    # Validators are long-lived singletons; only the result caches are state
+    __slots__ = ("_config_cache", "_field_cache")
 
     service_type: ServiceType = None
 
-    @abstractmethod
+    def __init__(self) -> None:
+        self._config_cache: Dict[frozenset, ValidationResult] = {}
+        self._field_cache: Dict[Tuple[str, Any], Tuple[bool, str]] = {}
+
+    def clear_cache(self) -> None:
+        """Forget remembered validation results."""
+        self._config_cache.clear()
+        self._field_cache.clear()
+
     def validate_config(self, config: Dict[str, Any]) -> ValidationResult:
         """
         Validate service configuration.
@@ -22,8 +109,8 @@ class BaseValidator(ABC):
         Returns:
             ValidationResult with validation status and details
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def validate_connection(self, config: Dict[str, Any]) -> Tuple[bool, str]:
         """
         Test connection to the service.
@@ -34,6 +121,7 @@ class BaseValidator(ABC):
         Returns:
             Tuple of (success, message)
         """
+        raise NotImplementedError
 
     def validate_field(self, field_name: str, value: Any) -> Tuple[bool, str]:
         """
@@ -48,27 +136,27 @@ class BaseValidator(ABC):
         """
         # Default implementation - override in subclasses
         if not value:
-            return False, f"{field_name} is required"
-        return True, "Valid"
+            return False, required_message(field_name)
+        return _FIELD_VALID
 
     def check_required_fields(
-        self, config: Dict[str, Any], required_fields: list[str]
+        self, config: Dict[str, Any], required_fields: Sequence[str]
     ) -> Optional[ValidationResult]:
         """
         Check if all required fields are present and non-empty.
 
         Args:
             config: Configuration dictionary
-            required_fields: List of required field names
+            required_fields: Required field names, checked in order
 
         Returns:
             ValidationResult if validation fails, None if all fields present
         """
         for field in required_fields:
-            if field not in config or not config[field]:
+            if not config.get(field):
                 return ValidationResult(
                     is_valid=False,
-                    message=f"{field} is required",
+                    message=required_message(field),
                     service=self.service_type,
                     details={"field": field},
                 )
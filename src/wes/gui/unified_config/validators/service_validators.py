@@ -1,28 +1,79 @@
 """Service-specific validators for configuration validation."""
 
+import importlib
 import re
-from typing import Any, Dict, Tuple
-from urllib.parse import urlparse
+import string
+from functools import lru_cache
+from types import ModuleType
+from typing import Any, ClassVar, Dict, Final, FrozenSet, Optional, Tuple
 
 from wes.gui.unified_config.types import JiraType, ServiceType, ValidationResult
-from wes.gui.unified_config.validators.base_validator import BaseValidator
+from wes.gui.unified_config.validators.base_validator import (
+    BaseValidator,
+    memoize_config,
+    memoize_field,
+)
+
+# Translation tables deleting each field's allowed characters; anything left
+# over after str.translate is an invalid character
+_USERNAME_DELETE = str.maketrans("", "", string.ascii_letters + string.digits + "._@-")
+_GEMINI_KEY_DELETE = str.maketrans("", "", string.ascii_letters + string.digits + "-_")
+
+# Integration clients pull in heavy third-party libraries, so their modules
+# are imported on the first connection test rather than with this module
+_JIRA_CLIENT_MODULE = "wes.integrations.jira_client"
+_REDHAT_JIRA_CLIENT_MODULE = "wes.integrations.redhat_jira_client"
+_GEMINI_CLIENT_MODULE = "wes.integrations.gemini_client"
+
+# Case-insensitive "jira" hint in URLs, matched without lowercasing a copy
+_JIRA_URL_HINT = re.compile("jira", re.IGNORECASE)
+
+# Field validation success results, shared across calls
+_URL_ATLASSIAN: Final[Tuple[bool, str]] = (True, "Atlassian Cloud URL detected")
+_URL_JIRA: Final[Tuple[bool, str]] = (True, "Valid Jira URL")
+_URL_VALID: Final[Tuple[bool, str]] = (True, "URL format is valid")
+_USERNAME_VALID: Final[Tuple[bool, str]] = (True, "Username is valid")
+_TOKEN_VALID: Final[Tuple[bool, str]] = (True, "Token format is valid")
+_API_KEY_VALID: Final[Tuple[bool, str]] = (True, "API key format is valid")
+
+# Jira type members by config value, avoiding the Enum call machinery
+_JIRA_TYPE_BY_VALUE: Dict[str, JiraType] = {member.value: member for member in JiraType}
+
+
+def _jira_type(config: Dict[str, Any]) -> JiraType:
+    """Return the Jira type named in a config, defaulting to cloud."""
+    value = config.get("type", "cloud")
+    try:
+        return _JIRA_TYPE_BY_VALUE[value]
+    except (KeyError, TypeError):
+        # Enum members and invalid values take the regular (raising) path
+        return JiraType(value)
+
+
+@lru_cache(maxsize=None)
+def _client_module(name: str) -> ModuleType:
+    """Import an integration client module once and reuse it."""
+    return importlib.import_module(name)
 
 
 class JiraValidator(BaseValidator):
     """Validator for Jira configuration."""
 
+    __slots__ = ()
+
     service_type = ServiceType.JIRA
 
+    # All Jira types require API tokens
+    _REQUIRED_FIELDS: ClassVar[Tuple[str, ...]] = ("url", "username", "api_token")
+
+    @memoize_config
     def validate_config(self, config: Dict[str, Any]) -> ValidationResult:
         """Validate Jira configuration."""
         # Get Jira type
-        jira_type = JiraType(config.get("type", "cloud"))
-
-        # Define required fields (all Jira types require API tokens)
-        required_fields = ["url", "username", "api_token"]
+        jira_type = _jira_type(config)
 
         # Check required fields
-        result = self.check_required_fields(config, required_fields)
+        result = self.check_required_fields(config, self._REQUIRED_FIELDS)
         if result:
             return result
 
@@ -58,18 +109,14 @@ class JiraValidator(BaseValidator):
     def validate_connection(self, config: Dict[str, Any]) -> Tuple[bool, str]:
         """Test Jira connection."""
         try:
-            # Import here to avoid circular imports
-            from wes.integrations.jira_client import JiraClient
-
             # Create client based on type
-            jira_type = JiraType(config.get("type", "cloud"))
+            jira_type = _jira_type(config)
 
             if jira_type == JiraType.REDHAT:
                 # Red Hat Jira uses different client
                 try:
-                    from wes.integrations.redhat_jira_client import RedHatJiraClient
-
-                    client = RedHatJiraClient(
+                    redhat_module = _client_module(_REDHAT_JIRA_CLIENT_MODULE)
+                    client = redhat_module.RedHatJiraClient(
                         url=config["url"],
                         username=config["username"],
                         api_token=config["api_token"],
@@ -77,7 +124,7 @@ class JiraValidator(BaseValidator):
                 except ImportError:
                     return False, "Red Hat Jira support not installed"
             else:
-                client = JiraClient(
+                client = _client_module(_JIRA_CLIENT_MODULE).JiraClient(
                     server_url=config["url"],
                     username=config["username"],
                     api_token=config.get("api_token", ""),
@@ -90,6 +137,7 @@ class JiraValidator(BaseValidator):
         except Exception as e:
             return False, f"Connection failed: {str(e)}"
 
+    @memoize_field
     def validate_field(self, field_name: str, value: Any) -> Tuple[bool, str]:
         """Validate specific Jira field."""
         if field_name == "url":
@@ -102,13 +150,25 @@ class JiraValidator(BaseValidator):
             return super().validate_field(field_name, value)
 
     def _is_valid_url(self, url: str) -> bool:
-        """Check if URL is valid."""
-        try:
-            result = urlparse(url)
-            return all([result.scheme in ["http", "https"], result.netloc])
-        except Exception:
+        """Check if URL is valid.
+
+        Equivalent to requiring an http(s) scheme and a non-empty network
+        location from ``urlparse``, without building a parse result.
+        """
+        if not isinstance(url, str):
+            return False
+
+        scheme = url[:8].lower()
+        if scheme.startswith("https://"):
+            rest = url[8:]
+        elif scheme.startswith("http://"):
+            rest = url[7:]
+        else:
             return False
 
+        # The network location runs up to the first path, query or fragment
+        return bool(rest) and rest[0] not in "/?#"
+
     def _validate_url(self, url: str) -> Tuple[bool, str]:
         """Validate Jira URL."""
         if not url:
@@ -119,11 +179,11 @@ class JiraValidator(BaseValidator):
 
         # Check for common Jira patterns
         if "atlassian.net" in url:
-            return True, "Atlassian Cloud URL detected"
-        elif "jira" in url.lower():
-            return True, "Valid Jira URL"
+            return _URL_ATLASSIAN
+        elif _JIRA_URL_HINT.search(url):
+            return _URL_JIRA
 
-        return True, "URL format is valid"
+        return _URL_VALID
 
     def _validate_username(self, username: str) -> Tuple[bool, str]:
         """Validate username."""
@@ -137,12 +197,10 @@ class JiraValidator(BaseValidator):
         # Allow alphanumeric, hyphens, underscores, dots, and @ symbols
         # This supports various formats including Red Hat usernames like
         # rhn-support-admiller
-        import re
-
-        if not re.match(r"^[a-zA-Z0-9._@-]+$", username):
+        if username.translate(_USERNAME_DELETE):
             return False, "Username contains invalid characters"
 
-        return True, "Username is valid"
+        return _USERNAME_VALID
 
     def _validate_api_token(self, token: str) -> Tuple[bool, str]:
         """Validate API token."""
@@ -152,18 +210,29 @@ class JiraValidator(BaseValidator):
         if len(token) < 20:
             return False, "API token appears too short"
 
-        return True, "Token format is valid"
+        return _TOKEN_VALID
 
 
 class GeminiValidator(BaseValidator):
     """Validator for Gemini AI configuration."""
 
+    __slots__ = ()
+
     service_type = ServiceType.GEMINI
 
+    _REQUIRED_FIELDS: ClassVar[Tuple[str, ...]] = ("api_key",)
+    _VALID_MODELS: ClassVar[FrozenSet[str]] = frozenset(
+        {"gemini-2.5-pro", "gemini-2.5-flash"}
+    )
+    _INVALID_MODEL_MESSAGE: ClassVar[str] = (
+        f"Invalid model. Must be one of: {', '.join(sorted(_VALID_MODELS))}"
+    )
+
+    @memoize_config
     def validate_config(self, config: Dict[str, Any]) -> ValidationResult:
         """Validate Gemini configuration."""
         # Check required fields
-        result = self.check_required_fields(config, ["api_key"])
+        result = self.check_required_fields(config, self._REQUIRED_FIELDS)
         if result:
             return result
 
@@ -189,11 +258,10 @@ class GeminiValidator(BaseValidator):
             )
 
         # Validate model name
-        valid_models = ["gemini-2.5-pro", "gemini-2.5-flash"]
-        if model not in valid_models:
+        if model not in self._VALID_MODELS:
             return ValidationResult(
                 is_valid=False,
-                message=f"Invalid model. Must be one of: {', '.join(valid_models)}",
+                message=self._INVALID_MODEL_MESSAGE,
                 service=self.service_type,
                 details={"field": "model", "value": model},
             )
@@ -218,11 +286,8 @@ class GeminiValidator(BaseValidator):
     def validate_connection(self, config: Dict[str, Any]) -> Tuple[bool, str]:
         """Test Gemini AI connection."""
         try:
-            # Import here to avoid circular imports
-            from wes.integrations.gemini_client import GeminiClient
-
             # Create client
-            client = GeminiClient(
+            client = _client_module(_GEMINI_CLIENT_MODULE).GeminiClient(
                 api_key=config["api_key"], model=config.get("model", "gemini-2.5-pro")
             )
 
@@ -243,23 +308,24 @@ class GeminiValidator(BaseValidator):
             return False, "Invalid API key format (should start with 'AIza')"
 
         # Check for valid characters first
-        if not re.match(r"^[A-Za-z0-9\-_]+$", api_key):
+        if api_key.translate(_GEMINI_KEY_DELETE):
             return False, "API key contains invalid characters"
 
         # Check length
         if len(api_key) < 30:
             return False, "API key appears too short"
 
-        return True, "API key format is valid"
-
+        return _API_KEY_VALID
 
-# Validator registry
-VALIDATORS = {
-    ServiceType.JIRA: JiraValidator(),
-    ServiceType.GEMINI: GeminiValidator(),
-}
 
+@lru_cache(maxsize=None)
+def get_validator(service_type: ServiceType) -> Optional[BaseValidator]:
+    """Get validator for a specific service type.
 
-def get_validator(service_type: ServiceType) -> BaseValidator:
-    """Get validator for a specific service type."""
-    return VALIDATORS.get(service_type)
+    Each validator is created on first request and shared afterwards.
+    """
+    if service_type is ServiceType.JIRA:
+        return JiraValidator()
+    if service_type is ServiceType.GEMINI:
+        return GeminiValidator()
+    return None
@@ -1,8 +1,10 @@
 """Direct view mode for unified configuration - tabbed interface."""
 
-from typing import Any, Dict
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtWidgets import (
     QScrollArea,
     QStyle,
@@ -16,24 +18,92 @@ from wes.gui.unified_config.config_pages import (
     GeminiConfigPage,
     JiraConfigPage,
 )
-from wes.gui.unified_config.types import ServiceType
+from wes.gui.unified_config.types import ServiceType, ValidationResult
+from wes.gui.unified_config.utils.config_detector import ConfigDetector
+from wes.gui.unified_config.utils.constants import CONFIG_CHANGE_DEBOUNCE_MS
+
+# Stylesheet shared by every tab's scroll area
+_SCROLL_QSS = """
+    QScrollArea {
+        border: none;
+        background-color: transparent;
+    }
+    QScrollBar:vertical {
+        width: 12px;
+        background: #f0f0f0;
+        border-radius: 6px;
+    }
+    QScrollBar::handle:vertical {
+        background: #c0c0c0;
+        border-radius: 6px;
+        min-height: 20px;
+    }
+    QScrollBar::handle:vertical:hover {
+        background: #a0a0a0;
+    }
+    QScrollBar:horizontal {
+        height: 12px;
+        background: #f0f0f0;
+        border-radius: 6px;
+    }
+    QScrollBar::handle:horizontal {
+        background: #c0c0c0;
+        border-radius: 6px;
+        min-width: 20px;
+    }
+    QScrollBar::handle:horizontal:hover {
+        background: #a0a0a0;
+    }
+"""
 
 
 class DirectView(QWidget):
     """
     Direct configuration view with tabbed interface for all settings.
     Shows validation status on each tab.
+
+    Tab pages are built the first time their tab is shown; until then a tab
+    holds an empty placeholder and its status comes from the stored config.
     """
 
     # Signals
     configuration_changed = Signal()
     validation_state_changed = Signal(bool)  # all_valid
 
+    # Services that must be valid before the configuration can be saved
+    _REQUIRED = (ServiceType.JIRA, ServiceType.GEMINI)
+
+    # Tab status icons, created by the first view
+    _TAB_ICONS = None
+
     def __init__(self, config_manager: ConfigManager, parent=None):
         super().__init__(parent)
         self.config_manager = config_manager
         self.pages = {}
         self.validation_states = {}
+        self._tab_factories: Dict[int, Callable[[], QWidget]] = {}
+        self._tab_index: Dict[ServiceType, int] = {}
+        self._config_detector = ConfigDetector()
+        # (icon key, tooltip) last shown on each service tab
+        self._tab_status: Dict[ServiceType, Tuple[str, str]] = {}
+
+        # Pages report every edit; listeners hear the first edit of a burst
+        # at once and, if more followed, once more when the burst settles
+        self._change_timer = QTimer(self)
+        self._change_timer.setSingleShot(True)
+        self._change_timer.setInterval(CONFIG_CHANGE_DEBOUNCE_MS)
+        self._change_timer.timeout.connect(self._flush_changes)
+        self._change_pending = False
+        # Set while pages reload the stored config; their changes are not edits
+        self._reloading = False
+
+        # Nesting depth of _batch_updates, and whether a page validated inside
+        self._batch_depth = 0
+        self._batch_validated = False
+
+        # Last all_valid reported, so listeners only hear about changes
+        self._last_all_valid: Optional[bool] = None
+
         self._init_ui()
         self._connect_signals()
 
@@ -42,24 +112,77 @@ class DirectView(QWidget):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(10, 10, 10, 10)
 
+        # Icons for different states, looked up once for all views
+        if DirectView._TAB_ICONS is None:
+            style = self.style()
+            DirectView._TAB_ICONS = {
+                "valid": style.standardIcon(QStyle.SP_DialogYesButton),
+                "invalid": style.standardIcon(QStyle.SP_DialogCancelButton),
+                "warning": style.standardIcon(QStyle.SP_MessageBoxWarning),
+            }
+
         # Tab widget
         self.tab_widget = QTabWidget()
         self.tab_widget.setDocumentMode(True)
 
-        # Create tabs for each service
-        self._create_service_tabs()
-
-        # Add application settings tab
-        self._create_app_settings_tab()
-
-        # Add security settings tab
-        self._create_security_tab()
+        self._create_tabs()
 
         layout.addWidget(self.tab_widget)
 
         # Update tab icons based on validation
         self._update_tab_icons()
 
+        # Report the initial state once the creator has connected to us
+        QTimer.singleShot(0, self, self._emit_validation_state)
+
+    def _create_tabs(self):
+        """Create all tabs with placeholder pages."""
+        # Lay the tab bar out once after all tabs are added
+        self.tab_widget.setUpdatesEnabled(False)
+        try:
+            # Create tabs for each service
+            self._create_service_tabs()
+
+            # Add application settings tab
+            self._create_app_settings_tab()
+
+            # Add security settings tab
+            self._create_security_tab()
+        finally:
+            self.tab_widget.setUpdatesEnabled(True)
+
+    def _clear_tabs(self):
+        """Remove every tab and delete its page."""
+        # Unbuilt tabs must not be built as they become current during removal
+        self._tab_factories.clear()
+
+        self.tab_widget.setUpdatesEnabled(False)
+        try:
+            # Remove from the end so the remaining tabs are not re-laid out
+            # after every removal
+            for index in range(self.tab_widget.count() - 1, -1, -1):
+                widget = self.tab_widget.widget(index)
+                self.tab_widget.removeTab(index)
+                widget.deleteLater()
+        finally:
+            self.tab_widget.setUpdatesEnabled(True)
+
+        self.pages.clear()
+        self.validation_states.clear()
+        self._tab_index.clear()
+        self._tab_status.clear()
+        for name in ("jira_page", "gemini_page", "app_page", "security_page"):
+            if hasattr(self, name):
+                delattr(self, name)
+
+    def rebuild(self):
+        """Discard all pages and recreate the tabs from the stored configuration."""
+        self._clear_tabs()
+        self._create_tabs()
+        self._update_tab_icons()
+        self._materialize_tab(self.tab_widget.currentIndex())
+        self._emit_validation_state()
+
     def _wrap_in_scroll_area(self, widget):
         """Wrap a widget in a scroll area for better small screen support."""
         scroll_area = QScrollArea()
@@ -69,113 +192,166 @@ class DirectView(QWidget):
         scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
 
         # Style the scroll area
-        scroll_area.setStyleSheet(
-            """
-            QScrollArea {
-                border: none;
-                background-color: transparent;
-            }
-            QScrollBar:vertical {
-                width: 12px;
-                background: #f0f0f0;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical {
-                background: #c0c0c0;
-                border-radius: 6px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #a0a0a0;
-            }
-            QScrollBar:horizontal {
-                height: 12px;
-                background: #f0f0f0;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:horizontal {
-                background: #c0c0c0;
-                border-radius: 6px;
-                min-width: 20px;
-            }
-            QScrollBar::handle:horizontal:hover {
-                background: #a0a0a0;
-            }
-        """
-        )
+        scroll_area.setStyleSheet(_SCROLL_QSS)
 
         return scroll_area
 
+    def _add_lazy_tab(self, label: str, factory: Callable[[], QWidget]) -> int:
+        """Add a placeholder tab whose page is created by factory on first view."""
+        placeholder = QWidget()
+        placeholder_layout = QVBoxLayout(placeholder)
+        placeholder_layout.setContentsMargins(0, 0, 0, 0)
+
+        index = self.tab_widget.addTab(placeholder, label)
+        self._tab_factories[index] = factory
+        return index
+
+    def _materialize_tab(self, index: int):
+        """Create the page for a tab the first time it is shown."""
+        factory = self._tab_factories.pop(index, None)
+        if factory is None:
+            return
+
+        page = factory()
+        placeholder = self.tab_widget.widget(index)
+        placeholder.layout().addWidget(self._wrap_in_scroll_area(page))
+
+        # Replace the status estimated from the stored config
+        if page.service_type in self._tab_index:
+            self._refresh_tab_icon(page.service_type, page.validate())
+
     def _create_service_tabs(self):
         """Create tabs for each service configuration."""
         # Jira tab
-        self.jira_page = JiraConfigPage(self.config_manager)
-        self.pages[ServiceType.JIRA] = self.jira_page
-        jira_scroll = self._wrap_in_scroll_area(self.jira_page)
-        self.tab_widget.addTab(jira_scroll, "Jira")
+        self._tab_index[ServiceType.JIRA] = self._add_lazy_tab(
+            "Jira", self._create_jira_page
+        )
 
         # Gemini tab
+        self._tab_index[ServiceType.GEMINI] = self._add_lazy_tab(
+            "Gemini AI", self._create_gemini_page
+        )
+
+    def _create_jira_page(self):
+        """Create the Jira configuration page."""
+        self.jira_page = JiraConfigPage(self.config_manager)
+        self._add_service_page(ServiceType.JIRA, self.jira_page)
+        return self.jira_page
+
+    def _create_gemini_page(self):
+        """Create the Gemini configuration page."""
         self.gemini_page = GeminiConfigPage(self.config_manager)
-        self.pages[ServiceType.GEMINI] = self.gemini_page
-        gemini_scroll = self._wrap_in_scroll_area(self.gemini_page)
-        self.tab_widget.addTab(gemini_scroll, "Gemini AI")
+        self._add_service_page(ServiceType.GEMINI, self.gemini_page)
+        return self.gemini_page
+
+    def _add_service_page(self, service: ServiceType, page):
+        """Register a service page and connect its signals."""
+        self.pages[service] = page
+        page.config_changed.connect(self._on_config_changed)
+        page.page_complete.connect(partial(self._on_page_validated, page))
+        page.validation_complete.connect(self._on_validation_complete)
 
     def _create_app_settings_tab(self):
         """Create application settings tab."""
+        self._add_lazy_tab("Application", self._create_app_settings_page)
+
+    def _create_app_settings_page(self):
+        """Create the application settings page."""
         from wes.gui.unified_config.config_pages.app_settings_page import (
             AppSettingsPage,
         )
 
         self.app_page = AppSettingsPage(self.config_manager)
-        app_scroll = self._wrap_in_scroll_area(self.app_page)
-        self.tab_widget.addTab(app_scroll, "Application")
+        self.app_page.config_changed.connect(self._on_config_changed)
+        return self.app_page
 
     def _create_security_tab(self):
         """Create security settings tab."""
+        self._add_lazy_tab("Security", self._create_security_page)
+
+    def _create_security_page(self):
+        """Create the security settings page."""
         from wes.gui.unified_config.config_pages.security_page import SecurityPage
 
         self.security_page = SecurityPage(self.config_manager)
-        security_scroll = self._wrap_in_scroll_area(self.security_page)
-        self.tab_widget.addTab(security_scroll, "Security")
+        self.security_page.config_changed.connect(self._on_config_changed)
+        return self.security_page
 
     def _connect_signals(self):
-        """Connect signals from all pages."""
-        # Connect configuration changes
-        for page in self.pages.values():
-            page.config_changed.connect(self._on_config_changed)
-            page.page_complete.connect(
-                lambda valid, p=page: self._on_page_validated(p, valid)
-            )
-            page.validation_complete.connect(self._on_validation_complete)
-
-        # Connect app and security pages if they exist
-        if hasattr(self, "app_page"):
-            self.app_page.config_changed.connect(self._on_config_changed)
-
-        if hasattr(self, "security_page"):
-            self.security_page.config_changed.connect(self._on_config_changed)
+        """Create the visible tab's page and the others when first selected."""
+        self._materialize_tab(self.tab_widget.currentIndex())
+        self.tab_widget.currentChanged.connect(self._materialize_tab)
 
     def _on_config_changed(self, config: Dict[str, Any]):
         """Handle configuration change from any page."""
-        self.configuration_changed.emit()
+        if self._reloading:
+            return
+        if self._change_timer.isActive():
+            self._change_pending = True
+        else:
+            self.configuration_changed.emit()
+        # Restarting the timer pushes the trailing emission back until edits settle
+        self._change_timer.start()
+
+    def _flush_changes(self):
+        """Report edits held back since the start of the current burst."""
+        self._change_timer.stop()
+        if self._change_pending:
+            self._change_pending = False
+            self.configuration_changed.emit()
 
     def _on_page_validated(self, page, is_valid: bool):
         """Handle page validation state change."""
-        # Find which service this page belongs to
-        for service, p in self.pages.items():
-            if p == page:
-                self.validation_states[service] = is_valid
-                break
-
-        # Update tab icon
-        self._update_tab_icons()
-
+        # Pages know their service; ignore pages replaced by a rebuild
+        service = page.service_type
+        if self.pages.get(service) is page:
+            self.validation_states[service] = is_valid
+            if self._batch_depth:
+                # Tabs and listeners are updated once the batch ends
+                self._batch_validated = True
+                return
+            # Only this page changed; leave the other tabs alone
+            self._refresh_tab_icon(service, page.validate())
+
+        self._emit_validation_state()
+
+    def _emit_validation_state(self):
+        """Tell listeners when the required services become valid or invalid."""
         # Check if all required services are valid
-        all_valid = all(
-            self.validation_states.get(service, False)
-            for service in [ServiceType.JIRA, ServiceType.GEMINI]
-        )
-        self.validation_state_changed.emit(all_valid)
+        all_valid = all(self._is_service_valid(service) for service in self._REQUIRED)
+        if all_valid != self._last_all_valid:
+            self._last_all_valid = all_valid
+            self.validation_state_changed.emit(all_valid)
+
+    def _is_service_valid(self, service: ServiceType) -> bool:
+        """Return whether a service is valid, as far as the view knows."""
+        if service in self.validation_states:
+            return self.validation_states[service]
+        # Unbuilt pages never validate, and built ones only after an edit;
+        # fall back to the status on their tab, which for unbuilt pages is
+        # validate_all()'s stored-config status
+        icon_key, _ = self._tab_status.get(service, ("warning", ""))
+        return icon_key == "valid"
+
+    @contextmanager
+    def _batch_updates(self) -> Iterator[None]:
+        """Defer tab icon and validation state updates until the block ends.
+
+        Page validations inside the block only record their state; on exit
+        the tab icons are refreshed once and, if any page validated, a single
+        validation_state_changed is emitted.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+
+        if self._batch_depth == 0:
+            self._update_tab_icons()
+            if self._batch_validated:
+                self._batch_validated = False
+                self._emit_validation_state()
 
     def _on_validation_complete(self, result: Dict[str, Any]):
         """Handle validation completion with detailed result."""
@@ -187,29 +363,30 @@ class DirectView(QWidget):
 
     def _update_tab_icons(self):
         """Update tab icons based on validation state."""
-        style = self.style()
-
-        # Icons for different states
-        valid_icon = style.standardIcon(QStyle.SP_DialogYesButton)
-        invalid_icon = style.standardIcon(QStyle.SP_DialogCancelButton)
-        warning_icon = style.standardIcon(QStyle.SP_MessageBoxWarning)
-
-        # Update service tabs
-        for i, (service, page) in enumerate(self.pages.items()):
-            # Get validation state
-            validation_result = page.validate()
-
-            if validation_result["is_valid"]:
-                self.tab_widget.setTabIcon(i, valid_icon)
-                self.tab_widget.setTabToolTip(i, "Configuration complete")
-            elif validation_result["details"].get("configured", False):
-                # Configured but invalid
-                self.tab_widget.setTabIcon(i, invalid_icon)
-                self.tab_widget.setTabToolTip(i, validation_result["message"])
-            else:
-                # Not configured
-                self.tab_widget.setTabIcon(i, warning_icon)
-                self.tab_widget.setTabToolTip(i, "Configuration required")
+        for service, validation_result in self.validate_all().items():
+            self._refresh_tab_icon(service, validation_result)
+
+    def _refresh_tab_icon(
+        self, service: ServiceType, validation_result: ValidationResult
+    ):
+        """Set a service tab's icon and tooltip if its status changed."""
+        if validation_result["is_valid"]:
+            status = ("valid", "Configuration complete")
+        elif validation_result["details"].get("configured", False):
+            # Configured but invalid
+            status = ("invalid", validation_result["message"])
+        else:
+            # Not configured
+            status = ("warning", "Configuration required")
+
+        if self._tab_status.get(service) == status:
+            return
+        self._tab_status[service] = status
+
+        index = self._tab_index[service]
+        icon_key, tooltip = status
+        self.tab_widget.setTabIcon(index, self._TAB_ICONS[icon_key])
+        self.tab_widget.setTabToolTip(index, tooltip)
 
     def get_configuration(self) -> Dict[str, Any]:
         """
@@ -218,9 +395,13 @@ class DirectView(QWidget):
         Returns:
             Dictionary with all service configurations
         """
+        # Report held-back edits before the caller acts on them, so a save
+        # that clears the caller's dirty state is not followed by a late signal
+        self._flush_changes()
+
         config = {}
 
-        # Get config from each service page
+        # Get config from each service page; unbuilt pages have no edits
         for service, page in self.pages.items():
             service_config = page.save_config()
             config.update(service_config)
@@ -245,9 +426,20 @@ class DirectView(QWidget):
             Dictionary mapping services to their validation results
         """
         results = {}
+        stored_status = None
 
-        for service, page in self.pages.items():
-            results[service] = page.validate()
+        for service in self._tab_index:
+            page = self.pages.get(service)
+            if page is not None:
+                results[service] = page.validate()
+                continue
+
+            # Not built yet: judge the stored configuration instead
+            if stored_status is None:
+                stored_status = self._config_detector.get_service_status(
+                    self.config_manager.config
+                )
+            results[service] = stored_status[service]
 
         return results
 
@@ -258,21 +450,26 @@ class DirectView(QWidget):
         Args:
             service: The service to display
         """
-        if service in self.pages:
-            index = list(self.pages.keys()).index(service)
-            self.tab_widget.setCurrentIndex(index)
+        if service in self._tab_index:
+            self.tab_widget.setCurrentIndex(self._tab_index[service])
 
     def refresh(self):
-        """Refresh all pages with current configuration."""
-        # Each page will reload from config manager
-        for page in self.pages.values():
-            page._load_current_config()
-
-        if hasattr(self, "app_page"):
-            self.app_page._load_current_config()
-
-        if hasattr(self, "security_page"):
-            self.security_page._load_current_config()
-
-        # Update validation states
-        self._update_tab_icons()
+        """Refresh all built pages with current configuration."""
+        # Validation states and tab icons are updated once at the end, and
+        # the pages' change signals are not reported as edits
+        self._reloading = True
+        self.tab_widget.setUpdatesEnabled(False)
+        try:
+            with self._batch_updates():
+                # Each page will reload from config manager
+                for page in self.pages.values():
+                    page._load_current_config()
+
+                if hasattr(self, "app_page"):
+                    self.app_page._load_current_config()
+
+                if hasattr(self, "security_page"):
+                    self.security_page._load_current_config()
+        finally:
+            self._reloading = False
+            self.tab_widget.setUpdatesEnabled(True)
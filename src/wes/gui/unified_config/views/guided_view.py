@@ -1,6 +1,7 @@
 """Guided view mode for unified configuration - highlights incomplete items."""
 
-from typing import Any, Dict
+from functools import partial
+from typing import Any, Dict, NamedTuple, Optional
 
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QFont
@@ -12,6 +13,7 @@ from PySide6.QtWidgets import (
     QMessageBox,
     QPushButton,
     QScrollArea,
+    QStackedWidget,
     QVBoxLayout,
     QWidget,
 )
@@ -25,34 +27,103 @@ from wes.gui.unified_config.types import ServiceType, ValidationResult
 from wes.gui.unified_config.utils.config_detector import ConfigDetector
 
 
+def _set_style_state(widget: QWidget, state: str):
+    """Switch a widget's "state" stylesheet selector and re-polish it."""
+    widget.setProperty("state", state)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+
+class _CardLook(NamedTuple):
+    """What a ServiceCard shows for one configuration state."""
+
+    icon: str
+    message: Optional[str]  # None shows the validation message
+    message_state: str
+    button_text: str
+    button_state: str
+
+
+_CONFIGURED = _CardLook("✅", "Configured", "ok", "Modify", "secondary")
+_UNCONFIGURED = _CardLook("⚠️", None, "error", "Configure Now", "primary")
+
+
 class ServiceCard(QFrame):
     """Card widget for displaying service configuration status."""
 
     configure_clicked = Signal()
 
+    # Presentation data shared by every card. The sheet is set once on the
+    # widget holding the cards and matched by object name; status changes
+    # only switch the "state" property of the status label and button.
+    _CARD_QSS = """
+        ServiceCard#card {
+            border: 2px solid #ddd;
+            border-radius: 8px;
+            background-color: white;
+            padding: 15px;
+        }
+        ServiceCard#card:hover {
+            border-color: #0084ff;
+            background-color: #f8f9fa;
+        }
+        ServiceCard#card QLabel[state="ok"] {
+            color: #1e7e34;
+            font-weight: bold;
+        }
+        ServiceCard#card QLabel[state="error"] {
+            color: #d73502;
+            font-weight: bold;
+        }
+        ServiceCard#card QPushButton[state="primary"] {
+            background-color: #0084ff;
+            color: white;
+            border: none;
+            padding: 8px 16px;
+            border-radius: 4px;
+            font-weight: bold;
+        }
+        ServiceCard#card QPushButton[state="primary"]:hover {
+            background-color: #0066cc;
+        }
+        ServiceCard#card QPushButton[state="secondary"] {
+            background-color: #6c757d;
+            color: white;
+            border: none;
+            padding: 8px 16px;
+            border-radius: 4px;
+        }
+        ServiceCard#card QPushButton[state="secondary"]:hover {
+            background-color: #5a6268;
+        }
+    """
+
+    _TITLES = {
+        ServiceType.JIRA: "Jira Connection",
+        ServiceType.GEMINI: "Gemini AI",
+    }
+
+    _DESCS = {
+        ServiceType.JIRA: "Connect to your Jira instance to fetch activity data",
+        ServiceType.GEMINI: "Configure Gemini AI for intelligent summarization",
+    }
+
+    # Created on first use, once a QApplication exists
+    _ICON_FONT = None
+
     def __init__(self, service_type: ServiceType, parent=None):
         super().__init__(parent)
         self.service_type = service_type
         self.is_configured = False
+        self._status = None  # (is_valid, message) currently shown
+        self._look = _UNCONFIGURED
         self._init_ui()
 
     def _init_ui(self):
         """Initialize the UI."""
         self.setFrameStyle(QFrame.Box)
-        self.setStyleSheet(
-            """
-            ServiceCard {
-                border: 2px solid #ddd;
-                border-radius: 8px;
-                background-color: white;
-                padding: 15px;
-            }
-            ServiceCard:hover {
-                border-color: #0084ff;
-                background-color: #f8f9fa;
-            }
-        """
-        )
+        self.setObjectName("card")
 
         layout = QVBoxLayout(self)
 
@@ -60,101 +131,58 @@ class ServiceCard(QFrame):
         header_layout = QHBoxLayout()
 
         # Status icon
-        self.status_icon = QLabel("⚠️")
-        self.status_icon.setFont(QFont("", 24))
+        if ServiceCard._ICON_FONT is None:
+            ServiceCard._ICON_FONT = QFont("", 24)
+        self.status_icon = QLabel(self._look.icon)
+        self.status_icon.setFont(ServiceCard._ICON_FONT)
         header_layout.addWidget(self.status_icon)
 
         # Title
-        titles = {
-            ServiceType.JIRA: "Jira Connection",
-            ServiceType.GEMINI: "Gemini AI",
-        }
-
-        title_label = QLabel(f"<h3>{titles[self.service_type]}</h3>")
+        title_label = QLabel(f"<h3>{self._TITLES[self.service_type]}</h3>")
         header_layout.addWidget(title_label)
         header_layout.addStretch()
 
         layout.addLayout(header_layout)
 
         # Description
-        descriptions = {
-            ServiceType.JIRA: "Connect to your Jira instance to fetch activity data",
-            ServiceType.GEMINI: "Configure Gemini AI for intelligent summarization",
-        }
-
-        desc_label = QLabel(descriptions[self.service_type])
+        desc_label = QLabel(self._DESCS[self.service_type])
         desc_label.setWordWrap(True)
         desc_label.setStyleSheet("color: #666; margin: 10px 0;")
         layout.addWidget(desc_label)
 
         # Status message
         self.status_message = QLabel("Not configured")
-        self.status_message.setStyleSheet("color: #d73502; font-weight: bold;")
+        self.status_message.setProperty("state", self._look.message_state)
         layout.addWidget(self.status_message)
 
         # Configure button
-        self.configure_button = QPushButton("Configure Now")
+        self.configure_button = QPushButton(self._look.button_text)
         self.configure_button.clicked.connect(self.configure_clicked)
-        self.configure_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #0084ff;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #0066cc;
-            }
-        """
-        )
+        self.configure_button.setProperty("state", self._look.button_state)
         layout.addWidget(self.configure_button)
 
     def update_status(self, validation_result: ValidationResult):
         """Update the card based on validation result."""
-        self.is_configured = validation_result["is_valid"]
-
-        if self.is_configured:
-            self.status_icon.setText("✅")
-            self.status_message.setText("Configured")
-            self.status_message.setStyleSheet("color: #1e7e34; font-weight: bold;")
-            self.configure_button.setText("Modify")
-            self.configure_button.setStyleSheet(
-                """
-                QPushButton {
-                    background-color: #6c757d;
-                    color: white;
-                    border: none;
-                    padding: 8px 16px;
-                    border-radius: 4px;
-                }
-                QPushButton:hover {
-                    background-color: #5a6268;
-                }
-            """
-            )
-        else:
-            self.status_icon.setText("⚠️")
-            self.status_message.setText(validation_result["message"])
-            self.status_message.setStyleSheet("color: #d73502; font-weight: bold;")
-            self.configure_button.setText("Configure Now")
-            self.configure_button.setStyleSheet(
-                """
-                QPushButton {
-                    background-color: #0084ff;
-                    color: white;
-                    border: none;
-                    padding: 8px 16px;
-                    border-radius: 4px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #0066cc;
-                }
-            """
-            )
+        is_configured = validation_result["is_valid"]
+        message = validation_result["message"]
+        if (is_configured, message) == self._status:
+            return
+        self._status = (is_configured, message)
+        self.is_configured = is_configured
+
+        look = _CONFIGURED if is_configured else _UNCONFIGURED
+        text = look.message or message
+        if self.status_message.text() != text:
+            self.status_message.setText(text)
+
+        # Only a change of state touches the icon, button and styling
+        if look is self._look:
+            return
+        self._look = look
+        self.status_icon.setText(look.icon)
+        _set_style_state(self.status_message, look.message_state)
+        self.configure_button.setText(look.button_text)
+        _set_style_state(self.configure_button, look.button_state)
 
 
 class GuidedView(QWidget):
@@ -167,12 +195,36 @@ class GuidedView(QWidget):
     configuration_updated = Signal(str, dict)  # service, config
     setup_complete = Signal()
 
+    # Continue button look once every service is configured, and before
+    _CONTINUE_READY_QSS = """
+        QPushButton {
+            background-color: #28a745;
+            color: white;
+            border: none;
+            padding: 8px 16px;
+            border-radius: 4px;
+            font-weight: bold;
+        }
+        QPushButton:hover {
+            background-color: #218838;
+        }
+    """
+    _CONTINUE_IDLE_QSS = ""
+
     def __init__(self, config_manager: ConfigManager, parent=None):
         super().__init__(parent)
         self.config_manager = config_manager
         self.config_detector = ConfigDetector()
         self.service_cards = {}
-        self.config_dialogs = {}
+        # One configuration dialog for all services, with a page per service
+        # created the first time that service is configured
+        self.config_pages = {}
+        self._config_dialog: Optional[QDialog] = None
+        self._config_stack: Optional[QStackedWidget] = None
+        # Service status from the last refresh; the dialog refreshes when it
+        # shows this view, and saving a service here refreshes too
+        self._service_status: Dict[ServiceType, ValidationResult] = {}
+        self._continue_ready: Optional[bool] = None
         self._init_ui()
         self.refresh_status()
 
@@ -195,6 +247,7 @@ class GuidedView(QWidget):
         scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
 
         scroll_widget = QWidget()
+        scroll_widget.setStyleSheet(ServiceCard._CARD_QSS)
         self.cards_layout = QVBoxLayout(scroll_widget)
         self.cards_layout.setSpacing(15)
 
@@ -202,7 +255,7 @@ class GuidedView(QWidget):
         for service_type in ServiceType:
             card = ServiceCard(service_type)
             card.configure_clicked.connect(
-                lambda s=service_type: self._configure_service(s)
+                partial(self._configure_service, service_type)
             )
             self.service_cards[service_type] = card
             self.cards_layout.addWidget(card)
@@ -232,6 +285,7 @@ class GuidedView(QWidget):
         service_status = self.config_detector.get_service_status(
             self.config_manager.config
         )
+        self._service_status = service_status
 
         # Update each card
         all_configured = True
@@ -240,44 +294,31 @@ class GuidedView(QWidget):
             if not status["is_valid"]:
                 all_configured = False
 
+        # Only restyle the continue button when its state flips
+        if all_configured == self._continue_ready:
+            return
+        self._continue_ready = all_configured
+
         # Enable continue button if all configured
         self.continue_button.setEnabled(all_configured)
 
         if all_configured:
             self.continue_button.setText("All Configured! Continue →")
-            self.continue_button.setStyleSheet(
-                """
-                QPushButton {
-                    background-color: #28a745;
-                    color: white;
-                    border: none;
-                    padding: 8px 16px;
-                    border-radius: 4px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #218838;
-                }
-            """
-            )
+            self.continue_button.setStyleSheet(self._CONTINUE_READY_QSS)
+        else:
+            self.continue_button.setText("Continue to Settings")
+            self.continue_button.setStyleSheet(self._CONTINUE_IDLE_QSS)
 
-    def _configure_service(self, service_type: ServiceType):
-        """Open configuration dialog for a specific service."""
-        # Create dialog if not exists
-        if service_type not in self.config_dialogs:
+    def _get_config_dialog(self) -> QDialog:
+        """Return the shared configuration dialog, creating it on first use."""
+        if self._config_dialog is None:
             dialog = QDialog(self)
-            dialog.setWindowTitle(f"Configure {service_type.value.title()}")
             dialog.setMinimumSize(600, 500)
 
             layout = QVBoxLayout(dialog)
 
-            # Create appropriate config page
-            if service_type == ServiceType.JIRA:
-                page = JiraConfigPage(self.config_manager)
-            elif service_type == ServiceType.GEMINI:
-                page = GeminiConfigPage(self.config_manager)
-
-            layout.addWidget(page)
+            self._config_stack = QStackedWidget()
+            layout.addWidget(self._config_stack)
 
             # Buttons
             button_layout = QHBoxLayout()
@@ -288,20 +329,41 @@ class GuidedView(QWidget):
             button_layout.addWidget(cancel_button)
 
             save_button = QPushButton("Save")
-            save_button.clicked.connect(
-                lambda: self._save_service_config(service_type, page, dialog)
-            )
+            save_button.clicked.connect(self._save_current_service)
             save_button.setDefault(True)
             button_layout.addWidget(save_button)
 
             layout.addLayout(button_layout)
 
-            self.config_dialogs[service_type] = (dialog, page)
+            self._config_dialog = dialog
+
+        return self._config_dialog
+
+    def _configure_service(self, service_type: ServiceType):
+        """Open configuration dialog for a specific service."""
+        dialog = self._get_config_dialog()
+
+        # Create the service's page if not exists
+        page = self.config_pages.get(service_type)
+        if page is None:
+            if service_type == ServiceType.JIRA:
+                page = JiraConfigPage(self.config_manager)
+            elif service_type == ServiceType.GEMINI:
+                page = GeminiConfigPage(self.config_manager)
+
+            self._config_stack.addWidget(page)
+            self.config_pages[service_type] = page
 
         # Show dialog
-        dialog, page = self.config_dialogs[service_type]
+        self._config_stack.setCurrentWidget(page)
+        dialog.setWindowTitle(f"Configure {service_type.value.title()}")
         dialog.exec()
 
+    def _save_current_service(self):
+        """Save the service whose page the configuration dialog is showing."""
+        page = self._config_stack.currentWidget()
+        self._save_service_config(page.service_type, page, self._config_dialog)
+
     def _save_service_config(self, service_type: ServiceType, page, dialog):
         """Save configuration for a service."""
         # Validate first
@@ -336,10 +398,8 @@ class GuidedView(QWidget):
 
     def _check_and_continue(self):
         """Check if all services are configured and continue."""
-        # Double-check configuration
-        service_status = self.config_detector.get_service_status(
-            self.config_manager.config
-        )
+        # Status is current: every configuration change ends in refresh_status
+        service_status = self._service_status
 
         all_configured = all(status["is_valid"] for status in service_status.values())
 
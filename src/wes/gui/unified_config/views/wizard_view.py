@@ -1,6 +1,7 @@
 """Wizard view mode for unified configuration - step-by-step setup."""
 
-from typing import Any, Dict, Optional
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
 
 from PySide6.QtCore import Signal
 from PySide6.QtWidgets import (
@@ -19,6 +20,7 @@ from wes.gui.unified_config.config_pages import (
     GeminiConfigPage,
     JiraConfigPage,
 )
+from wes.gui.unified_config.types import ValidationResult
 
 
 class WizardPage(QWidget):
@@ -153,6 +155,9 @@ class SummaryPage(WizardPage):
 class WizardView(QWidget):
     """
     Wizard view for step-by-step configuration.
+
+    Pages are built the first time they are shown; until then the stack
+    holds an empty placeholder and the page's slot in pages is None.
     """
 
     # Signals
@@ -162,7 +167,11 @@ class WizardView(QWidget):
     def __init__(self, config_manager: ConfigManager, parent=None):
         super().__init__(parent)
         self.config_manager = config_manager
-        self.pages = []
+        self.pages: List[Optional[QWidget]] = []
+        self._page_factories: Dict[int, Callable[[], QWidget]] = {}
+        # Result of the validation that let each config page be left forwards;
+        # a page can only be reached again through Next, which revalidates it
+        self._validation_results: Dict[int, ValidationResult] = {}
         self.current_page = 0
         self._init_ui()
 
@@ -210,30 +219,61 @@ class WizardView(QWidget):
         self._update_navigation()
 
     def _create_pages(self):
-        """Create wizard pages."""
+        """Create placeholders for the wizard pages."""
         # Welcome page
-        welcome = WelcomePage()
-        self.pages.append(welcome)
-        self.page_stack.addWidget(welcome)
+        self._add_lazy_page(WelcomePage)
 
         # Jira configuration
-        self.jira_page = JiraConfigPage(self.config_manager)
-        self.pages.append(self.jira_page)
-        self.page_stack.addWidget(self.jira_page)
+        self._jira_index = self._add_lazy_page(
+            partial(JiraConfigPage, self.config_manager)
+        )
 
         # Gemini configuration
-        self.gemini_page = GeminiConfigPage(self.config_manager)
-        self.pages.append(self.gemini_page)
-        self.page_stack.addWidget(self.gemini_page)
+        self._gemini_index = self._add_lazy_page(
+            partial(GeminiConfigPage, self.config_manager)
+        )
 
         # Summary page
-        self.summary_page = SummaryPage()
-        self.pages.append(self.summary_page)
-        self.page_stack.addWidget(self.summary_page)
+        self._summary_index = self._add_lazy_page(SummaryPage)
 
         # Set progress bar range
         self.progress_bar.setRange(0, len(self.pages) - 1)
 
+    def _add_lazy_page(self, factory: Callable[[], QWidget]) -> int:
+        """Add a placeholder page whose widget is created by factory on first use."""
+        placeholder = QWidget()
+        placeholder_layout = QVBoxLayout(placeholder)
+        placeholder_layout.setContentsMargins(0, 0, 0, 0)
+
+        index = self.page_stack.addWidget(placeholder)
+        self.pages.append(None)
+        self._page_factories[index] = factory
+        return index
+
+    def _materialize_page(self, index: int) -> QWidget:
+        """Return the page at index, creating it the first time."""
+        factory = self._page_factories.pop(index, None)
+        if factory is not None:
+            page = factory()
+            self.page_stack.widget(index).layout().addWidget(page)
+            self.pages[index] = page
+        return self.pages[index]
+
+    @property
+    def jira_page(self) -> JiraConfigPage:
+        """The Jira configuration page, built on first access."""
+        return self._materialize_page(self._jira_index)
+
+    @property
+    def gemini_page(self) -> GeminiConfigPage:
+        """The Gemini configuration page, built on first access."""
+        return self._materialize_page(self._gemini_index)
+
+    @property
+    def summary_page(self) -> SummaryPage:
+        """The summary page, built on first access."""
+        return self._materialize_page(self._summary_index)
+
     def _update_navigation(self):
         """Update navigation buttons and progress."""
         # Update progress bar
@@ -254,6 +294,7 @@ class WizardView(QWidget):
             self.next_button.setText("Next →")
 
         # Show current page
+        self._materialize_page(self.current_page)
         self.page_stack.setCurrentIndex(self.current_page)
 
         # Emit page changed signal
@@ -278,6 +319,7 @@ class WizardView(QWidget):
             if not validation_result["is_valid"]:
                 # Let the page handle showing the error
                 return
+            self._validation_results[self.current_page] = validation_result
 
         # Check if we're on the last page
         if self.current_page == len(self.pages) - 1:
@@ -291,11 +333,18 @@ class WizardView(QWidget):
     def _update_summary(self):
         """Update the summary page with configuration status."""
         # Check each service configuration
-        jira_valid = self.jira_page.validate()["is_valid"]
-        gemini_valid = self.gemini_page.validate()["is_valid"]
+        jira_valid = self._page_validation(self._jira_index)["is_valid"]
+        gemini_valid = self._page_validation(self._gemini_index)["is_valid"]
 
         self.summary_page.update_status(jira_valid, gemini_valid)
 
+    def _page_validation(self, index: int) -> ValidationResult:
+        """Return a config page's validation, reusing the one made on Next."""
+        result = self._validation_results.get(index)
+        if result is None:
+            result = self._materialize_page(index).validate()
+        return result
+
     def get_configuration(self) -> Dict[str, Any]:
         """Get the complete configuration from all pages."""
         config = {}
@@ -311,7 +360,7 @@ class WizardView(QWidget):
     def get_page_info(self, page_index: int) -> Optional[Dict[str, str]]:
         """Get information about a specific page."""
         if 0 <= page_index < len(self.pages):
-            page = self.pages[page_index]
+            page = self._materialize_page(page_index)
             return {
                 "title": getattr(page, "title", "Configuration"),
                 "description": getattr(page, "description", ""),
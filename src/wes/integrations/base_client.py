@@ -1,11 +1,13 @@
 """Base client for all integration services with common functionality."""
 
 import asyncio
+import logging
+import random
 import time
 from abc import ABC, abstractmethod
-from contextlib import asynccontextmanager
-from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any, Callable, Deque, Dict, List, Optional
 
 import aiohttp
 
@@ -18,40 +20,51 @@ from ..utils.exceptions import (
 from ..utils.logging_config import get_logger, get_security_logger
 
 
+def _is_json(content_type: str) -> bool:
+    """Return whether a response content type (without parameters) is JSON."""
+    return content_type == "application/json" or content_type.endswith("+json")
+
+
 class RateLimiter:
     """Rate limiter for API requests with backoff strategy."""
 
     def __init__(self, max_requests: int = 100, time_window: int = 60):
         self.max_requests = max_requests
         self.time_window = time_window
-        self.requests = []
+        # Request times, oldest first, from the monotonic clock
+        self.requests: Deque[float] = deque()
         self._lock = asyncio.Lock()
         self.logger = get_logger(__name__)
 
     async def acquire(self) -> None:
-        """Acquire rate limit permit with exponential backoff."""
+        """Acquire rate limit permit, waiting until the window has room.
+
+        The lock is held while waiting, so callers are admitted one at a
+        time in arrival order.
+        """
         async with self._lock:
-            now = time.time()
+            while True:
+                now = time.monotonic()
 
-            # Remove old requests outside the time window
-            self.requests = [
-                req_time
-                for req_time in self.requests
-                if now - req_time < self.time_window
-            ]
+                # Remove old requests outside the time window
+                self._evict(now)
+
+                # Add current request if we're under the limit
+                if len(self.requests) < self.max_requests:
+                    self.requests.append(now)
+                    return
 
-            # Check if we're at the limit
-            if len(self.requests) >= self.max_requests:
                 wait_time = self.time_window - (now - self.requests[0])
-                if wait_time > 0:
-                    self.logger.warning(
-                        f"Rate limit reached, waiting {wait_time:.2f} seconds"
-                    )
-                    await asyncio.sleep(wait_time)
-                    return await self.acquire()
+                self.logger.warning(
+                    f"Rate limit reached, waiting {wait_time:.2f} seconds"
+                )
+                await asyncio.sleep(wait_time)
 
-            # Add current request
-            self.requests.append(now)
+    def _evict(self, now: float) -> None:
+        """Drop request times that have left the time window."""
+        requests = self.requests
+        while requests and now - requests[0] >= self.time_window:
+            requests.popleft()
 
     def reset(self) -> None:
         """Reset rate limiter state."""
@@ -60,14 +73,16 @@ class RateLimiter:
     @property
     def current_usage(self) -> float:
         """Get current usage percentage."""
-        now = time.time()
-        active_requests = [req for req in self.requests if now - req < self.time_window]
-        return (len(active_requests) / self.max_requests) * 100
+        self._evict(time.monotonic())
+        return (len(self.requests) / self.max_requests) * 100
 
 
 class RetryStrategy:
     """Retry strategy with exponential backoff."""
 
+    # Exceptions retried when the caller does not choose its own
+    DEFAULT_RETRY_ON = (ConnectionError, RateLimitError)
+
     def __init__(
         self,
         max_retries: int = 3,
@@ -82,17 +97,27 @@ class RetryStrategy:
         self.exponential_base = exponential_base
         self.jitter = jitter
 
-    def get_delay(self, retry_count: int) -> float:
-        """Calculate delay for the given retry count."""
-        delay = min(
+        # Delays before jitter for every retry execute_with_retry can make
+        self._base_delays = [
+            self._base_delay(retry_count) for retry_count in range(max_retries + 1)
+        ]
+
+    def _base_delay(self, retry_count: int) -> float:
+        """Calculate the delay for the given retry count before jitter."""
+        return min(
             self.initial_delay * (self.exponential_base**retry_count),
             self.max_delay,
         )
 
+    def get_delay(self, retry_count: int) -> float:
+        """Calculate delay for the given retry count."""
+        if retry_count < len(self._base_delays):
+            delay = self._base_delays[retry_count]
+        else:
+            delay = self._base_delay(retry_count)
+
         if self.jitter:
             # Add random jitter to prevent thundering herd
-            import random
-
             delay = delay * (
                 0.5 + random.random() * 0.5
             )  # nosec B311 - Random used for timing jitter, not cryptography
@@ -107,7 +132,8 @@ class RetryStrategy:
         **kwargs,
     ) -> Any:
         """Execute function with retry logic."""
-        retry_on = retry_on or [ConnectionError, RateLimitError]
+        # isinstance checks a tuple of types in one call
+        retry_on = tuple(retry_on) if retry_on else self.DEFAULT_RETRY_ON
         last_exception = None
 
         for attempt in range(self.max_retries + 1):
@@ -117,7 +143,7 @@ class RetryStrategy:
                 last_exception = e
 
                 # Check if we should retry this exception
-                should_retry = any(isinstance(e, exc_type) for exc_type in retry_on)
+                should_retry = isinstance(e, retry_on)
 
                 if not should_retry or attempt == self.max_retries:
                     raise
@@ -153,14 +179,31 @@ class BaseIntegrationClient(ABC):
         # Connection pool
         self._session: Optional[aiohttp.ClientSession] = None
         self._session_lock = asyncio.Lock()
+        self._close_task: Optional[asyncio.Task] = None
+
+        # Metrics, kept as plain counters and exposed through the metrics property
+        self._total_requests = 0
+        self._successful_requests = 0
+        self._failed_requests = 0
+        self._total_latency = 0.0
+        # Monotonic time of the last successful request
+        self._last_request_time: Optional[float] = None
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        """Request counters, with last_request_time as a datetime."""
+        last_request_time = None
+        if self._last_request_time is not None:
+            last_request_time = datetime.now() - timedelta(
+                seconds=time.monotonic() - self._last_request_time
+            )
 
-        # Metrics
-        self.metrics = {
-            "total_requests": 0,
-            "successful_requests": 0,
-            "failed_requests": 0,
-            "total_latency": 0.0,
-            "last_request_time": None,
+        return {
+            "total_requests": self._total_requests,
+            "successful_requests": self._successful_requests,
+            "failed_requests": self._failed_requests,
+            "total_latency": self._total_latency,
+            "last_request_time": last_request_time,
         }
 
     @abstractmethod
@@ -171,25 +214,26 @@ class BaseIntegrationClient(ABC):
     async def validate_connection(self) -> bool:
         """Validate the connection to the service."""
 
-    @asynccontextmanager
-    async def get_session(self):
+    async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session with connection pooling."""
-        async with self._session_lock:
-            if self._session is None or self._session.closed:
-                connector = aiohttp.TCPConnector(
-                    limit=50,  # Total connection pool size
-                    limit_per_host=10,  # Per-host connection limit
-                    ttl_dns_cache=300,  # DNS cache timeout
-                )
-                timeout_config = aiohttp.ClientTimeout(total=self.timeout)
+        # Only building the session needs the lock; an open one is reused as is
+        if self._session is None or self._session.closed:
+            async with self._session_lock:
+                if self._session is None or self._session.closed:
+                    connector = aiohttp.TCPConnector(
+                        limit=50,  # Total connection pool size
+                        limit_per_host=10,  # Per-host connection limit
+                        ttl_dns_cache=300,  # DNS cache timeout
+                    )
+                    timeout_config = aiohttp.ClientTimeout(total=self.timeout)
 
-                self._session = aiohttp.ClientSession(
-                    connector=connector,
-                    timeout=timeout_config,
-                    headers=self._get_default_headers(),
-                )
+                    self._session = aiohttp.ClientSession(
+                        connector=connector,
+                        timeout=timeout_config,
+                        headers=self._get_default_headers(),
+                    )
 
-            yield self._session
+        return self._session
 
     def _get_default_headers(self) -> Dict[str, str]:
         """Get default headers for requests."""
@@ -214,55 +258,38 @@ class BaseIntegrationClient(ABC):
 
         # Prepare request
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        request_headers = self._get_default_headers()
-        if headers:
-            request_headers.update(headers)
-
-        # Log request (sanitized)
-        self.logger.debug(
-            f"Making {method} request to {endpoint}",
-            extra={"params": params, "has_body": json_data is not None},
-        )
+
+        # Log request (sanitized); skip building the message when DEBUG is off
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                f"Making {method} request to {endpoint}",
+                extra={"params": params, "has_body": json_data is not None},
+            )
 
         # Track metrics
-        start_time = time.time()
-        self.metrics["total_requests"] += 1
+        start_time = time.monotonic()
+        self._total_requests += 1
 
         async def _execute_request():
-            async with self.get_session() as session:
-                async with session.request(
-                    method=method,
-                    url=url,
-                    headers=request_headers,
-                    params=params,
-                    json=json_data,
-                ) as response:
-                    # Handle rate limiting
-                    if response.status == 429:
-                        retry_after = response.headers.get("Retry-After", "60")
-                        raise RateLimitError(
-                            f"Rate limit exceeded. Retry after {retry_after} seconds"
-                        )
-
-                    # Handle authentication errors
-                    if response.status in [401, 403]:
-                        raise AuthenticationError(
-                            f"Authentication failed: {response.status}"
-                        )
-
-                    # Handle other errors
-                    if response.status >= 400:
-                        error_text = await response.text()
-                        raise IntegrationError(
-                            f"Request failed with status "
-                            f"{response.status}: {error_text}"
-                        )
-
-                    # Parse response
-                    if response.content_type == "application/json":
-                        return await response.json()
-                    else:
-                        return {"content": await response.text()}
+            session = await self._get_session()
+            async with session.request(
+                method=method,
+                url=url,
+                # The session adds the default headers to every request
+                headers=headers,
+                params=params,
+                json=json_data,
+            ) as response:
+                # Successful responses skip the error checks
+                if response.status >= 400:
+                    await self._raise_for_status(response)
+
+                # Parse response
+                if _is_json(response.content_type):
+                    # aiohttp only accepts application/json by default
+                    return await response.json(content_type=None)
+                else:
+                    return {"content": await response.text()}
 
         try:
             # Execute with retry
@@ -271,15 +298,16 @@ class BaseIntegrationClient(ABC):
             )
 
             # Update metrics
-            self.metrics["successful_requests"] += 1
-            self.metrics["total_latency"] += time.time() - start_time
-            self.metrics["last_request_time"] = datetime.now()
+            now = time.monotonic()
+            self._successful_requests += 1
+            self._total_latency += now - start_time
+            self._last_request_time = now
 
             return result
 
         except Exception as e:
             # Update metrics
-            self.metrics["failed_requests"] += 1
+            self._failed_requests += 1
 
             # Log error
             self.logger.error(
@@ -290,6 +318,25 @@ class BaseIntegrationClient(ABC):
 
             raise
 
+    async def _raise_for_status(self, response: aiohttp.ClientResponse) -> None:
+        """Raise the error matching a failed response's status."""
+        # Handle rate limiting
+        if response.status == 429:
+            retry_after = response.headers.get("Retry-After", "60")
+            raise RateLimitError(
+                f"Rate limit exceeded. Retry after {retry_after} seconds"
+            )
+
+        # Handle authentication errors
+        if response.status in (401, 403):
+            raise AuthenticationError(f"Authentication failed: {response.status}")
+
+        # Handle other errors
+        error_text = await response.text()
+        raise IntegrationError(
+            f"Request failed with status {response.status}: {error_text}"
+        )
+
     async def get(
         self,
         endpoint: str,
@@ -342,7 +389,7 @@ class BaseIntegrationClient(ABC):
 
     def get_metrics(self) -> Dict[str, Any]:
         """Get client metrics."""
-        metrics = self.metrics.copy()
+        metrics = self.metrics
 
         # Calculate average latency
         if metrics["successful_requests"] > 0:
@@ -386,7 +433,14 @@ class BaseIntegrationClient(ABC):
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
         _ = exc_type, exc_val, exc_tb  # Unused but required by protocol
-        asyncio.create_task(self.close())
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop to schedule on, so close before returning
+            asyncio.run(self.close())
+        else:
+            # Keep a reference so the task is not collected before it runs
+            self._close_task = loop.create_task(self.close())
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -13,7 +13,7 @@ class LogSanitizer:
     """Sanitize sensitive data from log messages."""
 
     # Patterns for sensitive data
-    SENSITIVE_PATTERNS = [
+    SENSITIVE_PATTERNS = (
         (r'password["\']?\s*[:=]\s*["\']?([^"\'\\s]+)', "[PASSWORD_REDACTED]"),
         (r'token["\']?\s*[:=]\s*["\']?([^"\'\\s]+)', "[TOKEN_REDACTED]"),
         (r'key["\']?\s*[:=]\s*["\']?([^"\'\\s]+)', "[KEY_REDACTED]"),
@@ -32,7 +32,7 @@ class LogSanitizer:
             r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}",
             "[UUID_REDACTED]",
         ),
-    ]
+    )
 
     @classmethod
     def sanitize_message(cls, message: str) -> str:
@@ -6,6 +6,7 @@ import html
 import os
 import re
 import secrets
+import string
 import time
 import unicodedata
 from dataclasses import dataclass
@@ -15,12 +16,22 @@ from urllib.parse import urlparse
 
 from .exceptions import ValidationError
 
+# Translation tables that delete every allowed character; a value is valid
+# when nothing is left after translating it.
+_EMAIL_LOCAL_DELETE = str.maketrans(
+    "", "", string.ascii_letters + string.digits + "._%+-"
+)
+_EMAIL_DOMAIN_DELETE = str.maketrans(
+    "", "", string.ascii_letters + string.digits + ".-"
+)
+_API_TOKEN_DELETE = str.maketrans("", "", string.ascii_letters + string.digits + "_-")
+
 
 class InputValidator:
     """Secure input validation and sanitization."""
 
     # Dangerous patterns for JQL injection prevention
-    DANGEROUS_JQL_PATTERNS = [
+    DANGEROUS_JQL_PATTERNS = (
         r";\s*DROP\s+TABLE",
         r";\s*DELETE\s+FROM",
         r";\s*UPDATE\s+SET",
@@ -31,10 +42,10 @@ class InputValidator:
         r"onerror\s*=",
         r"eval\s*\(",
         r"expression\s*\(",
-    ]
+    )
 
     # Valid URL schemes
-    VALID_SCHEMES = ["https"]
+    VALID_SCHEMES = ("https",)
 
     @staticmethod
     def validate_url(url: str) -> bool:
@@ -119,9 +130,7 @@ class InputValidator:
         if not email:
             return False
 
-        # Email validation pattern
-        pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        if not re.match(pattern, email):
+        if not is_valid_email(email):
             raise ValidationError("Invalid email format")
 
         return True
@@ -389,7 +398,7 @@ class JQLValidator:
     MAX_QUERY_LENGTH = 5000
     MAX_NESTING_DEPTH = 10
 
-    DANGEROUS_FUNCTIONS = [
+    DANGEROUS_FUNCTIONS = (
         "issueFunction",
         "sql",
         "DROP",
@@ -398,7 +407,7 @@ class JQLValidator:
         "INSERT",
         "EXEC",
         "EXECUTE",
-    ]
+    )
 
     def validate_jql(self, query: str) -> ValidationResult:
         """Validate JQL query."""
@@ -451,14 +460,14 @@ class PromptValidator:
 
     MAX_PROMPT_LENGTH = 500000  # Token estimation
 
-    INJECTION_PATTERNS = [
+    INJECTION_PATTERNS = (
         r"ignore\s+previous\s+instructions",
         r"system\s*:\s*new\s+instructions",
         r"</prompt>.*<prompt>",
         r"\[\[SYSTEM",
         r"developer\s+mode",
         r"bypass\s+restrictions",
-    ]
+    )
 
     def validate_prompt(self, prompt: str) -> ValidationResult:
         """Validate AI prompt."""
@@ -506,6 +515,44 @@ class PromptValidator:
         return ValidationResult(True)
 
 
+# Format helper functions
+
+
+def is_valid_email(email: str) -> bool:
+    """Check email format without a regex.
+
+    Accepts the same addresses as ``local@domain.tld`` with letters, digits and
+    ``._%+-`` in the local part, letters, digits, ``.`` and ``-`` in the domain,
+    and an alphabetic TLD of at least two characters. Lengths are capped at the
+    RFC 5321 limits (64 for the local part, 254 overall).
+    """
+    if not email or len(email) > 254 or email.count("@") != 1:
+        return False
+
+    local, _, domain = email.partition("@")
+    if not local or len(local) > 64 or local.translate(_EMAIL_LOCAL_DELETE):
+        return False
+
+    host, dot, tld = domain.rpartition(".")
+    return bool(
+        host
+        and dot
+        and len(tld) >= 2
+        and tld.isascii()
+        and tld.isalpha()
+        and not host.translate(_EMAIL_DOMAIN_DELETE)
+    )
+
+
+def is_valid_api_token(token: str, min_length: int = 20) -> bool:
+    """Check that a token is at least ``min_length`` of ``[A-Za-z0-9_-]``.
+
+    Equivalent to ``ValidationPatterns.API_TOKEN_PATTERN`` for the default
+    length, implemented as a single C-level ``str.translate`` scan.
+    """
+    return len(token) >= min_length and not token.translate(_API_TOKEN_DELETE)
+
+
 # Security helper functions
 
 
@@ -10,7 +10,11 @@ import pytest
 from wes.core.security_manager import SecurityManager
 from wes.utils.exceptions import SecurityError, ValidationError
 from wes.utils.logging_config import get_logger, get_security_logger
-from wes.utils.validators import InputValidator
+from wes.utils.validators import (
+    InputValidator,
+    is_valid_api_token,
+    is_valid_email,
+)
 
 
 class TestSecurityManagerMinimal:
@@ -297,6 +301,34 @@ class TestInputValidatorMinimal:
         except ValidationError:
             pass  # Expected
 
+    def test_email_validation_basic(self):
+        """Test email validation matches the documented format."""
+        validator = InputValidator()
+
+        assert validator.validate_email("first.last+tag@mail.example.co") is True
+        with pytest.raises(ValidationError):
+            validator.validate_email("user@example")
+
+        for invalid in (
+            "plain",
+            "@example.com",
+            "a@@example.com",
+            "user@.com",
+            "user@example.c",
+            "user@exam_ple.com",
+            "us er@example.com",
+            "user@example.c0m",
+            "x" * 65 + "@example.com",
+        ):
+            assert is_valid_email(invalid) is False, invalid
+
+    def test_api_token_format_basic(self):
+        """Test API token format check."""
+        assert is_valid_api_token("abcDEF123_-" * 2) is True
+        assert is_valid_api_token("a" * 19) is False
+        assert is_valid_api_token("a" * 19 + " ") is False
+        assert is_valid_api_token("short_tok", min_length=5) is True
+
 
 class TestLoggingMinimal:
     """Minimal tests for logging."""
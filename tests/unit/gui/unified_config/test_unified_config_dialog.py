@@ -3,10 +3,11 @@
 from unittest.mock import Mock, patch
 
 import pytest
-from PySide6.QtWidgets import QApplication, QDialogButtonBox
+from PySide6.QtWidgets import QApplication, QDialogButtonBox, QWidget
 
 from wes.core.config_manager import ConfigManager
 from wes.gui.unified_config import UIMode, UnifiedConfigDialog
+from wes.gui.unified_config.utils.styles import StyleManager
 
 
 class TestUnifiedConfigDialog:
@@ -158,6 +159,46 @@ class TestUnifiedConfigDialog:
         dialog._apply_changes()
         assert dialog.dirty is False
 
+    def test_dialog_styled_by_one_stylesheet(self, dialog):
+        """Test that the header and button area share the dialog's stylesheet."""
+        assert dialog.styleSheet() == StyleManager.get_combined_style("header")
+        assert dialog.mode_label.styleSheet() == ""
+        assert dialog.findChild(QWidget, "configHeader").styleSheet() == ""
+        assert dialog.findChild(QWidget, "buttonArea").styleSheet() == ""
+
+    def test_direct_mode_save_enabled_for_valid_config(
+        self, dialog, qtbot, config_manager
+    ):
+        """Test that a valid stored config enables Save before tabs are opened."""
+        config_manager.config = {
+            "jira": {
+                "url": "https://example.atlassian.net",
+                "username": "user@example.com",
+                "api_token": "test-token",
+            },
+            "gemini": {"api_key": "AIzaSyTest1234567890123456789012345"},
+        }
+
+        dialog.set_mode(UIMode.DIRECT)
+        qtbot.wait(700)
+
+        assert dialog.button_box.button(QDialogButtonBox.Save).isEnabled()
+
+    def test_direct_edit_marks_dirty_immediately(self, dialog, qtbot, monkeypatch):
+        """Test that an edit in direct mode is not lost to the change debounce."""
+        dialog.set_mode(UIMode.DIRECT)
+        dialog.direct_widget.jira_page.config_changed.emit({})
+        assert dialog.dirty is True
+
+        monkeypatch.setattr("PySide6.QtWidgets.QMessageBox.information", Mock())
+        dialog.direct_widget.jira_page.config_changed.emit({})
+        dialog._validate_configuration = Mock(return_value=True)
+        dialog._apply_changes()
+        assert dialog.dirty is False
+
+        qtbot.wait(150)
+        assert dialog.dirty is False
+
     def test_close_with_unsaved_changes(self, dialog, qtbot, monkeypatch):
         """Test close dialog with unsaved changes."""
         from PySide6.QtWidgets import QMessageBox
@@ -155,3 +155,94 @@ class TestConfigDetector:
         }
         # Gemini should be valid with just API key
         # This would need custom logic in detector
+
+    def test_validate_service_single_pass(self, detector):
+        """Test completeness and missing fields are reported together."""
+        jira = {"url": "https://example.atlassian.net", "username": ""}
+        assert detector._validate_service(jira, ServiceType.JIRA) == (
+            False,
+            ["username", "api_token"],
+        )
+        assert detector._validate_service(
+            {"gemini_api_key": "AIzaSyTest123456789"}, ServiceType.GEMINI
+        ) == (True, [])
+        assert detector._validate_service({}, ServiceType.GEMINI) == (
+            False,
+            ["API key"],
+        )
+
+        status = detector.get_service_status({"jira": jira})
+        assert status[ServiceType.JIRA]["message"] == "Missing: username, api_token"
+
+    def test_validate_service_uses_current_required_fields(self, detector):
+        """Test a replaced required-field list is honoured for Jira."""
+        detector.required_fields = dict(detector.required_fields)
+        detector.required_fields[ServiceType.JIRA] = ("url", "api_token")
+        jira = {"url": "https://example.atlassian.net", "username": "user"}
+
+        assert detector._validate_service(jira, ServiceType.JIRA) == (
+            False,
+            ["api_token"],
+        )
+
+        jira["api_token"] = "token"
+        jira["username"] = ""
+        assert detector._validate_service(jira, ServiceType.JIRA) == (True, [])
+
+    def test_analyze_combines_state_missing_and_status(self, detector):
+        """Test analyze returns state, missing services and status together."""
+        config = {
+            "jira": {
+                "url": "https://example.atlassian.net",
+                "username": "user@example.com",
+                "api_token": "test-token",
+            },
+            "gemini": {"model": "gemini-pro"},
+        }
+
+        analysis = detector.analyze(config)
+
+        assert analysis.state == ConfigState.INCOMPLETE
+        assert analysis.missing == [ServiceType.GEMINI]
+        assert analysis.results[ServiceType.JIRA]["is_valid"] is True
+        assert analysis.results[ServiceType.GEMINI]["message"] == "Missing: API key"
+        assert analysis.state == detector.detect_state(config)
+        assert analysis.missing == detector.get_missing_services(config)
+        assert analysis.results == detector.get_service_status(config)
+
+    def test_missing_or_null_sections(self, detector):
+        """Test absent and null service sections are reported as not configured."""
+        status = detector.get_service_status({"jira": None})
+
+        assert status[ServiceType.JIRA]["is_valid"] is False
+        assert status[ServiceType.JIRA]["message"] == "Not configured"
+        assert status[ServiceType.GEMINI]["message"] == "Not configured"
+
+    def test_analyze_builds_status_lazily(self, detector):
+        """Test per-service status is only formatted when requested."""
+        analysis = detector.analyze({"jira": {"url": "https://example.com"}})
+
+        assert analysis._results is None
+        assert analysis.missing_fields[ServiceType.JIRA] == ["username", "api_token"]
+
+        results = analysis.results
+        assert results[ServiceType.JIRA]["message"] == "Missing: username, api_token"
+        assert analysis.results is results
+
+    def test_iter_missing_fields(self, detector):
+        """Test missing fields can be consumed lazily."""
+        jira = {"url": "https://example.atlassian.net"}
+        assert ", ".join(detector._iter_missing_fields(jira, ServiceType.JIRA)) == (
+            "username, api_token"
+        )
+        assert detector._get_missing_fields({}, ServiceType.GEMINI) == ["API key"]
+        assert (
+            detector._get_missing_fields(
+                {"api_key": "AIzaSyTest123456789"}, ServiceType.GEMINI
+            )
+            == []
+        )
+
+    def test_detector_has_no_instance_dict(self, detector):
+        """Test ConfigDetector instances use slots."""
+        assert not hasattr(detector, "__dict__")
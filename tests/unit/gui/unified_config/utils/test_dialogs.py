@@ -0,0 +1,154 @@
+"""Tests for common dialog utilities."""
+
+from unittest.mock import patch
+
+import pytest
+from PySide6.QtCore import QObject
+from PySide6.QtWidgets import QDialog, QFileDialog, QMessageBox, QWidget
+
+from wes.gui.unified_config.utils import dialogs
+from wes.gui.unified_config.utils.dialogs import (
+    DialogManager,
+    FileDialogManager,
+    MessageType,
+)
+
+
+class TestDialogManager:
+    """Test DialogManager functionality."""
+
+    @pytest.fixture
+    def parent(self, qtbot):
+        """Create a visible parent widget for dialogs."""
+        widget = QWidget()
+        qtbot.addWidget(widget)
+        widget.show()
+        return widget
+
+    @pytest.fixture(autouse=True)
+    def reset_dedup(self, monkeypatch):
+        """Reset duplicate-suppression state between tests."""
+        monkeypatch.setattr(dialogs, "_last_message", None)
+        monkeypatch.setattr(dialogs, "_last_message_time", 0.0)
+
+    @patch.object(QMessageBox, "exec", return_value=0)
+    def test_message_box_reused_per_parent(self, mock_exec, parent):
+        """Test the same message box is reused for one parent."""
+        DialogManager.show_error(parent, "Error", "First", details="Trace")
+        box = parent.findChild(QMessageBox, dialogs._MESSAGE_BOX_NAME)
+        assert box.detailedText() == "Trace"
+
+        DialogManager.show_warning(parent, "Warning", "Second")
+
+        assert parent.findChildren(QMessageBox) == [box]
+        assert box.text() == "Second"
+        assert box.icon() == QMessageBox.Warning
+        assert box.detailedText() == ""
+        assert mock_exec.call_count == 2
+
+    @patch.object(QMessageBox, "exec", return_value=0)
+    def test_identical_messages_coalesced(self, mock_exec, parent):
+        """Test identical messages fired back to back are shown once."""
+        for _ in range(3):
+            DialogManager.show_message(parent, "Error", "Bad", MessageType.ERROR)
+
+        assert mock_exec.call_count == 1
+
+        DialogManager.show_message(parent, "Error", "Other", MessageType.ERROR)
+        assert mock_exec.call_count == 2
+
+    @pytest.mark.parametrize(
+        "message_type,expected_icon",
+        [
+            (MessageType.INFO, QMessageBox.Information),
+            (MessageType.WARNING, QMessageBox.Warning),
+            (MessageType.ERROR, QMessageBox.Critical),
+            (MessageType.SUCCESS, QMessageBox.Information),
+            (MessageType.QUESTION, QMessageBox.Information),
+        ],
+    )
+    @patch.object(QMessageBox, "exec", return_value=0)
+    def test_icon_for_message_type(
+        self, mock_exec, parent, message_type, expected_icon
+    ):
+        """Test each message type maps to the expected icon."""
+        DialogManager.show_message(parent, "success", "Done", message_type)
+
+        box = parent.findChild(QMessageBox, dialogs._MESSAGE_BOX_NAME)
+        assert box.icon() == expected_icon
+        if message_type is MessageType.INFO:
+            assert box.windowTitle() == "Success"
+
+    @patch.object(QMessageBox, "exec", return_value=0)
+    def test_hidden_parent_drops_info_and_defers_errors(self, mock_exec, qtbot):
+        """Test messages for a hidden parent are dropped or deferred."""
+        hidden = QWidget()
+        qtbot.addWidget(hidden)
+
+        DialogManager.show_info(hidden, "Info", "Startup note")
+        for _ in range(3):
+            DialogManager.show_error(hidden, "Error", "Startup failure")
+
+        pending = hidden.findChild(QObject, dialogs._PENDING_MESSAGES_NAME)
+        assert len(pending.messages) == 1
+
+        # Nothing is shown while the parent stays hidden
+        qtbot.wait(20)
+        assert mock_exec.call_count == 0
+
+        hidden.show()
+        qtbot.waitUntil(lambda: mock_exec.call_count == 1)
+        assert not pending.messages
+
+    @patch.object(QMessageBox, "exec", return_value=0)
+    def test_deferred_messages_discarded_with_parent(self, mock_exec, qtbot):
+        """Test messages queued for a destroyed parent are never shown."""
+        hidden = QWidget()
+        DialogManager.show_error(hidden, "Error", "Startup failure")
+        pending = hidden.findChild(QObject, dialogs._PENDING_MESSAGES_NAME)
+
+        with qtbot.waitSignal(pending.destroyed):
+            hidden.deleteLater()
+        qtbot.wait(20)
+
+        assert mock_exec.call_count == 0
+
+    def test_static_helpers_cannot_be_instantiated(self):
+        """Test the dialog helper namespaces reject instantiation."""
+        for cls in (DialogManager, dialogs.ValidationDialog, dialogs.FileDialogManager):
+            with pytest.raises(TypeError):
+                cls()
+
+
+class TestFileDialogManager:
+    """Test FileDialogManager functionality."""
+
+    @pytest.fixture
+    def parent(self, qtbot):
+        """Create a parent widget for dialogs."""
+        widget = QWidget()
+        qtbot.addWidget(widget)
+        return widget
+
+    @patch.object(QFileDialog, "selectedFiles", return_value=["/tmp/config.json"])
+    @patch.object(QFileDialog, "exec", return_value=QDialog.Accepted)
+    def test_file_dialog_reused_per_parent(self, mock_exec, mock_selected, parent):
+        """Test one file dialog is reused across open and save requests."""
+        path = FileDialogManager.get_json_file_path(parent, directory="/tmp")
+        dialog = parent.findChild(QFileDialog, dialogs._FILE_DIALOG_NAME)
+
+        assert path == "/tmp/config.json"
+        assert dialog.acceptMode() == QFileDialog.AcceptOpen
+        assert dialog.nameFilters() == ["JSON Files (*.json)", "All Files (*)"]
+
+        FileDialogManager.get_save_file_path(parent, "Save Summary")
+
+        assert parent.findChildren(QFileDialog) == [dialog]
+        assert dialog.acceptMode() == QFileDialog.AcceptSave
+        assert dialog.windowTitle() == "Save Summary"
+
+    @patch.object(QFileDialog, "exec", return_value=QDialog.Rejected)
+    def test_cancelled_dialog_returns_none(self, mock_exec, parent):
+        """Test cancelling a file dialog returns None."""
+        assert FileDialogManager.get_open_file_path(parent) is None
+        assert FileDialogManager.get_directory_path(parent) is None
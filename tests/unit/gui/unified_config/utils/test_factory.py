@@ -0,0 +1,123 @@
+"""Tests for config page factories."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from wes.core.config_manager import ConfigManager
+from wes.gui.unified_config.config_pages.jira_page import JiraConfigPage
+from wes.gui.unified_config.types import ServiceType
+from wes.gui.unified_config.utils import factory as factory_module
+from wes.gui.unified_config.utils.factory import (
+    DefaultConfigPageFactory,
+    get_config_page_factory,
+    set_config_page_factory,
+)
+
+
+class TestDefaultConfigPageFactory:
+    """Test DefaultConfigPageFactory functionality."""
+
+    @pytest.fixture
+    def config_manager(self):
+        """Create a mock ConfigManager."""
+        manager = Mock(spec=ConfigManager)
+        manager.config = {}
+        manager.retrieve_credential.return_value = None
+        return manager
+
+    def test_default_pages_are_lazy(self):
+        """Test that default pages are registered without importing them."""
+        factory = DefaultConfigPageFactory()
+
+        for entry in factory._page_registry.values():
+            assert isinstance(entry, tuple)
+        assert factory.get_supported_services() == [
+            ServiceType.JIRA,
+            ServiceType.GEMINI,
+        ]
+
+    def test_create_page_resolves_and_memoizes(self, qtbot, config_manager):
+        """Test that a lazy entry is replaced by its class on first use."""
+        factory = DefaultConfigPageFactory()
+
+        page = factory.create_page(ServiceType.JIRA, config_manager)
+        qtbot.addWidget(page)
+
+        assert isinstance(page, JiraConfigPage)
+        assert factory._page_registry[ServiceType.JIRA] is JiraConfigPage
+
+    def test_register_page_overrides_default(self, config_manager):
+        """Test that a registered class is used directly."""
+        factory = DefaultConfigPageFactory()
+        page_class = Mock()
+
+        factory.register_page(ServiceType.GEMINI, page_class)
+        factory.create_page(ServiceType.GEMINI, config_manager)
+
+        page_class.assert_called_once_with(config_manager, None)
+
+    def test_create_page_unknown_service(self, config_manager):
+        """Test that an unregistered service raises ValueError."""
+        factory = DefaultConfigPageFactory()
+        factory._page_registry.clear()
+
+        with pytest.raises(ValueError):
+            factory.create_page(ServiceType.JIRA, config_manager)
+
+
+class TestDefaultFactorySingleton:
+    """Test the lazily created default factory."""
+
+    @pytest.fixture(autouse=True)
+    def reset_singleton(self, monkeypatch):
+        """Start each test without a default factory."""
+        monkeypatch.setattr(factory_module, "_default_factory", None)
+
+    def test_created_on_first_use(self):
+        """Test that the default factory is created once and reused."""
+        first = get_config_page_factory()
+
+        assert isinstance(first, DefaultConfigPageFactory)
+        assert get_config_page_factory() is first
+
+    def test_set_config_page_factory(self):
+        """Test that a custom factory replaces the default."""
+        custom = factory_module.TestConfigPageFactory()
+        set_config_page_factory(custom)
+
+        assert get_config_page_factory() is custom
+
+    def test_set_config_page_factory_rejects_invalid(self):
+        """Test that objects without create_page are rejected."""
+        with pytest.raises(TypeError):
+            set_config_page_factory(object())
+
+        assert factory_module._default_factory is None
+
+
+class TestTestConfigPageFactory:
+    """Test the mock-friendly page factory."""
+
+    def test_returns_mock_and_tracks_requests(self):
+        """Test that mock pages are returned and requests recorded."""
+        mock_page = Mock()
+        config_manager = Mock()
+        factory = factory_module.TestConfigPageFactory({ServiceType.JIRA: mock_page})
+
+        assert factory.create_page(ServiceType.JIRA, config_manager) is mock_page
+        assert factory.created_pages == [(ServiceType.JIRA, config_manager)]
+
+    def test_fallback_factory_reused(self, monkeypatch):
+        """Test that real pages come from one fallback factory."""
+        factory = factory_module.TestConfigPageFactory()
+        monkeypatch.setattr(
+            DefaultConfigPageFactory, "create_page", lambda *args: Mock()
+        )
+
+        factory.create_page(ServiceType.JIRA, Mock())
+        fallback = factory._fallback
+        factory.create_page(ServiceType.GEMINI, Mock())
+
+        assert isinstance(fallback, DefaultConfigPageFactory)
+        assert factory._fallback is fallback
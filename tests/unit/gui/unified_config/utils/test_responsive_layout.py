@@ -0,0 +1,176 @@
+"""Tests for the responsive layout manager."""
+
+from unittest.mock import patch
+
+import pytest
+from PySide6.QtCore import QEvent
+from PySide6.QtWidgets import QApplication, QLabel, QVBoxLayout, QWidget
+
+from wes.gui.unified_config.utils.responsive_layout import (
+    ResponsiveConfigLayout,
+    mark_description,
+)
+
+
+class TestResponsiveConfigLayout:
+    """Test ResponsiveConfigLayout functionality."""
+
+    @pytest.fixture
+    def page(self, qtbot):
+        """Create a config page with a description label."""
+        widget = QWidget()
+        qtbot.addWidget(widget)
+        layout = QVBoxLayout(widget)
+        description = QLabel("Some help text")
+        description.setObjectName("description_label")
+        layout.addWidget(description)
+        return widget
+
+    @pytest.fixture
+    def responsive(self, page):
+        """Create a responsive layout for the page."""
+        return ResponsiveConfigLayout(page)
+
+    def test_adjust_for_size_switches_modes(self, responsive):
+        """Test switching between compact and normal mode."""
+        modes = []
+        responsive.layout_mode_changed.connect(modes.append)
+
+        responsive.adjust_for_size(700, 500)
+        assert responsive.is_compact
+        assert len(responsive.hidden_widgets) == 1
+
+        responsive.adjust_for_size(1000, 800)
+        assert not responsive.is_compact
+        assert responsive.hidden_widgets == []
+        assert modes == [True, False]
+
+    def test_updates_disabled_during_switch(self, page, responsive):
+        """Test that repaints are suspended while switching modes."""
+        states = []
+        with patch.object(
+            responsive,
+            "_apply_compact_mode",
+            side_effect=lambda: states.append(page.updatesEnabled()),
+        ):
+            responsive.adjust_for_size(700, 500)
+
+        assert states == [False]
+        assert page.updatesEnabled()
+
+    def test_adjust_for_size_same_mode_is_noop(self, responsive):
+        """Test that no tree walk happens when the mode is unchanged."""
+        with patch.object(responsive, "_apply_normal_mode") as mock_apply:
+            responsive.adjust_for_size(1000, 800)
+
+        mock_apply.assert_not_called()
+
+    def test_adjust_for_same_size_is_skipped(self, responsive):
+        """Test that repeated calls with the same size return early."""
+        responsive.adjust_for_size(1000, 800)
+
+        responsive.is_compact = True  # Would otherwise force a switch
+        with patch.object(responsive, "_apply_normal_mode") as mock_apply:
+            responsive.adjust_for_size(1000, 800)
+
+        mock_apply.assert_not_called()
+
+    def test_spacing_applies_to_nested_layouts(self, page, responsive):
+        """Test that compact spacing reaches layouts at every depth."""
+        outer = QWidget()
+        inner = QWidget(outer)
+        QVBoxLayout(outer).addWidget(inner)
+        QVBoxLayout(inner).setSpacing(12)
+        page.layout().addWidget(outer)
+
+        responsive.adjust_for_size(700, 500)
+
+        for widget in (page, outer, inner):
+            assert widget.layout().spacing() == 5
+
+        responsive.adjust_for_size(1000, 800)
+        assert inner.layout().spacing() == 10
+
+    def test_description_widgets_are_cached(self, responsive):
+        """Test that description widgets are resolved once and reused."""
+        responsive.adjust_for_size(700, 500)
+        responsive.adjust_for_size(1000, 800)
+
+        with patch.object(responsive, "_is_description") as mock_check:
+            responsive.adjust_for_size(700, 500)
+
+        mock_check.assert_not_called()
+        assert len(responsive.hidden_widgets) == 1
+
+    def test_marked_description_is_hidden(self, page, responsive):
+        """Test that widgets tagged with mark_description are hidden."""
+        marked = mark_description(QLabel("Tagged help", page))
+        plain = QLabel("Regular text", page)
+        plain.setStyleSheet("color: gray;")
+
+        responsive.adjust_for_size(700, 500)
+
+        assert marked in responsive.hidden_widgets
+        assert plain not in responsive.hidden_widgets
+
+    def test_invalidate_description_cache(self, page, responsive):
+        """Test that newly added descriptions are found after invalidation."""
+        responsive.adjust_for_size(700, 500)
+        responsive.adjust_for_size(1000, 800)
+
+        extra = QLabel("More help", page)
+        extra.setProperty("is_description", True)
+        responsive.invalidate_description_cache()
+        responsive.adjust_for_size(700, 500)
+
+        assert extra in responsive.hidden_widgets
+        assert len(responsive.hidden_widgets) == 2
+
+    def test_destroyed_description_invalidates_cache(self, page, responsive):
+        """Test that deleting a cached description drops the cache."""
+        responsive.adjust_for_size(700, 500)
+        label = responsive.hidden_widgets[0]
+
+        label.setParent(None)
+        label.deleteLater()
+        del label
+        QApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+
+        assert responsive._description_cache is None
+
+    def test_collapsible_section_title(self, qtbot, responsive):
+        """Test that the title indicator follows the checked state."""
+        content = QLabel("Content")
+        group = responsive.create_collapsible_section("Advanced", content)
+        qtbot.addWidget(group)
+
+        assert group.title() == "▶ Advanced"
+        group.setChecked(True)
+        assert group.title() == "▼ Advanced"
+
+    def test_two_column_layout_split(self, qtbot, responsive):
+        """Test that items are split with the extra item on the right."""
+        items = [QLabel(str(i)) for i in range(5)]
+        for item in items:
+            qtbot.addWidget(item)
+
+        layout = responsive.create_two_column_layout(items)
+
+        assert [layout.itemAtPosition(row, 0).widget() for row in range(2)] == items[:2]
+        assert [layout.itemAtPosition(row, 1).widget() for row in range(3)] == items[2:]
+        assert layout.itemAtPosition(2, 0) is None
+        assert layout.rowStretch(3) == 1
+
+    def test_resize_events_are_coalesced(self, qtbot, page, responsive):
+        """Test that a burst of resizes results in a single adjustment."""
+        responsive.make_responsive()
+        page.show()
+
+        with patch.object(responsive, "adjust_for_size") as mock_adjust:
+            for width in range(900, 700, -20):
+                page.resize(width, 500)
+            mock_adjust.assert_not_called()
+
+            qtbot.waitUntil(lambda: mock_adjust.called)
+
+        mock_adjust.assert_called_once_with(page.width(), page.height())
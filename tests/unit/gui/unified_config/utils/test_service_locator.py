@@ -0,0 +1,212 @@
+"""Tests for the service locator."""
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from wes.gui.unified_config.utils.service_locator import (
+    ServiceLocator,
+    ServiceNotFoundError,
+    ServiceScope,
+    _service_locator,
+    get_service,
+    inject,
+    register_service,
+)
+
+
+class Service:
+    """Placeholder service type."""
+
+
+class TestServiceLocator:
+    """Test ServiceLocator functionality."""
+
+    @pytest.fixture
+    def locator(self):
+        """Create an empty service locator."""
+        return ServiceLocator()
+
+    def test_register_and_get(self, locator):
+        """Test retrieving a registered instance."""
+        instance = Service()
+        locator.register(Service, instance)
+
+        assert locator.get(Service) is instance
+
+    def test_factory_called_once(self, locator):
+        """Test that a factory's instance is cached."""
+        factory = Mock(side_effect=Service)
+        locator.register_factory(Service, factory)
+
+        assert locator.get(Service) is locator.get(Service)
+        factory.assert_called_once_with()
+
+    def test_missing_service_raises(self, locator):
+        """Test that an unknown service raises ServiceNotFoundError."""
+        with pytest.raises(ServiceNotFoundError):
+            locator.get(Service)
+        assert locator.get_optional(Service, "default") == "default"
+
+    def test_default_factory_used_lazily(self):
+        """Test that default factories only run on first request."""
+        factory = Mock(side_effect=Service)
+        locator = ServiceLocator(default_factories={Service: factory})
+
+        factory.assert_not_called()
+        instance = locator.get(Service)
+
+        assert isinstance(instance, Service)
+        assert locator.get(Service) is instance
+        factory.assert_called_once_with()
+
+    def test_registered_factory_overrides_default(self):
+        """Test that an explicit factory wins over the default."""
+        default = Mock(side_effect=Service)
+        locator = ServiceLocator(default_factories={Service: default})
+        locator.register_factory(Service, lambda: "custom")
+
+        assert locator.get(Service) == "custom"
+        default.assert_not_called()
+
+    def test_clear_removes_defaults(self):
+        """Test that clear also forgets default factories."""
+        locator = ServiceLocator(default_factories={Service: Service})
+        locator.clear()
+
+        with pytest.raises(ServiceNotFoundError):
+            locator.get(Service)
+
+    def test_none_instance_is_returned(self, locator):
+        """Test that a service registered as None is not treated as missing."""
+        factory = Mock()
+        locator.register(Service, None)
+        locator.register_factory(Service, factory)
+
+        assert locator.get(Service) is None
+        factory.assert_not_called()
+
+    def test_concurrent_get_creates_once(self, locator):
+        """Test that concurrent first requests share one instance."""
+        started = threading.Event()
+
+        def slow_factory():
+            started.wait(1)
+            return Service()
+
+        factory = Mock(side_effect=slow_factory)
+        locator.register_factory(Service, factory)
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(locator.get(Service)))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        started.set()
+        for thread in threads:
+            thread.join()
+
+        factory.assert_called_once_with()
+        assert len({id(result) for result in results}) == 1
+
+
+class TestInject:
+    """Test the inject decorator."""
+
+    def test_injects_and_caches_service(self):
+        """Test that the service is resolved once and reused."""
+        factory = Mock(side_effect=Service)
+
+        @inject(Service)
+        def use(service):
+            return service
+
+        with ServiceScope() as scope:
+            scope.register_factory(Service, factory)
+            first = use()
+
+            assert isinstance(first, Service)
+            assert use() is first
+            factory.assert_called_once_with()
+
+    def test_explicit_argument_wins(self):
+        """Test that a caller-provided service is not replaced."""
+
+        @inject(Service)
+        def use(service):
+            return service
+
+        assert use(service="mine") == "mine"
+
+    def test_reregistration_invalidates_cache(self):
+        """Test that registering a new instance is picked up."""
+
+        @inject(Service)
+        def use(service):
+            return service
+
+        with ServiceScope() as scope:
+            first, second = Service(), Service()
+            scope.register(Service, first)
+            assert use() is first
+
+            scope.register(Service, second)
+            assert use() is second
+
+        with pytest.raises(ServiceNotFoundError):
+            use()
+
+
+class TestServiceScope:
+    """Test ServiceScope rollback."""
+
+    def test_restores_overridden_service(self):
+        """Test that an overridden service is restored on exit."""
+        original = Service()
+        register_service(Service, original)
+        try:
+            with ServiceScope() as scope:
+                scope.register(Service, Service())
+                scope.register(Service, Service())
+                assert get_service(Service) is not original
+
+            assert get_service(Service) is original
+        finally:
+            _service_locator.remove(Service)
+
+    def test_factory_instance_dropped_on_exit(self):
+        """Test that instances built by a scoped factory do not leak."""
+        with ServiceScope() as scope:
+            scope.register_factory(Service, Service)
+            assert isinstance(get_service(Service), Service)
+
+        with pytest.raises(ServiceNotFoundError):
+            get_service(Service)
+
+    def test_lazy_instance_dropped_on_exit(self):
+        """Test that an instance created from an outside factory does not leak."""
+        _service_locator.register_factory(Service, Service)
+        try:
+            with ServiceScope():
+                inside = get_service(Service)
+
+            assert get_service(Service) is not inside
+        finally:
+            _service_locator.remove(Service)
+
+    def test_lazy_instance_recorded_by_innermost_scope(self):
+        """Test that nested scopes each roll back their own instances."""
+        _service_locator.register_factory(Service, Service)
+        try:
+            with ServiceScope():
+                outer = get_service(Service)
+                with ServiceScope() as inner:
+                    inner.register(Service, Service())
+                assert get_service(Service) is outer
+
+            assert Service not in _service_locator._services
+        finally:
+            _service_locator.remove(Service)
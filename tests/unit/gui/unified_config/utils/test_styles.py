@@ -0,0 +1,123 @@
+"""Tests for style management."""
+
+import pytest
+
+from wes.gui.unified_config.utils import styles
+from wes.gui.unified_config.utils.styles import StyleConstants, StyleManager
+
+
+class TestStyleManager:
+    """Test StyleManager functionality."""
+
+    @pytest.mark.parametrize("variant", ["primary", "secondary", "danger"])
+    def test_button_style_reused(self, variant):
+        """Test that repeat calls return the same stylesheet object."""
+        style = StyleManager.get_button_style(variant)
+
+        assert "QPushButton" in style
+        assert StyleManager.get_button_style(variant) is style
+
+    def test_button_variants_rendered(self):
+        """Test that each variant fills the template with its own values."""
+        primary = StyleManager.get_button_style("primary")
+        secondary = StyleManager.get_button_style("secondary")
+
+        assert "font-weight: bold;" in primary
+        assert "QPushButton:disabled" in primary
+        assert "font-weight: normal;" in secondary
+        assert "border: 1px solid #d0d0d0;" in secondary
+        assert "QPushButton:disabled" not in secondary
+        assert "{{" not in primary
+
+    def test_unknown_button_variant(self):
+        """Test that unknown button variants have no style."""
+        assert StyleManager.get_button_style("unknown") == ""
+
+    @pytest.mark.parametrize(
+        "variant, color",
+        [
+            ("success", "#28a745"),
+            ("danger", "#dc3545"),
+            ("secondary", "#666666"),
+            ("unknown", "#212529"),
+        ],
+    )
+    def test_label_style(self, variant, color):
+        """Test label colors per variant."""
+        assert StyleManager.get_label_style(variant) == f"color: {color};"
+
+    def test_label_style_reused(self):
+        """Test that label styles are prebuilt strings."""
+        assert StyleManager.get_label_style("info") is StyleManager.get_label_style(
+            "info"
+        )
+
+    def test_group_box_style(self):
+        """Test that only collapsible group boxes style the indicator."""
+        plain = StyleManager.get_group_box_style()
+        collapsible = StyleManager.get_group_box_style(collapsible=True)
+
+        assert "QGroupBox::indicator" not in plain
+        assert "QGroupBox::indicator" in collapsible
+        assert StyleManager.get_group_box_style(collapsible=True) is collapsible
+
+    @pytest.mark.parametrize(
+        "getter",
+        [
+            StyleManager.get_scroll_area_style,
+            StyleManager.get_compact_mode_style,
+            StyleManager.get_dialog_header_style,
+        ],
+    )
+    def test_fixed_styles_reused(self, getter):
+        """Test that fixed stylesheets are built once."""
+        assert getter() is getter()
+
+    @pytest.mark.parametrize(
+        "getter, constant",
+        [
+            (StyleManager.get_scroll_area_style, styles.SCROLL_AREA_STYLE),
+            (StyleManager.get_compact_mode_style, styles.COMPACT_MODE_STYLE),
+            (StyleManager.get_dialog_header_style, styles.DIALOG_HEADER_STYLE),
+            (StyleManager.get_group_box_style, styles.GROUP_BOX_STYLE),
+            (
+                lambda: StyleManager.get_group_box_style(collapsible=True),
+                styles.GROUP_BOX_COLLAPSIBLE_STYLE,
+            ),
+            (
+                lambda: StyleManager.get_button_style("primary"),
+                styles.BUTTON_PRIMARY_STYLE,
+            ),
+        ],
+    )
+    def test_getters_return_module_constants(self, getter, constant):
+        """Test that getters hand out the module-level stylesheets."""
+        assert getter() is constant
+
+    def test_combined_style(self):
+        """Test that fragments are joined in order and cached."""
+        combined = StyleManager.get_combined_style("header", "button_primary")
+
+        assert combined == styles.DIALOG_HEADER_STYLE + styles.BUTTON_PRIMARY_STYLE
+        assert StyleManager.get_combined_style("header", "button_primary") is combined
+
+    def test_combined_style_unknown_fragment(self):
+        """Test that unknown fragment names are rejected."""
+        with pytest.raises(ValueError, match="missing"):
+            StyleManager.get_combined_style("header", "missing")
+
+
+class TestStyleConstants:
+    """Test StyleConstants values."""
+
+    def test_dialog_sizes_by_attribute(self):
+        """Test that dialog sizes are read as attributes."""
+        sizes = StyleConstants.DIALOG_SIZES
+
+        assert sizes.medium == (600, 500)
+        assert sizes._asdict() == {
+            "small": (400, 300),
+            "medium": (600, 500),
+            "large": (800, 600),
+            "xlarge": (1000, 800),
+        }
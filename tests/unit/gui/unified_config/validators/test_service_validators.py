@@ -4,10 +4,16 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from wes.gui.unified_config.types import ServiceType
+from wes.gui.unified_config.types import JiraType, ServiceType
+from wes.gui.unified_config.validators.base_validator import (
+    BaseValidator,
+    required_message,
+)
 from wes.gui.unified_config.validators.service_validators import (
     GeminiValidator,
     JiraValidator,
+    _client_module,
+    _jira_type,
     get_validator,
 )
 
@@ -122,6 +128,54 @@ class TestJiraValidator:
         valid, msg = validator.validate_field("url", "not-a-url")
         assert valid is False
 
+    @pytest.mark.parametrize(
+        "url, message",
+        [
+            ("https://jira.atlassian.net", "Atlassian Cloud URL detected"),
+            ("https://issues.example.com/JIRA", "Valid Jira URL"),
+            ("https://issues.example.com", "URL format is valid"),
+        ],
+    )
+    def test_validate_url_messages(self, validator, url, message):
+        """Test the URL hint reported for valid URLs."""
+        assert validator.validate_field("url", url) == (True, message)
+
+    @pytest.mark.parametrize(
+        "url, expected",
+        [
+            ("https://example.atlassian.net", True),
+            ("HTTPS://Example.com/jira", True),
+            ("http://localhost:8080", True),
+            ("https://jira.example.com?x=1", True),
+            ("ftp://example.com", False),
+            ("https://", False),
+            ("https:///path", False),
+            ("example.com", False),
+            (None, False),
+        ],
+    )
+    def test_is_valid_url(self, validator, url, expected):
+        """Test URL format checks."""
+        assert validator._is_valid_url(url) is expected
+
+    @pytest.mark.parametrize(
+        "username, expected",
+        [
+            ("user@example.com", True),
+            ("rhn-support-admiller", True),
+            ("first.last_1", True),
+            ("ab", False),
+            ("user name", False),
+            ("user$name", False),
+            ("username\n", False),
+            ("usérname", False),
+        ],
+    )
+    def test_validate_field_username(self, validator, username, expected):
+        """Test username field validation."""
+        valid, msg = validator.validate_field("username", username)
+        assert valid is expected
+
     def test_validate_field_api_token(self, validator):
         """Test API token field validation."""
         # Valid token
@@ -207,6 +261,14 @@ class TestGeminiValidator:
         result = validator.validate_config(config)
         assert result["is_valid"] is False
         assert "model" in result["message"].lower()
+        assert "gemini-2.5-flash, gemini-2.5-pro" in result["message"]
+
+    @pytest.mark.parametrize("model", ["gemini-2.5-pro", "gemini-2.5-flash"])
+    def test_validate_config_supported_models(self, validator, model):
+        """Test that each supported model is accepted."""
+        config = {"api_key": "AIzaSyTest1234567890123456789012345", "model": model}
+
+        assert validator.validate_config(config)["is_valid"] is True
 
     def test_validate_config_invalid_temperature(self, validator):
         """Test validation with invalid temperature."""
@@ -231,6 +293,12 @@ class TestGeminiValidator:
         assert valid is False
         assert "invalid characters" in msg.lower()
 
+        valid, msg = validator._validate_api_key(
+            "AIzaSyTest1234567890123456789012345\n"
+        )
+        assert valid is False
+        assert "invalid characters" in msg.lower()
+
 
 class TestValidatorRegistry:
     """Test validator registry functionality."""
@@ -244,3 +312,193 @@ class TestValidatorRegistry:
 
         gemini_validator = get_validator(ServiceType.GEMINI)
         assert isinstance(gemini_validator, GeminiValidator)
+
+    def test_package_exports_resolve(self):
+        """Test that every name exported by the validators package exists."""
+        import wes.gui.unified_config.validators as validators
+
+        for name in validators.__all__:
+            assert getattr(validators, name) is not None
+
+    def test_get_validator_shared(self):
+        """Test that validators are created once and reused."""
+        assert get_validator(ServiceType.JIRA) is get_validator(ServiceType.JIRA)
+
+    @pytest.mark.parametrize("validator_class", [JiraValidator, GeminiValidator])
+    def test_validators_have_no_instance_dict(self, validator_class):
+        """Test that validators only carry their declared slots."""
+        validator = validator_class()
+
+        assert not hasattr(validator, "__dict__")
+        with pytest.raises(AttributeError):
+            validator.extra = True
+
+
+class TestValidationCache:
+    """Test memoization of validation results."""
+
+    @pytest.fixture
+    def config(self):
+        """Create a valid Jira configuration."""
+        return {
+            "type": "cloud",
+            "url": "https://example.atlassian.net",
+            "username": "user@example.com",
+            "api_token": "test-api-token-12345",
+        }
+
+    def test_validate_config_cached(self, config):
+        """Test that identical configs are only validated once."""
+        validator = JiraValidator()
+
+        with patch.object(
+            JiraValidator,
+            "_is_valid_url",
+            autospec=True,
+            side_effect=JiraValidator._is_valid_url,
+        ) as mock_check:
+            first = validator.validate_config(config)
+            second = validator.validate_config(dict(config))
+
+        mock_check.assert_called_once()
+        assert first == second
+        assert first is not second
+
+    def test_cached_details_not_shared(self, config):
+        """Test that changing returned details leaves the cache intact."""
+        validator = JiraValidator()
+        config["url"] = "not-a-url"
+
+        first = validator.validate_config(config)
+        expected = dict(first["details"])
+        first["details"]["field"] = "changed"
+
+        assert validator.validate_config(config)["details"] == expected
+
+    def test_validate_config_changed_value(self, config):
+        """Test that a changed config is validated again."""
+        validator = JiraValidator()
+        assert validator.validate_config(config)["is_valid"] is True
+
+        config["url"] = "not-a-url"
+        assert validator.validate_config(config)["is_valid"] is False
+
+    def test_validate_config_unhashable_values(self):
+        """Test that configs with unhashable values bypass the cache."""
+        validator = GeminiValidator()
+        config = {
+            "api_key": "AIzaSyTest1234567890123456789012345",
+            "model": "gemini-2.5-pro",
+            "extra": ["unhashable"],
+        }
+
+        assert validator.validate_config(config)["is_valid"] is True
+        assert validator._config_cache == {}
+
+    def test_validate_field_cached(self):
+        """Test that field results are remembered until cleared."""
+        validator = JiraValidator()
+
+        with patch.object(
+            JiraValidator, "_validate_username", return_value=(True, "ok")
+        ) as mock_validate:
+            validator.validate_field("username", "someone")
+            validator.validate_field("username", "someone")
+            validator.clear_cache()
+            validator.validate_field("username", "someone")
+
+        assert mock_validate.call_count == 2
+
+
+class TestClientImports:
+    """Test lazy loading of integration client modules."""
+
+    def test_client_module_imported_once(self):
+        """Test that client modules are imported once and reused."""
+        _client_module.cache_clear()
+
+        with patch(
+            "wes.gui.unified_config.validators.service_validators.importlib"
+        ) as mock_importlib:
+            first = _client_module("wes.integrations.jira_client")
+            second = _client_module("wes.integrations.jira_client")
+
+        mock_importlib.import_module.assert_called_once_with(
+            "wes.integrations.jira_client"
+        )
+        assert first is second
+        _client_module.cache_clear()
+
+    @patch("wes.integrations.gemini_client.GeminiClient")
+    def test_gemini_connection_failure(self, mock_client_class):
+        """Test that client errors are reported as failed connections."""
+        mock_client_class.return_value.test_connection.side_effect = RuntimeError(
+            "boom"
+        )
+
+        success, message = GeminiValidator().validate_connection(
+            {"api_key": "AIzaSyTest1234567890123456789012345"}
+        )
+
+        assert success is False
+        assert "boom" in message
+
+
+class TestRequiredMessages:
+    """Test "is required" messages."""
+
+    def test_known_field_message_reused(self):
+        """Test that known fields reuse a prebuilt message."""
+        assert required_message("api_key") == "api_key is required"
+        assert required_message("api_key") is required_message("api_key")
+
+    def test_unknown_field_message(self):
+        """Test that other fields still get a message."""
+        valid, msg = GeminiValidator().validate_field("project", "")
+
+        assert valid is False
+        assert msg == "project is required"
+
+
+class TestJiraType:
+    """Test Jira type resolution."""
+
+    @pytest.mark.parametrize(
+        "config, expected",
+        [
+            ({}, JiraType.CLOUD),
+            ({"type": "server"}, JiraType.SERVER),
+            ({"type": "redhat"}, JiraType.REDHAT),
+            ({"type": JiraType.REDHAT}, JiraType.REDHAT),
+        ],
+    )
+    def test_jira_type(self, config, expected):
+        """Test that config values map to Jira types."""
+        assert _jira_type(config) is expected
+
+    def test_invalid_jira_type(self):
+        """Test that unknown types still raise ValueError."""
+        with pytest.raises(ValueError):
+            _jira_type({"type": "bogus"})
+
+
+class TestBaseValidator:
+    """Test the validator base class."""
+
+    def test_unimplemented_methods_raise(self):
+        """Test that subclasses must provide config and connection checks."""
+        validator = BaseValidator()
+
+        with pytest.raises(NotImplementedError):
+            validator.validate_config({})
+        with pytest.raises(NotImplementedError):
+            validator.validate_connection({})
+        assert validator.validate_field("url", "") == (False, "url is required")
+
+    def test_valid_field_result_shared(self):
+        """Test that the default success result is a shared constant."""
+        validator = BaseValidator()
+
+        first = validator.validate_field("model", "gemini-2.5-pro")
+        assert first == (True, "Valid")
+        assert validator.validate_field("model", "other") is first
@@ -0,0 +1,325 @@
+"""Tests for the direct configuration view."""
+
+import sys
+from unittest.mock import Mock, patch
+
+import pytest
+from PySide6.QtWidgets import QScrollArea
+
+from wes.core.config_manager import ConfigManager
+from wes.gui.unified_config.config_pages.jira_page import JiraConfigPage
+from wes.gui.unified_config.types import ServiceType
+from wes.gui.unified_config.utils.config_detector import ConfigDetector
+from wes.gui.unified_config.views import direct_view
+from wes.gui.unified_config.views.direct_view import DirectView
+
+
+class TestDirectView:
+    """Test DirectView functionality."""
+
+    @pytest.fixture
+    def config_manager(self):
+        """Create a mock ConfigManager."""
+        manager = Mock(spec=ConfigManager)
+        manager.config = {
+            "gemini": {"api_key": "AIzaSyTest1234567890123456789012345"},
+        }
+        manager.retrieve_credential.return_value = None
+        return manager
+
+    @pytest.fixture
+    def view(self, qtbot, config_manager):
+        """Create a DirectView instance."""
+        view = DirectView(config_manager)
+        qtbot.addWidget(view)
+        # Let the initial validation state go out before tests listen
+        qtbot.waitUntil(lambda: view._last_all_valid is not None)
+        return view
+
+    def test_only_visible_tab_is_built(self, view):
+        """Test that only the first tab's page is created up front."""
+        assert list(view.pages) == [ServiceType.JIRA]
+        assert isinstance(view.jira_page, JiraConfigPage)
+        assert not hasattr(view, "app_page")
+        assert not hasattr(view, "security_page")
+        assert view.tab_widget.count() == 4
+
+    def test_tab_built_on_first_selection(self, view):
+        """Test that selecting a tab builds its page once."""
+        view.show_service(ServiceType.GEMINI)
+        gemini_page = view.pages[ServiceType.GEMINI]
+
+        view.tab_widget.setCurrentIndex(0)
+        view.show_service(ServiceType.GEMINI)
+
+        assert view.pages[ServiceType.GEMINI] is gemini_page
+        assert view.tab_widget.currentIndex() == 1
+        assert view.tab_widget.tabText(1) == "Gemini AI"
+
+    def test_settings_tabs_built_on_selection(self, view):
+        """Test that the application and security pages are built lazily."""
+        view.tab_widget.setCurrentIndex(2)
+        view.tab_widget.setCurrentIndex(3)
+
+        assert hasattr(view, "app_page")
+        assert hasattr(view, "security_page")
+
+    def test_unbuilt_pages_use_stored_config(self, view):
+        """Test that unbuilt services are validated from the stored config."""
+        results = view.validate_all()
+
+        assert ServiceType.GEMINI not in view.pages
+        assert results[ServiceType.GEMINI]["is_valid"] is True
+        assert results[ServiceType.JIRA]["is_valid"] is False
+        assert view.tab_widget.tabToolTip(1) == "Configuration complete"
+
+    def test_stored_config_analyzed_once_per_validation(self, view):
+        """Test that the stored config is only analyzed for unbuilt pages."""
+        with patch.object(
+            ConfigDetector,
+            "get_service_status",
+            wraps=view._config_detector.get_service_status,
+        ) as mock_status:
+            view.validate_all()
+            assert mock_status.call_count == 1
+
+            view.show_service(ServiceType.GEMINI)
+            mock_status.reset_mock()
+            view.validate_all()
+
+        mock_status.assert_not_called()
+
+    def test_valid_stored_config_reports_valid_with_unbuilt_tabs(
+        self, qtbot, config_manager
+    ):
+        """Test that unbuilt tabs count as valid when their stored config is."""
+        config_manager.config = {
+            "jira": {
+                "url": "https://example.atlassian.net",
+                "username": "user@example.com",
+                "api_token": "token",
+            },
+            "gemini": {"api_key": "AIzaSyTest1234567890123456789012345"},
+        }
+        view = DirectView(config_manager)
+        qtbot.addWidget(view)
+
+        with qtbot.waitSignal(view.validation_state_changed) as blocker:
+            pass
+
+        assert blocker.args == [True]
+        assert list(view.pages) == [ServiceType.JIRA]
+
+    def test_get_configuration_skips_unbuilt_pages(self, view):
+        """Test that only built pages contribute configuration."""
+        config = view.get_configuration()
+
+        assert "jira" in config
+        assert "gemini" not in config
+
+    def test_get_configuration_reads_every_edit(self, view):
+        """Test that edits after a page's first change are still returned."""
+        view.jira_page.url_input.setText("https://first.atlassian.net")
+        view.get_configuration()
+
+        # The page is already dirty, so this edit emits no config_changed
+        view.jira_page.url_input.setText("https://second.atlassian.net")
+        config = view.get_configuration()
+
+        assert config["jira"]["url"] == "https://second.atlassian.net"
+
+    def test_tab_icon_only_set_on_change(self, view):
+        """Test that an unchanged status does not touch the tab."""
+        view.tab_widget.setTabToolTip(1, "sentinel")
+
+        view._update_tab_icons()
+
+        assert view.tab_widget.tabToolTip(1) == "sentinel"
+
+    def test_views_share_tab_icons(self, qtbot, view, config_manager):
+        """Test that the style's icons are looked up once for all views."""
+        icons = DirectView._TAB_ICONS
+
+        other = DirectView(config_manager)
+        qtbot.addWidget(other)
+
+        assert other._TAB_ICONS is icons
+        assert set(icons) == {"valid", "invalid", "warning"}
+
+    def test_page_validation_refreshes_only_its_tab(self, view):
+        """Test that a page's validation does not re-validate other pages."""
+        view.show_service(ServiceType.GEMINI)
+        gemini_page = view.pages[ServiceType.GEMINI]
+        gemini_page.validate = Mock(wraps=gemini_page.validate)
+
+        view._on_page_validated(view.jira_page, False)
+
+        gemini_page.validate.assert_not_called()
+        assert view.validation_states[ServiceType.JIRA] is False
+
+    def test_configuration_changes_are_coalesced(self, qtbot, view):
+        """Test that a burst of page changes emits at its start and end."""
+        emitted = []
+        view.configuration_changed.connect(lambda: emitted.append(True))
+
+        for _ in range(5):
+            view.jira_page.config_changed.emit({})
+        assert emitted == [True]
+
+        qtbot.waitUntil(lambda: len(emitted) == 2)
+        qtbot.wait(150)
+        assert emitted == [True, True]
+
+    def test_single_change_emits_immediately(self, qtbot, view):
+        """Test that a lone edit is reported at once and only once."""
+        emitted = []
+        view.configuration_changed.connect(lambda: emitted.append(True))
+
+        view.jira_page.config_changed.emit({})
+        assert emitted == [True]
+
+        qtbot.wait(150)
+        assert emitted == [True]
+
+    def test_get_configuration_flushes_pending_change(self, qtbot, view):
+        """Test that reading the configuration reports held-back edits first."""
+        emitted = []
+        view.jira_page.config_changed.emit({})
+        view.jira_page.config_changed.emit({})
+        view.configuration_changed.connect(lambda: emitted.append(True))
+
+        view.get_configuration()
+        assert emitted == [True]
+        assert not view._change_timer.isActive()
+
+        qtbot.wait(150)
+        assert emitted == [True]
+
+    def test_batch_updates_emit_once(self, view):
+        """Test that validations inside a batch are reported once at the end."""
+        view.show_service(ServiceType.GEMINI)
+        states = []
+        view.validation_state_changed.connect(states.append)
+
+        with view._batch_updates():
+            view._on_page_validated(view.jira_page, True)
+            view._on_page_validated(view.pages[ServiceType.GEMINI], True)
+            assert states == []
+
+        assert states == [True]
+
+    def test_refresh_without_validation_emits_nothing(self, view):
+        """Test that a refresh only reports validation when a page validated."""
+        states = []
+        view.validation_state_changed.connect(states.append)
+
+        view.refresh()
+
+        assert states == []
+
+    def test_rebuild_replaces_pages(self, view):
+        """Test that rebuilding discards the old pages and tabs."""
+        view.show_service(ServiceType.GEMINI)
+        old_jira_page = view.jira_page
+
+        view.rebuild()
+
+        assert view.tab_widget.count() == 4
+        assert list(view.pages) == [ServiceType.JIRA]
+        assert view.jira_page is not old_jira_page
+        assert not hasattr(view, "gemini_page")
+        assert view.tab_widget.tabToolTip(1) == "Configuration complete"
+
+    def test_show_service_after_rebuild(self, view):
+        """Test that the rebuilt tabs are found through the new index map."""
+        view.rebuild()
+
+        view.show_service(ServiceType.GEMINI)
+
+        assert view._tab_index == {ServiceType.JIRA: 0, ServiceType.GEMINI: 1}
+        assert view.tab_widget.currentIndex() == 1
+        assert ServiceType.GEMINI in view.pages
+
+    def test_page_complete_signal_records_state(self, view):
+        """Test that a page's completion signal reaches the view."""
+        states = []
+        view.validation_state_changed.connect(states.append)
+
+        view.jira_page.page_complete.emit(True)
+
+        assert view.validation_states[ServiceType.JIRA] is True
+        assert states == [True]
+
+    def test_tabs_share_scroll_stylesheet(self, view):
+        """Test that built tabs reuse the module stylesheet with updates on."""
+        view.show_service(ServiceType.GEMINI)
+
+        for index in (0, 1):
+            scroll_area = view.tab_widget.widget(index).findChild(QScrollArea)
+            assert scroll_area.styleSheet() == direct_view._SCROLL_QSS
+        assert view.tab_widget.updatesEnabled()
+
+    def test_replaced_page_validation_is_ignored(self, view):
+        """Test that a page discarded by a rebuild no longer records state."""
+        old_jira_page = view.jira_page
+        view.rebuild()
+        view.validation_states.clear()
+
+        view._on_page_validated(old_jira_page, True)
+
+        assert ServiceType.JIRA not in view.validation_states
+
+    def test_validation_state_emitted_on_change_only(self, view):
+        """Test that listeners only hear when the overall state flips."""
+        view.show_service(ServiceType.GEMINI)
+        gemini_page = view.pages[ServiceType.GEMINI]
+        states = []
+        view.validation_state_changed.connect(states.append)
+
+        view._on_page_validated(view.jira_page, False)
+        view._on_page_validated(view.jira_page, False)
+        view._on_page_validated(gemini_page, True)
+        view._on_page_validated(view.jira_page, True)
+        view._on_page_validated(gemini_page, True)
+        view._on_page_validated(view.jira_page, False)
+
+        assert states == [True, False]
+
+    def test_settings_pages_imported_on_first_view(
+        self, qtbot, config_manager, monkeypatch
+    ):
+        """Test that settings page modules are only imported for their tab."""
+        app_module = "wes.gui.unified_config.config_pages.app_settings_page"
+        security_module = "wes.gui.unified_config.config_pages.security_page"
+        monkeypatch.delitem(sys.modules, app_module, raising=False)
+        monkeypatch.delitem(sys.modules, security_module, raising=False)
+
+        view = DirectView(config_manager)
+        qtbot.addWidget(view)
+        view.get_configuration()
+        view.refresh()
+        assert app_module not in sys.modules
+        assert security_module not in sys.modules
+
+        view.tab_widget.setCurrentIndex(2)
+        assert app_module in sys.modules
+        assert security_module not in sys.modules
+
+    def test_refresh_does_not_report_edits(self, view, config_manager):
+        """Test that reloading pages from the stored config is not an edit."""
+        view.show_service(ServiceType.GEMINI)
+        emitted = []
+        view.configuration_changed.connect(lambda: emitted.append(True))
+        config_manager.config = {
+            "jira": {"url": "https://example.atlassian.net"},
+            "gemini": {"api_key": "AIzaSyOther12345678901234567890123456"},
+        }
+
+        view.refresh()
+
+        assert view.jira_page.url_input.text() == "https://example.atlassian.net"
+        assert emitted == []
+        assert view.tab_widget.updatesEnabled()
+
+        view.jira_page.config_changed.emit({})
+        assert emitted == [True]
@@ -0,0 +1,222 @@
+"""Tests for the guided configuration view."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from PySide6.QtWidgets import QDialog, QMessageBox, QPushButton
+
+from wes.core.config_manager import ConfigManager
+from wes.gui.unified_config.types import ServiceType, ValidationResult
+from wes.gui.unified_config.utils.config_detector import ConfigDetector
+from wes.gui.unified_config.views.guided_view import GuidedView, ServiceCard
+
+
+def _result(is_valid: bool, message: str) -> ValidationResult:
+    """Build a validation result for a card."""
+    return ValidationResult(
+        is_valid=is_valid,
+        message=message,
+        service=ServiceType.JIRA,
+        details={"configured": is_valid},
+    )
+
+
+class TestServiceCard:
+    """Test ServiceCard functionality."""
+
+    @pytest.fixture
+    def card(self, qtbot):
+        """Create a ServiceCard instance."""
+        card = ServiceCard(ServiceType.JIRA)
+        qtbot.addWidget(card)
+        return card
+
+    def test_initial_state(self, card):
+        """Test the unconfigured card state."""
+        assert card.status_message.text() == "Not configured"
+        assert card.status_message.property("state") == "error"
+        assert card.configure_button.property("state") == "primary"
+
+    def test_update_status_switches_state(self, card):
+        """Test that status changes switch the style state, not the sheet."""
+        stylesheet = card.configure_button.styleSheet()
+
+        card.update_status(_result(True, "Configuration complete"))
+
+        assert card.is_configured
+        assert card.status_message.text() == "Configured"
+        assert card.status_message.property("state") == "ok"
+        assert card.configure_button.text() == "Modify"
+        assert card.configure_button.property("state") == "secondary"
+        assert card.configure_button.styleSheet() == stylesheet
+
+        card.update_status(_result(False, "Missing: url"))
+
+        assert card.status_message.text() == "Missing: url"
+        assert card.configure_button.property("state") == "primary"
+
+    def test_update_status_unchanged_is_noop(self, card):
+        """Test that repeating a status does not touch the widgets."""
+        card.update_status(_result(False, "Missing: url"))
+
+        with patch.object(card.status_message, "setText") as mock_set_text:
+            card.update_status(_result(False, "Missing: url"))
+
+        mock_set_text.assert_not_called()
+
+    def test_message_change_only_updates_message(self, card):
+        """Test that a new message in the same state leaves the rest alone."""
+        card.update_status(_result(False, "Missing: url"))
+
+        with (
+            patch.object(card.configure_button, "setText") as mock_button_text,
+            patch.object(card.status_icon, "setText") as mock_icon_text,
+        ):
+            card.update_status(_result(False, "Missing: api_token"))
+
+        assert card.status_message.text() == "Missing: api_token"
+        mock_button_text.assert_not_called()
+        mock_icon_text.assert_not_called()
+
+    def test_cards_share_presentation_data(self, qtbot, card):
+        """Test that cards reuse one icon font and carry no own stylesheet."""
+        other = ServiceCard(ServiceType.GEMINI)
+        qtbot.addWidget(other)
+
+        assert other.styleSheet() == card.styleSheet() == ""
+        assert other.objectName() == card.objectName() == "card"
+        assert ServiceCard._ICON_FONT is not None
+        assert other.status_icon.font().pointSize() == 24
+
+
+class TestGuidedView:
+    """Test GuidedView functionality."""
+
+    @pytest.fixture
+    def config_manager(self):
+        """Create a mock ConfigManager with Gemini configured."""
+        manager = Mock(spec=ConfigManager)
+        manager.config = {
+            "gemini": {"api_key": "AIzaSyTest1234567890123456789012345"},
+        }
+        manager.retrieve_credential.return_value = None
+        return manager
+
+    @pytest.fixture
+    def view(self, qtbot, config_manager):
+        """Create a GuidedView instance."""
+        view = GuidedView(config_manager)
+        qtbot.addWidget(view)
+        return view
+
+    def test_cards_styled_by_their_container(self, view):
+        """Test that one stylesheet on the cards' container styles every card."""
+        containers = {card.parentWidget() for card in view.service_cards.values()}
+
+        assert len(containers) == 1
+        assert containers.pop().styleSheet() == ServiceCard._CARD_QSS
+
+    def test_cards_reflect_status(self, view):
+        """Test that each card shows its service status."""
+        assert view.service_cards[ServiceType.GEMINI].is_configured
+        assert not view.service_cards[ServiceType.JIRA].is_configured
+        assert not view.continue_button.isEnabled()
+
+    def test_continue_reuses_refreshed_status(self, view):
+        """Test that continuing does not analyze the config again."""
+        with (
+            patch.object(ConfigDetector, "get_service_status") as mock_status,
+            patch.object(QMessageBox, "information") as mock_info,
+        ):
+            view._check_and_continue()
+
+        mock_status.assert_not_called()
+        assert "Jira" in mock_info.call_args[0][2]
+
+    def test_status_recomputed_after_config_change(self, view, config_manager):
+        """Test that a changed config is analyzed again."""
+        config_manager.config = {
+            "jira": {
+                "url": "https://example.atlassian.net",
+                "username": "user@example.com",
+                "api_token": "token",
+            },
+            "gemini": {"api_key": "AIzaSyTest1234567890123456789012345"},
+        }
+
+        view.refresh_status()
+
+        assert view.service_cards[ServiceType.JIRA].is_configured
+        assert view.continue_button.isEnabled()
+
+    def test_continue_button_restyled_on_change_only(self, view, config_manager):
+        """Test that the continue button is only restyled when its state flips."""
+        config_manager.config = {
+            "jira": {
+                "url": "https://example.atlassian.net",
+                "username": "user@example.com",
+                "api_token": "token",
+            },
+            "gemini": {"api_key": "AIzaSyTest1234567890123456789012345"},
+        }
+        view.refresh_status()
+        assert view.continue_button.text() == "All Configured! Continue →"
+
+        with patch.object(view.continue_button, "setStyleSheet") as mock_style:
+            view.refresh_status()
+        mock_style.assert_not_called()
+
+        config_manager.config = {}
+        view.refresh_status()
+        assert not view.continue_button.isEnabled()
+        assert view.continue_button.text() == "Continue to Settings"
+
+    def test_card_click_configures_its_service(self, qtbot, config_manager):
+        """Test that each card opens the configuration for its own service."""
+        with patch.object(GuidedView, "_configure_service") as mock_configure:
+            view = GuidedView(config_manager)
+            qtbot.addWidget(view)
+
+            view.service_cards[ServiceType.GEMINI].configure_button.click()
+
+        mock_configure.assert_called_once_with(ServiceType.GEMINI)
+
+    @patch.object(QDialog, "exec", return_value=QDialog.Rejected)
+    def test_services_share_one_dialog(self, mock_exec, view):
+        """Test that services reuse one dialog and build their pages once."""
+        view._configure_service(ServiceType.JIRA)
+        dialog = view._config_dialog
+        jira_page = view.config_pages[ServiceType.JIRA]
+
+        view._configure_service(ServiceType.GEMINI)
+        assert view._config_stack.currentWidget() is (
+            view.config_pages[ServiceType.GEMINI]
+        )
+
+        view._configure_service(ServiceType.JIRA)
+        assert view._config_dialog is dialog
+        assert view.config_pages[ServiceType.JIRA] is jira_page
+        assert view._config_stack.count() == 2
+        assert view._config_stack.currentWidget() is jira_page
+        assert dialog.windowTitle() == "Configure Jira"
+        assert mock_exec.call_count == 3
+
+    @patch.object(QDialog, "exec", return_value=QDialog.Rejected)
+    def test_save_uses_current_page(self, mock_exec, view):
+        """Test that saving acts on the service the dialog is showing."""
+        view._configure_service(ServiceType.JIRA)
+        view._configure_service(ServiceType.GEMINI)
+        save_button = next(
+            button
+            for button in view._config_dialog.findChildren(QPushButton)
+            if button.text() == "Save"
+        )
+
+        with patch.object(view, "_save_service_config") as mock_save:
+            save_button.click()
+
+        mock_save.assert_called_once_with(
+            ServiceType.GEMINI,
+            view.config_pages[ServiceType.GEMINI],
+            view._config_dialog,
+        )
@@ -0,0 +1,97 @@
+"""Tests for the wizard configuration view."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from wes.core.config_manager import ConfigManager
+from wes.gui.unified_config.config_pages.gemini_page import GeminiConfigPage
+from wes.gui.unified_config.config_pages.jira_page import JiraConfigPage
+from wes.gui.unified_config.views.wizard_view import WelcomePage, WizardView
+
+
+class TestWizardView:
+    """Test WizardView functionality."""
+
+    @pytest.fixture
+    def config_manager(self):
+        """Create a mock ConfigManager."""
+        manager = Mock(spec=ConfigManager)
+        manager.config = {
+            "gemini": {"api_key": "AIzaSyTest1234567890123456789012345"},
+        }
+        manager.retrieve_credential.return_value = None
+        return manager
+
+    @pytest.fixture
+    def view(self, qtbot, config_manager):
+        """Create a WizardView instance."""
+        view = WizardView(config_manager)
+        qtbot.addWidget(view)
+        return view
+
+    def test_only_welcome_page_is_built(self, view):
+        """Test that only the first page is created up front."""
+        assert isinstance(view.pages[0], WelcomePage)
+        assert view.pages[1:] == [None, None, None]
+        assert view.page_stack.count() == 4
+        assert view.step_label.text() == "Step 1 of 4"
+
+    def test_page_built_when_shown(self, view):
+        """Test that advancing builds the next page once."""
+        view._go_next()
+        jira_page = view.pages[1]
+
+        view._go_back()
+        view._go_next()
+
+        assert isinstance(jira_page, JiraConfigPage)
+        assert view.pages[1] is jira_page
+        assert view.pages[2] is None
+        assert view.page_stack.currentWidget().isAncestorOf(jira_page)
+
+    def test_page_attributes_build_on_access(self, view):
+        """Test that the page attributes build their page when first used."""
+        assert isinstance(view.gemini_page, GeminiConfigPage)
+        assert view.pages[2] is view.gemini_page
+
+        config = view.get_configuration()
+
+        assert config["gemini"]["api_key"] == "AIzaSyTest1234567890123456789012345"
+        assert view.pages[1] is view.jira_page
+        assert view.current_page == 0
+
+    def test_page_info_for_unbuilt_page(self, view):
+        """Test that page info reports the real page, building it if needed."""
+        info = view.get_page_info(3)
+
+        assert info == {
+            "title": view.summary_page.title,
+            "description": view.summary_page.description,
+        }
+        assert info["title"] != "Configuration"
+        assert view.get_page_info(4) is None
+
+    def test_summary_reflects_pages(self, view):
+        """Test that reaching the summary shows each service's status."""
+        view.current_page = 3
+        view._update_navigation()
+
+        labels = view.summary_page.status_labels
+        assert "Not configured" in labels["jira_status"].text()
+        assert "Configured" in labels["gemini_status"].text()
+        assert view.next_button.text() == "Finish"
+
+    def test_summary_reuses_validation_from_next(self, view):
+        """Test that pages validated on Next are not validated again."""
+        view.current_page = 2
+        view._update_navigation()
+
+        with patch.object(
+            GeminiConfigPage, "validate", wraps=view.gemini_page.validate
+        ) as mock_validate:
+            view._go_next()
+
+        mock_validate.assert_called_once_with()
+        assert view.current_page == 3
+        assert "Configured" in view.summary_page.status_labels["gemini_status"].text()
@@ -0,0 +1,254 @@
+"""Tests for the shared integration client helpers."""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from wes.integrations.base_client import (
+    BaseIntegrationClient,
+    RateLimiter,
+    RetryStrategy,
+)
+from wes.utils.exceptions import (
+    AuthenticationError,
+    ConnectionError,
+    IntegrationError,
+)
+
+
+class _Client(BaseIntegrationClient):
+    """Minimal concrete client for exercising the shared request path."""
+
+    async def authenticate(self) -> bool:
+        return True
+
+    async def validate_connection(self) -> bool:
+        return True
+
+
+class TestRateLimiter:
+    """Test RateLimiter functionality."""
+
+    @pytest.mark.asyncio
+    async def test_expired_requests_are_evicted(self):
+        """Test that requests older than the window no longer count."""
+        limiter = RateLimiter(max_requests=2, time_window=60)
+
+        with patch("wes.integrations.base_client.time.monotonic") as mock_clock:
+            mock_clock.return_value = 100.0
+            await limiter.acquire()
+            mock_clock.return_value = 130.0
+            await limiter.acquire()
+            assert limiter.current_usage == 100.0
+
+            mock_clock.return_value = 160.0
+            assert limiter.current_usage == 50.0
+            await limiter.acquire()
+
+        assert list(limiter.requests) == [130.0, 160.0]
+
+    @pytest.mark.asyncio
+    async def test_full_window_waits_for_room(self):
+        """Test that a full limiter sleeps until the oldest request expires."""
+        limiter = RateLimiter(max_requests=1, time_window=60)
+
+        with (
+            patch("wes.integrations.base_client.time.monotonic") as mock_clock,
+            patch(
+                "wes.integrations.base_client.asyncio.sleep", new_callable=AsyncMock
+            ) as mock_sleep,
+        ):
+            mock_clock.side_effect = [100.0, 110.0, 160.0]
+            await limiter.acquire()
+            await limiter.acquire()
+
+        mock_sleep.assert_awaited_once_with(50.0)
+        assert list(limiter.requests) == [160.0]
+
+    def test_reset_clears_requests(self):
+        """Test that reset forgets every request."""
+        limiter = RateLimiter(max_requests=2, time_window=60)
+        limiter.requests.append(1.0)
+
+        limiter.reset()
+
+        assert limiter.current_usage == 0.0
+
+
+class TestRetryStrategy:
+    """Test RetryStrategy functionality."""
+
+    def test_delays_grow_to_the_cap(self):
+        """Test that delays grow exponentially up to max_delay."""
+        strategy = RetryStrategy(max_retries=3, max_delay=5.0, jitter=False)
+
+        delays = [strategy.get_delay(retry_count) for retry_count in range(5)]
+
+        assert delays == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+    def test_jitter_scales_delay_down_by_at_most_half(self):
+        """Test that jitter keeps the delay between half and all of it."""
+        strategy = RetryStrategy(max_retries=3)
+
+        with patch("wes.integrations.base_client.random.random", return_value=0.5):
+            assert strategy.get_delay(2) == 3.0
+
+    @pytest.mark.asyncio
+    async def test_only_listed_exceptions_are_retried(self):
+        """Test that retry_on decides which failures are retried."""
+        strategy = RetryStrategy(max_retries=2, initial_delay=0, jitter=False)
+        func = AsyncMock(side_effect=[ConnectionError("down"), {"ok": True}])
+
+        assert await strategy.execute_with_retry(func) == {"ok": True}
+
+        func = AsyncMock(side_effect=AuthenticationError("denied"))
+        with pytest.raises(AuthenticationError):
+            await strategy.execute_with_retry(func)
+        assert func.await_count == 1
+
+        func = AsyncMock(side_effect=[AuthenticationError("denied"), {"ok": True}])
+        result = await strategy.execute_with_retry(func, retry_on=[AuthenticationError])
+        assert result == {"ok": True}
+
+
+class TestBaseIntegrationClient:
+    """Test BaseIntegrationClient request handling."""
+
+    @pytest.fixture
+    def response(self):
+        """Create a successful JSON response."""
+        response = MagicMock()
+        response.status = 200
+        response.content_type = "application/json"
+        response.json = AsyncMock(return_value={"ok": True})
+        return response
+
+    @pytest.fixture
+    def client(self, response):
+        """Create a client whose session returns response."""
+        client = _Client("https://example.com/")
+        session = MagicMock()
+        session.closed = False
+        session.request.return_value.__aenter__ = AsyncMock(return_value=response)
+        session.request.return_value.__aexit__ = AsyncMock(return_value=False)
+        client._session = session
+        return client
+
+    @pytest.mark.asyncio
+    async def test_default_headers_left_to_session(self, client):
+        """Test that requests only send the caller's own headers."""
+        assert await client.get("/issues") == {"ok": True}
+        await client.post("/issues", {}, headers={"X-Trace": "1"})
+
+        first, second = client._session.request.call_args_list
+        assert first.kwargs["url"] == "https://example.com/issues"
+        assert first.kwargs["headers"] is None
+        assert second.kwargs["headers"] == {"X-Trace": "1"}
+
+    @pytest.mark.asyncio
+    async def test_open_session_reused_without_lock(self, client):
+        """Test that an open session is handed out without taking the lock."""
+        session = client._session
+        client._session_lock = MagicMock()
+
+        assert await client._get_session() is session
+
+        client._session_lock.__aenter__.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_new_session(self):
+        """Test that callers racing for a missing session get the same one."""
+        client = _Client("https://example.com")
+
+        first, second = await asyncio.gather(
+            client._get_session(), client._get_session()
+        )
+
+        assert first is second is client._session
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_metrics_track_requests(self, client, response):
+        """Test that request outcomes are counted and reported on demand."""
+        await client.get("/issues")
+        response.status = 404
+        response.text = AsyncMock(return_value="missing")
+        with pytest.raises(IntegrationError):
+            await client.get("/missing")
+
+        metrics = client.get_metrics()
+
+        assert metrics["total_requests"] == 2
+        assert metrics["successful_requests"] == 1
+        assert metrics["failed_requests"] == 1
+        assert metrics["average_latency"] == metrics["total_latency"]
+        assert isinstance(metrics["last_request_time"], datetime)
+
+    def test_sync_exit_closes_without_running_loop(self, client):
+        """Test that leaving a sync with block outside a loop closes the session."""
+        session = client._session
+        session.close = AsyncMock()
+
+        with client:
+            pass
+
+        session.close.assert_awaited_once_with()
+
+    @pytest.mark.asyncio
+    async def test_sync_exit_schedules_close_in_running_loop(self, client):
+        """Test that leaving a sync with block inside a loop schedules close."""
+        session = client._session
+        session.close = AsyncMock()
+
+        with client:
+            pass
+        await client._close_task
+
+        session.close.assert_awaited_once_with()
+
+    @pytest.mark.asyncio
+    async def test_json_suffix_content_type_parsed_as_json(self, client, response):
+        """Test that vendor JSON types are parsed rather than wrapped as text."""
+        response.content_type = "application/vnd.api+json"
+
+        assert await client.get("/issues") == {"ok": True}
+        response.json.assert_awaited_once_with(content_type=None)
+
+    @pytest.mark.asyncio
+    async def test_other_content_types_returned_as_text(self, client, response):
+        """Test that non-JSON bodies are wrapped in a content dict."""
+        response.content_type = "text/plain"
+        response.text = AsyncMock(return_value="hello")
+
+        assert await client.get("/readme") == {"content": "hello"}
+
+    @pytest.mark.asyncio
+    async def test_auth_failure_raised_without_reading_body(self, client, response):
+        """Test that an authentication failure is reported from its status."""
+        response.status = 401
+        response.text = AsyncMock()
+
+        with pytest.raises(AuthenticationError, match="401"):
+            await client.get("/issues")
+
+        response.text.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_request_debug_log_skipped_when_disabled(self, client):
+        """Test that the request log entry is only built at DEBUG level."""
+        client.logger = MagicMock()
+        client.logger.isEnabledFor.return_value = False
+
+        await client.get("/issues")
+
+        client.logger.debug.assert_not_called()
+
+        client.logger.isEnabledFor.return_value = True
+        await client.get("/issues", params={"q": "x"})
+
+        client.logger.debug.assert_called_once_with(
+            "Making GET request to /issues",
+            extra={"params": {"q": "x"}, "has_body": False},
+        )